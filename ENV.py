@@ -8,16 +8,7 @@ import pandas as pd
 import os
 from datetime import datetime, timedelta
 
-import mysql.connector
-
-# ✅ Database Connection Setup
-def connect_to_db():
-    return mysql.connector.connect(
-        host="localhost",   # Change this if MySQL is hosted elsewhere
-        user="root",        # Your MySQL username (default is 'root')
-        password="root",  # Change this to your MySQL password
-        database="elevator_system"  # Database name
-    )
+from passenger_db import connect_to_db, PassengerFeed
 
 
 
@@ -39,6 +30,7 @@ class ElevatorEnv(gym.Env):
         # Store CSV file path but DO NOT load it fully at start
         # self.csv_file = csv_file
         self.current_index = 0  # Start processing passengers from the first row
+        self.passenger_feed = PassengerFeed()  # ✅ Persistent connection, fetches only new rows
         
 
         # State: Elevator positions, waiting passengers, and elevator loads
@@ -270,17 +262,9 @@ class ElevatorEnv(gym.Env):
     #         print(f"❌ Error Reading CSV: {e}")
     
     def update_passengers_from_db(self):
-        """Fetch passenger data from MySQL and update the environment."""
+        """Fetch newly inserted passenger rows from MySQL and update the environment."""
         try:
-            conn = connect_to_db()
-            cursor = conn.cursor(dictionary=True)
-
-            # ✅ Query: Fetch passengers whose request time is less than or equal to the current simulation time
-            cursor.execute("SELECT * FROM passengers WHERE STR_TO_DATE(time, '%I:%i:%S %p') <= %s", 
-                        (self.current_time.strftime('%I:%M:%S %p'),))
-            new_passengers = cursor.fetchall()
-
-            conn.close()  # ✅ Close the connection
+            new_passengers = self.passenger_feed.fetch_new(self.current_time)
 
             for row in new_passengers:
                 passenger_id = row['passenger_id']
@@ -288,9 +272,8 @@ class ElevatorEnv(gym.Env):
                 direction = 'up' if row['direction'].strip().lower() == 'up' else 'down'
                 destination = int(row['destination_floor'])
 
-                if (passenger_id, destination) not in self.state['passengers_waiting'][floor][direction]:
-                    self.state['passengers_waiting'][floor][direction].append((passenger_id, destination))
-                    print(f"🟢 Passenger {passenger_id} requested elevator at {self.current_time}")
+                self.state['passengers_waiting'][floor][direction].append((passenger_id, destination))
+                print(f"🟢 Passenger {passenger_id} requested elevator at {self.current_time}")
 
         except Exception as e:
             print(f"❌ Error Fetching Data from MySQL: {e}")
@@ -490,5 +473,6 @@ class ElevatorEnv(gym.Env):
         self.clock.tick(30)  # Limit FPS to 30
 
     def close(self):
+        self.passenger_feed.close()
         pygame.quit()
 
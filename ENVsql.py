@@ -20,16 +20,7 @@ from OpenGL.GLUT import glutInit
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 
-import mysql.connector
-
-# ✅ Database Connection Setup
-def connect_to_db():
-    return mysql.connector.connect(
-        host="localhost",   # Change this if MySQL is hosted elsewhere
-        user="root",        # Your MySQL username (default is 'root')
-        password="root",  # Change this to your MySQL password
-        database="elevator_system"  # Database name
-    )
+from passenger_db import connect_to_db, PassengerFeed
 
 
 glutInit()
@@ -74,7 +65,7 @@ MODE_COLOR_MAP = {
 
 
 class ElevatorEnv(gym.Env):
-    def __init__(self, num_floors=6, num_elevators=3):
+    def __init__(self, num_floors=6, num_elevators=3, arrival_queue=None):
         super(ElevatorEnv, self).__init__()
         self.num_floors = num_floors
         self.num_elevators = num_elevators
@@ -109,6 +100,8 @@ class ElevatorEnv(gym.Env):
         self.passenger_wait_times = {}
         self.wait_times = []
         self.processed_passengers = set()  # ✅ Track who is already added
+        # ✅ Arrivals come straight from YOLO through the queue if given, otherwise from the passengers table
+        self.passenger_feed = arrival_queue if arrival_queue is not None else PassengerFeed()
 
 
         # ✅ Start simulation from 8 AM (or you can make it dynamic)
@@ -970,16 +963,9 @@ class ElevatorEnv(gym.Env):
 
 
     def update_passengers(self):
-        """Fetch passenger data from MySQL and update the environment (avoids duplication)."""
+        """Fetch new passengers (arrival queue or passengers table) and update the environment."""
         try:
-            conn = connect_to_db()
-            cursor = conn.cursor(dictionary=True)
-
-            # ✅ Fetch passengers with time <= current simulation time
-            cursor.execute("SELECT * FROM passengers WHERE STR_TO_DATE(time, '%I:%i:%S %p') <= %s", 
-                        (self.current_time.strftime('%I:%M:%S %p'),))
-            new_passengers = cursor.fetchall()
-            conn.close()
+            new_passengers = self.passenger_feed.fetch_new(self.current_time)
 
             for row in new_passengers:
                 passenger_id = row['passenger_id']
@@ -1003,7 +989,7 @@ class ElevatorEnv(gym.Env):
                 print(f"🟢 Passenger {passenger_id} requested elevator at {self.current_time}")
 
         except Exception as e:
-            print(f"❌ Error Fetching Data from MySQL: {e}")
+            print(f"❌ Error Fetching Passenger Data: {e}")
 
 
 
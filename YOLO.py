@@ -1,71 +1,44 @@
-
-import cv2
-import torch
-import numpy as np
-import pandas as pd
-from ultralytics import YOLO
 from datetime import datetime, timedelta
 import random
 import time
 import os
 import threading
 
-import mysql.connector
-
-# ✅ Database Connection Setup
-def connect_to_db():
-    return mysql.connector.connect(
-        host="localhost",   # Change this if MySQL is hosted elsewhere
-        user="root",        # Your MySQL username (default is 'root')
-        password="root",  # Change this to your MySQL password
-        database="elevator_system"  # Database name
-    )
-    
+from camera_workers import CameraWorkerPool
+from floor_roi import load_floor_rois
+from frame_sampler import FrameSampler
+from motion_gate import MotionGate
+from onnx_detector import DEFAULT_IMGSZ
+from person_tracker import PersonTracker
+from passenger_db import get_backend, passenger_row, PassengerWriter
+
 def clear_passenger_table():
     """Delete all records from the passengers table before inserting new data."""
     try:
-        conn = connect_to_db()
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM passengers")  # Deletes all rows from the table
-        conn.commit()
-        conn.close()
+        backend = get_backend()
+        backend.migrate()
+        backend.clear()  # Deletes all rows from the table
 
         print("🗑️ All previous passenger data deleted successfully.")
 
     except Exception as e:
-        print(f"❌ Error deleting data from MySQL: {e}")
+        print(f"❌ Error deleting passenger data: {e}")
 
 
 def insert_data_into_db(passenger_data):
-    conn = connect_to_db()
-    cursor = conn.cursor()
-
-    sql = '''
-        INSERT INTO passengers (passenger_id, time, floor, direction, destination_floor) 
-        VALUES (%s, %s, %s, %s, %s)
-    '''
-    values = (
-        passenger_data["Passenger ID"], 
-        passenger_data["Time"], 
-        passenger_data["Floor"], 
-        passenger_data["Direction (Up/Down)"], 
-        passenger_data["Destination Floor"]
-    )
-    
-    cursor.execute(sql, values)
-    conn.commit()
-    conn.close()
+    """Insert a single passenger (the YOLO loop itself batches through PassengerWriter)."""
+    get_backend().insert_many([passenger_row(passenger_data)])
 
 
 
 
-# ✅ Load YOLOv8 Model
-device = "cuda" if torch.cuda.is_available() else "cpu"
-model = YOLO("yolov8n.pt").to(device)
+# ✅ Person detector: PyTorch YOLOv8 (default) or the exported ONNX model on CPU
+DETECTOR_BACKEND = os.environ.get("YOLO_DETECTOR", "torch")  # "torch" or "onnx"
+ONNX_MODEL_PATH = os.environ.get("YOLO_ONNX_PATH", "yolov8n.onnx")
+ONNX_IMGSZ = int(os.environ.get("YOLO_ONNX_IMGSZ", DEFAULT_IMGSZ))
 
 # ✅ Video Paths for Each Floor
-video_paths = {
+VIDEO_PATHS = {
     1: "C:/Users/Binuda Dewhan/Desktop/SCAN +/New folder/2 floor.mp4",
     2: "C:/Users/Binuda Dewhan/Desktop/SCAN +/New folder/3 floor.mp4",
     3: "C:/Users/Binuda Dewhan/Desktop/SCAN +/New folder/4 floor.mp4",
@@ -75,113 +48,354 @@ video_paths = {
 }
 
 # ✅ CSV File for Passenger Data
-csv_file = os.path.abspath("C:/Users/Binuda Dewhan/Desktop/SCAN +/passenger_data.csv")
-passenger_id = 1  # Unique passenger ID counter
-sync_lock = threading.Lock()  # Lock for synchronization
-
-# ✅ Step 1: Check if CSV file exists → DELETE it if it does
-if os.path.exists(csv_file):
-    os.remove(csv_file)  # ✅ Delete old CSV file
-
-# ✅ Step 2: Create a fresh new CSV with headers
-df = pd.DataFrame(columns=["Passenger ID", "Time", "Floor", "Direction (Up/Down)", "Destination Floor"])
-df.to_csv(csv_file, index=False)  # ✅ Save new CSV file with column headers
-
-print(f"📁 New CSV file created: {csv_file}")
+CSV_FILE = os.path.abspath("C:/Users/Binuda Dewhan/Desktop/SCAN +/passenger_data.csv")
 
 # ✅ Start Time from 08:00:00 AM
-simulated_time = datetime.strptime("08:00:00 AM", "%I:%M:%S %p")
-start_real_time = time.time()  # Track real-world time
-video_time_sec = 0  # Start video at 0:00
-interval = 10 # ✅ Change interval from 30s to 20s
-
-# ✅ Function to Process Video for Each Floor
-def process_video(video_path, floor_number):
-    global passenger_id, simulated_time, video_time_sec
-    cap = cv2.VideoCapture(video_path)
-
-    if not cap.isOpened():
-        print(f"❌ ERROR: Cannot open video file {video_path}")
-        return
-
-    print(f"🚀 Processing Video for Floor {floor_number}...")
-
-    while cap.isOpened():
-        with sync_lock:  # Ensure time updates correctly across threads
-            real_elapsed_time = int(time.time() - start_real_time)
-            video_time_sec = (real_elapsed_time // interval) * interval  # ✅ Align with 20s intervals
-            cap.set(cv2.CAP_PROP_POS_MSEC, video_time_sec * 1000)  # Move video to correct time
-
-            # ✅ Sync Simulated Time with Video Time
-            simulated_time = datetime.strptime("08:00:00 AM", "%I:%M:%S %p") + timedelta(seconds=video_time_sec)
-
-        ret, frame = cap.read()
-        if not ret:
-            print(f"❌ ERROR: Could not read frame from {video_path} (End of Video)")
-            break  # Stop if video ends
-
-        # ✅ Run YOLOv8 Object Detection
-        results = model(frame)
-
-        # ✅ Count Passengers
-        person_count = sum(1 for r in results for i in range(len(r.boxes.cls))
-                           if r.names[int(r.boxes.cls[i].item())] == "person")
+START_TIME = "08:00:00 AM"
+INTERVAL = 10 # ✅ Change interval from 30s to 20s
+
+# ✅ Per-floor lobby ROI polygons: only the lobby is cropped, resized and sent to the detector
+ROI_CONFIG = os.environ.get("YOLO_ROI_CONFIG", "roi_config.json")
+ROI_IMGSZ = int(os.environ.get("YOLO_ROI_IMGSZ", ONNX_IMGSZ if DETECTOR_BACKEND == "onnx" else 320))
+FULL_FRAME_IMGSZ = 640  # PyTorch input size for floors without an ROI
+
+# ✅ Motion gate: skip detection on frames that did not change since the last detected one
+MOTION_GATE = os.environ.get("YOLO_MOTION_GATE", "1") != "0"
+
+# ✅ Person tracking: only people seen for the first time become new passengers
+PERSON_TRACKING = os.environ.get("YOLO_TRACKING", "1") != "0"
+
+
+class YoloPipeline:
+    """Detection pipeline state, created explicitly instead of at import time.
+
+    Importing this module loads nothing: the detector (and torch/ultralytics with it) is
+    loaded on first use of `model`, ROI polygons on first use of `floor_rois`, and the
+    CSV reset and shared clock happen when `run()` starts. Processes that only import
+    `run_yolo` (the eleTest.py parent, the simulator) never pay for the model.
+    """
+
+    def __init__(self, video_paths=None, csv_file=CSV_FILE, interval=INTERVAL, sample_intervals=None,
+                 detector_backend=DETECTOR_BACKEND):
+        self.video_paths = dict(VIDEO_PATHS if video_paths is None else video_paths)
+        self.csv_file = csv_file
+        self.interval = interval
+        self.sample_intervals = dict(sample_intervals or {})  # Optional per-floor sample interval in seconds
+        self.detector_backend = detector_backend
+
+        self._model = None
+        self._floor_rois = None
+        self.person_class_id = None
+
+        self.passenger_id = 1  # Unique passenger ID counter
+        self.sync_lock = threading.Lock()  # Lock for synchronization
+        self.start_real_time = None  # Set by start_clock()
+        self.simulated_time = datetime.strptime(START_TIME, "%I:%M:%S %p")
+        self.video_time_sec = 0  # Start video at 0:00
+
+        # ✅ Batched inference state: each floor camera publishes its latest frame here
+        self.latest_frames = {}  # floor_number -> (video_time_sec, frame)
+        self.active_floors = set()  # Floors whose camera is still producing frames
+        self.frames_ready = threading.Condition()
+        self.decode_stats = {}  # floor_number -> decode stats (FrameSampler.stats() or CameraWorkerPool.health())
+        self.motion_gates = {}  # floor_number -> MotionGate
+        self.person_trackers = {}  # floor_number -> PersonTracker
+
+    # ✅ Lazily created resources
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = self.load_model()
+        return self._model
+
+    def load_model(self):
+        """Load the configured person detector (heavy imports happen here, not at module import)."""
+        if self.detector_backend == "onnx":
+            from onnx_detector import OnnxPersonDetector, export_person_detector
+            if not os.path.exists(ONNX_MODEL_PATH):
+                export_person_detector("yolov8n.pt", ONNX_IMGSZ, ONNX_MODEL_PATH)
+            model = OnnxPersonDetector(ONNX_MODEL_PATH, imgsz=ONNX_IMGSZ)
+            self.person_class_id = model.person_class_id
+        else:
+            import torch
+            from ultralytics import YOLO
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            model = YOLO("yolov8n.pt").to(device)
+            self.person_class_id = next(k for k, v in model.names.items() if v == "person")
+        print(f"🧠 Person detector loaded ({self.detector_backend})")
+        return model
+
+    @property
+    def floor_rois(self):
+        if self._floor_rois is None:
+            self._floor_rois = load_floor_rois(ROI_CONFIG, ROI_IMGSZ)  # floor_number -> FloorROI
+        return self._floor_rois
+
+    def detect_imgsz(self, floor_number):
+        """PyTorch input size for a floor: small for a lobby crop, full size otherwise (ONNX is fixed at export)."""
+        return ROI_IMGSZ if floor_number in self.floor_rois else FULL_FRAME_IMGSZ
+
+    def reset_csv(self):
+        """Delete the old passenger CSV and create a fresh one with headers."""
+        import pandas as pd
+        try:
+            # ✅ Step 1: Check if CSV file exists → DELETE it if it does
+            if os.path.exists(self.csv_file):
+                os.remove(self.csv_file)  # ✅ Delete old CSV file
+
+            # ✅ Step 2: Create a fresh new CSV with headers
+            df = pd.DataFrame(columns=["Passenger ID", "Time", "Floor", "Direction (Up/Down)", "Destination Floor"])
+            df.to_csv(self.csv_file, index=False)  # ✅ Save new CSV file with column headers
+            print(f"📁 New CSV file created: {self.csv_file}")
+        except OSError as e:
+            print(f"❌ Error creating CSV file {self.csv_file}: {e}")
+
+    def start_clock(self):
+        self.start_real_time = time.time()  # Track real-world time
+        self.simulated_time = datetime.strptime(START_TIME, "%I:%M:%S %p")
+        self.video_time_sec = 0
+
+    # ✅ Function to Decode Video for Each Floor (inference happens centrally in run_batched_inference)
+    def process_video(self, video_path, floor_number):
+        sample_interval = self.sample_intervals.get(floor_number, self.interval)
+        sampler = FrameSampler(video_path, sample_interval)
+
+        if not sampler.isOpened():
+            print(f"❌ ERROR: Cannot open video file {video_path}")
+            with self.frames_ready:
+                self.active_floors.discard(floor_number)
+                self.frames_ready.notify_all()
+            return
+
+        print(f"🚀 Processing Video for Floor {floor_number}...")
+
+        while True:
+            with self.sync_lock:  # Ensure time updates correctly across threads
+                real_elapsed_time = time.time() - self.start_real_time
+                frame_time_sec = (real_elapsed_time // sample_interval) * sample_interval  # ✅ Align with the sample clock
+                self.video_time_sec = int(frame_time_sec)
+
+                # ✅ Sync Simulated Time with Video Time
+                self.simulated_time = datetime.strptime(START_TIME, "%I:%M:%S %p") + timedelta(seconds=frame_time_sec)
+
+            # ✅ Decode forward to the sample point (grab() skips frames without a keyframe seek)
+            frame = sampler.read_at(frame_time_sec)
+            if frame is None:
+                print(f"❌ ERROR: Could not read frame from {video_path} (End of Video)")
+                break  # Stop if video ends
+
+            # ✅ Hand the frame to the central inference stage (older unprocessed frames are replaced)
+            with self.frames_ready:
+                self.latest_frames[floor_number] = (frame_time_sec, frame)
+                self.frames_ready.notify_all()
+            self.decode_stats[floor_number] = sampler.stats()
+
+            # ✅ Sleep until the next sample point on the shared clock
+            next_sample = self.start_real_time + frame_time_sec + sample_interval
+            time.sleep(max(0.0, next_sample - time.time()))
+
+        sampler.release()
+        with self.frames_ready:
+            self.active_floors.discard(floor_number)
+            self.frames_ready.notify_all()
+        stats = sampler.stats()
+        print(f"✅ Finished Processing for Floor {floor_number} | 🎞️ decode {stats['decode_fps']:.1f} fps, "
+              f"{stats['frames_read']} samples, {stats['seeks']} seeks")
+
+    def person_boxes(self, result):
+        """Person detections of one result as an (N, 5) [x1, y1, x2, y2, score] array (tensor ops, no per-box loop)."""
+        import torch
+        keep = result.boxes.cls == self.person_class_id
+        return torch.cat([result.boxes.xyxy[keep], result.boxes.conf[keep, None]], dim=1).cpu().numpy()
+
+    def detect_people(self, frames, floors=None):
+        """Person boxes per frame from whichever detector backend is loaded.
+
+        With PyTorch, ROI crops and full frames are batched separately so each runs at its
+        own input size; `floors` (one per frame) says which is which.
+        """
+        model = self.model
+        if self.detector_backend == "onnx":
+            return model(frames)
+
+        by_size = {}
+        for index, floor_number in enumerate(floors or [None] * len(frames)):
+            by_size.setdefault(self.detect_imgsz(floor_number), []).append(index)
+
+        boxes = [None] * len(frames)
+        for imgsz, indices in by_size.items():
+            results = model([frames[i] for i in indices], classes=[self.person_class_id], imgsz=imgsz, verbose=False)
+            for i, r in zip(indices, results):
+                boxes[i] = self.person_boxes(r)
+        return boxes
+
+    def prepare_frame(self, floor_number, frame):
+        """Detector input for a floor: its ROI crop when one is configured, else the full frame."""
+        roi = self.floor_rois.get(floor_number)
+        return (frame, None) if roi is None else roi.crop(frame)
+
+    def restore_boxes(self, floor_number, boxes, transform):
+        """Map boxes back to frame coordinates and drop detections outside the floor's ROI."""
+        roi = self.floor_rois.get(floor_number)
+        return boxes if roi is None else roi.filter_boxes(boxes, transform)
+
+    def generate_passengers(self, floor_number, person_count, frame_time_sec):
+        """Turn a person count into passenger records with random destinations."""
+        request_time = datetime.strptime(START_TIME, "%I:%M:%S %p") + timedelta(seconds=frame_time_sec)
 
         new_passengers = []
-        if person_count > 0:
-            for _ in range(person_count):
-                destination_floor = random.choice([i for i in range(1, 7) if i != floor_number])
-                direction = "Up" if destination_floor > floor_number else "Down"
-
-                passenger_data = {
-                    "Passenger ID": passenger_id,
-                    "Time": simulated_time.strftime("%I:%M:%S %p"),
-                    "Floor": floor_number,
-                    "Direction (Up/Down)": direction,
-                    "Destination Floor": destination_floor
-                }
-                new_passengers.append(passenger_data)
-                passenger_id += 1  # Increment Passenger ID
-
-        # ✅ Store Data in CSV with Lock
-        # ✅ Store Data in CSV with Lock
-        # with sync_lock:
-        #     if new_passengers:
-        #         df = pd.DataFrame(new_passengers)
-        #         with open(csv_file, mode='a', newline='') as f:
-        #             df.to_csv(f, index=False, header=False)
-        #             f.flush()  # ✅ Ensure data is written
-        #             os.fsync(f.fileno())  # ✅ Force write to disk
-        
-        with sync_lock:
-            if new_passengers:
+        for _ in range(person_count):
+            destination_floor = random.choice([i for i in range(1, 7) if i != floor_number])
+            direction = "Up" if destination_floor > floor_number else "Down"
+
+            new_passengers.append({
+                "Passenger ID": self.passenger_id,
+                "Time": request_time.strftime("%I:%M:%S %p"),
+                "Floor": floor_number,
+                "Direction (Up/Down)": direction,
+                "Destination Floor": destination_floor
+            })
+            self.passenger_id += 1  # Increment Passenger ID
+        return new_passengers
+
+    def collect_thread_frames(self, timeout):
+        """Latest frames from the decode threads: sorted [(floor, (frame_time_sec, frame))], [] if none yet, None when all finished."""
+        with self.frames_ready:
+            # Wait until every live camera has a frame ready (or the timeout passes)
+            self.frames_ready.wait_for(lambda: len(self.latest_frames) >= len(self.active_floors), timeout=timeout)
+            if not self.latest_frames:
+                return None if not self.active_floors else []
+            batch = sorted(self.latest_frames.items())
+            self.latest_frames.clear()
+        return batch
+
+    # ✅ Central Inference Stage: one batched forward pass over the latest frame of every floor
+    def run_batched_inference(self, passenger_writer=None, arrival_queue=None, camera_pool=None):
+        collect = camera_pool.collect if camera_pool is not None else self.collect_thread_frames
+        timeout = min([self.interval, *self.sample_intervals.values()])
+
+        while True:
+            batch = collect(timeout)
+            if batch is None:
+                break  # All videos finished
+            if not batch:
+                continue
+
+            if camera_pool is not None:
+                self.decode_stats.update(camera_pool.health())
+                for floor, health in self.decode_stats.items():
+                    if health['status'] == "running" and (health['frame_age'] or 0) > 3 * timeout:
+                        print(f"⚠️ Floor {floor} camera stalled: last frame {health['frame_age']:.1f}s ago")
+
+            # ✅ Crop each floor to its lobby ROI (motion outside the lobby no longer wakes the detector)
+            prepared = [self.prepare_frame(floor, frame) for floor, (_, frame) in batch]
+
+            # ✅ Only frames that changed go to the detector; unchanged floors reuse their last count
+            gates = [self.motion_gates.setdefault(floor, MotionGate()) for floor, _ in batch]
+            changed = [not MOTION_GATE or gate.should_detect(inputs) for gate, (inputs, _) in zip(gates, prepared)]
+            frames = [inputs for (inputs, _), run in zip(prepared, changed) if run]
+            frame_floors = [floor for (floor, _), run in zip(batch, changed) if run]
+
+            # ✅ Run person detection on all changed floors at once (person class only)
+            detect_start = time.perf_counter()
+            detected_boxes = iter(self.detect_people(frames, frame_floors) if frames else [])
+            detect_seconds = (time.perf_counter() - detect_start) / max(len(frames), 1)
+
+            person_counts, new_counts = [], []
+            for (floor_number, _), (_, transform), gate, run in zip(batch, prepared, gates, changed):
+                new_count = 0
+                if run:
+                    boxes = self.restore_boxes(floor_number, next(detected_boxes), transform)
+                    gate.record_detection(len(boxes), detect_seconds)
+                    if PERSON_TRACKING:
+                        new_count = len(self.person_trackers.setdefault(floor_number, PersonTracker()).update(boxes))
+                    else:
+                        new_count = len(boxes)
+                elif not PERSON_TRACKING:
+                    new_count = gate.last_count  # Old behaviour: every sample's count becomes passengers
+                person_counts.append(gate.last_count)
+                new_counts.append(new_count)
+
+            batch_passengers = []
+            for (floor_number, (frame_time_sec, _)), person_count, new_count, run in zip(batch, person_counts, new_counts, changed):
+                with self.sync_lock:
+                    new_passengers = self.generate_passengers(floor_number, new_count, frame_time_sec)
+                batch_passengers.extend(new_passengers)
+
+                # ✅ Print Debugging Information (Formatted Output)
+                video_sec = int(frame_time_sec)
+                decode_fps = self.decode_stats.get(floor_number, {}).get('decode_fps', 0.0)
+                gate_note = "" if run else " (⏭️ no motion, reused)"
+                print(f"\n🕒 Floor {floor_number} | 🎥 Video Time: {video_sec//60}:{video_sec%60:02d} | 👥 {person_count} people ({new_count} new){gate_note} | 🎞️ {decode_fps:.0f} fps decode")
                 for passenger in new_passengers:
-                    insert_data_into_db(passenger)
-
-
-        # ✅ Print Debugging Information (Formatted Output)
-        print(f"\n🕒 {simulated_time.strftime('%I:%M:%S %p')} | 🎥 Video Time: {video_time_sec//60}:{video_time_sec%60:02d}")
-        for passenger in new_passengers:
-            print(f"  🚶 Passenger {passenger['Passenger ID']} | Floor {passenger['Floor']} → Destination {passenger['Destination Floor']} | Direction: {passenger['Direction (Up/Down)']}")
-
-        time.sleep(interval)  # ✅ Now waits 20 seconds instead of 30
-
-    cap.release()
-    print(f"✅ Finished Processing for Floor {floor_number}")
-
-# ✅ Run YOLO for All Floors in Parallel
-def run_yolo():
-    
-    # ✅ Step 1: Clear old passenger data before inserting new records
-    clear_passenger_table()
-    
-    threads = []
-    for floor, path in video_paths.items():
-        t = threading.Thread(target=process_video, args=(path, floor))
-        threads.append(t)
-        t.start()
-    for t in threads:
-        t.join()
+                    print(f"  🚶 Passenger {passenger['Passenger ID']} | Floor {passenger['Floor']} → Destination {passenger['Destination Floor']} | Direction: {passenger['Direction (Up/Down)']}")
+
+            # ✅ Straight to the simulator first, then the optional database tap
+            if arrival_queue is not None:
+                arrival_queue.publish(batch_passengers)
+            if passenger_writer is not None:
+                passenger_writer.add(batch_passengers)
+                passenger_writer.flush()  # One executemany + commit for the whole batch of frames
+
+    # ✅ Run YOLO for All Floors in Parallel
+    def run(self, arrival_queue=None, persist=True, decode_processes=True):
+        """Run detection for all floors (see run_yolo)."""
+        self.reset_csv()
+
+        # ✅ Step 1: Clear old passenger data before inserting new records
+        if persist:
+            clear_passenger_table()
+
+        self.start_clock()
+        threads = []
+        camera_pool = None
+        if decode_processes:
+            # Workers fork before the detector is loaded, so they never carry a copy of the model
+            camera_pool = CameraWorkerPool(self.video_paths, self.interval, self.start_real_time, self.sample_intervals).start()
+        else:
+            with self.frames_ready:
+                self.active_floors.update(self.video_paths.keys())
+            for floor, path in self.video_paths.items():
+                t = threading.Thread(target=self.process_video, args=(path, floor))
+                threads.append(t)
+                t.start()
+
+        # ✅ Step 2: Batched inference runs in this thread until all cameras finish
+        passenger_writer = PassengerWriter() if persist else None
+        try:
+            self.run_batched_inference(passenger_writer, arrival_queue, camera_pool)
+        finally:
+            if passenger_writer is not None:
+                passenger_writer.close()
+            if arrival_queue is not None:
+                arrival_queue.flush()  # Bounded (FLUSH_TIMEOUT): a stalled simulator cannot hang shutdown
+            if camera_pool is not None:
+                camera_pool.stop()
+
+        for t in threads:
+            t.join()
+        self.print_summary()
+
+    def print_summary(self):
+        # ✅ Motion gate summary: how much inference the quiet floors saved
+        for floor, gate in sorted(self.motion_gates.items()):
+            stats = gate.stats()
+            print(f"⏭️ Floor {floor}: skipped {stats['skips']}/{stats['checks']} frames ({stats['skip_rate']:.0%}) | "
+                  f"gate {stats['gate_ms']:.2f} ms | detect {stats['detect_ms']:.1f} ms/frame")
+        for floor, tracker in sorted(self.person_trackers.items()):
+            stats = tracker.stats()
+            print(f"🧍 Floor {floor}: {stats['created']} people tracked, {stats['retired']} left, {stats['active']} still waiting")
+
+
+def run_yolo(arrival_queue=None, persist=True, decode_processes=True):
+    """Run detection for all floors.
+
+    With `arrival_queue` set, passengers go straight to the simulator through it;
+    `persist` keeps writing them to the passengers table as well. `decode_processes`
+    decodes each camera in its own process (shared-memory frames) instead of a thread.
+    The pipeline (and the model) is created here, in the process that runs it.
+    """
+    YoloPipeline().run(arrival_queue, persist, decode_processes)
 
 # ✅ Start YOLO in a Separate Thread
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+import multiprocessing
+import queue
+import time
+from collections import deque
+from datetime import datetime
+
+FLUSH_TIMEOUT = 5.0  # Seconds the producer waits at shutdown before giving up on a stalled simulator
+
+
+class ArrivalQueue:
+    """Bounded cross-process queue of passenger batches from the YOLO producer to the simulator.
+
+    The producer publishes one batch per inference pass. If the simulator falls behind and
+    the queue is full, batches are coalesced into a local backlog and retried with the next
+    publish; once the backlog passes `max_backlog` passengers the oldest are dropped and
+    `publish` returns False so the producer can see the backpressure. The consumer side
+    mirrors `passenger_db.PassengerFeed.fetch_new`, so the simulator can use either source.
+    """
+
+    def __init__(self, maxsize=32, max_backlog=2000, put_timeout=0.05):
+        self._queue = multiprocessing.Queue(maxsize)
+        self.max_backlog = max_backlog
+        self.put_timeout = put_timeout
+
+        # Producer-side state (lives in the producer process)
+        self._backlog = []
+        self.published = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+        # Consumer-side state (lives in the simulator process)
+        self._pending = deque()
+        self._ready = []  # Batches already taken off the queue by wait()
+        self.last_latency = 0.0
+
+    def publish(self, passengers):
+        """Enqueue passenger records (YOLO dict format). Returns False if passengers had to be dropped."""
+        batch = self._backlog + list(passengers)
+        if not batch:
+            return True
+
+        try:
+            self._queue.put((time.time(), batch), timeout=self.put_timeout)
+        except queue.Full:
+            # ✅ Simulator is behind: keep the batch locally and merge it into the next publish
+            self.coalesced += 1
+            overflow = len(batch) - self.max_backlog
+            if overflow > 0:
+                self.dropped += overflow
+                batch = batch[overflow:]
+                print(f"⚠️ Arrival queue full: dropped {overflow} oldest passengers")
+            self._backlog = batch
+            return overflow <= 0
+
+        self._backlog = []
+        self.published += len(batch)
+        return True
+
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """Queue the coalesced backlog at producer shutdown; returns False if it had to be dropped.
+
+        Bounded so a simulator that died or stopped draining cannot hang YOLO's shutdown.
+        """
+        if not self._backlog:
+            return True
+        try:
+            self._queue.put((time.time(), self._backlog), timeout=timeout)
+        except queue.Full:
+            self.dropped += len(self._backlog)
+            print(f"⚠️ Arrival queue still full after {timeout}s: dropped {len(self._backlog)} passengers at shutdown")
+            self._backlog = []
+            self._queue.cancel_join_thread()  # Don't block process exit on a pipe nobody reads
+            return False
+        self.published += len(self._backlog)
+        self._backlog = []
+        return True
+
+    def wait(self, timeout):
+        """Block up to `timeout` seconds for the next batch; True if one arrived (drain() returns it)."""
+        if self._ready:
+            return True
+        try:
+            self._ready.append(self._queue.get(timeout=max(timeout, 0.0)))
+        except queue.Empty:
+            return False
+        return True
+
+    def drain(self):
+        """Take every batch currently queued (non-blocking) and return the passengers in order."""
+        passengers = []
+        for published_at, batch in self._ready:
+            self.last_latency = time.time() - published_at
+            passengers.extend(batch)
+        self._ready = []
+        while True:
+            try:
+                published_at, batch = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self.last_latency = time.time() - published_at
+            passengers.extend(batch)
+        return passengers
+
+    def fetch_new(self, current_time):
+        """Same contract as PassengerFeed.fetch_new: rows due at `current_time`, future ones held back."""
+        for passenger in self.drain():
+            request_time = datetime.strptime(passenger["Time"], "%I:%M:%S %p")
+            self._pending.append({
+                'passenger_id': passenger["Passenger ID"],
+                'floor': passenger["Floor"],
+                'direction': passenger["Direction (Up/Down)"],
+                'destination_floor': passenger["Destination Floor"],
+                'request_seconds': request_time.hour * 3600 + request_time.minute * 60 + request_time.second,
+            })
+
+        now = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+        due, later = [], deque()
+        for row in self._pending:
+            (due if row['request_seconds'] <= now else later).append(row)
+        self._pending = later
+        return due
+
+    def close(self):
+        pass  # The underlying queue is owned by the parent process
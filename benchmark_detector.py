@@ -0,0 +1,100 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from frame_sampler import FrameSampler
+from onnx_detector import DEFAULT_IMGSZ, OnnxPersonDetector, export_person_detector
+
+
+def load_samples(video_path, sample_interval, max_samples=None):
+    """Decode the frames YOLO.py would sample from a recorded clip."""
+    sampler = FrameSampler(video_path, sample_interval)
+    if not sampler.isOpened():
+        print(f"❌ ERROR: Cannot open video file {video_path}")
+        return []
+    frames = []
+    for _, frame in sampler.samples():
+        frames.append(frame)
+        if max_samples and len(frames) >= max_samples:
+            break
+    sampler.release()
+    return frames
+
+
+def time_counts(count_fn, frames, warmup=2):
+    """Run `count_fn` frame by frame; returns (counts, frames per second)."""
+    for frame in frames[:warmup]:
+        count_fn([frame])
+    counts = []
+    start = time.perf_counter()
+    for frame in frames:
+        counts.extend(count_fn([frame]))
+    elapsed = time.perf_counter() - start
+    return np.array(counts), (len(frames) / elapsed if elapsed else 0.0)
+
+
+def agreement(reference, candidate):
+    """Count agreement of `candidate` against the PyTorch reference counts."""
+    diff = candidate - reference
+    return {
+        'exact': float(np.mean(diff == 0)) if len(diff) else 0.0,
+        'within_one': float(np.mean(np.abs(diff) <= 1)) if len(diff) else 0.0,
+        'mae': float(np.mean(np.abs(diff))) if len(diff) else 0.0,
+        'total_ref': int(reference.sum()),
+        'total': int(candidate.sum()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare PyTorch and ONNX person detectors on recorded clips.")
+    parser.add_argument("videos", nargs="+")
+    parser.add_argument("--weights", default="yolov8n.pt")
+    parser.add_argument("--onnx", default="yolov8n.onnx", help="Exported model (created from --weights if missing)")
+    parser.add_argument("--imgsz", type=int, default=DEFAULT_IMGSZ, help="ONNX input resolution")
+    parser.add_argument("--runtime", choices=["auto", "onnxruntime", "opencv"], default="auto")
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--interval", type=float, default=1, help="Sample every N seconds of video")
+    parser.add_argument("--max-samples", type=int, default=200)
+    args = parser.parse_args()
+
+    from ultralytics import YOLO
+
+    torch_model = YOLO(args.weights).to("cpu")
+    person_class_id = next(k for k, v in torch_model.names.items() if v == "person")
+
+    def torch_count(frames):
+        results = torch_model(frames, classes=[person_class_id], verbose=False)
+        return [int((r.boxes.cls == person_class_id).sum().item()) for r in results]
+
+    if not os.path.exists(args.onnx):
+        export_person_detector(args.weights, args.imgsz, args.onnx)
+    onnx_model = OnnxPersonDetector(args.onnx, imgsz=args.imgsz, runtime=args.runtime, threads=args.threads)
+
+    print(f"🚀 Detector benchmark (CPU): PyTorch {args.weights} @640 vs ONNX {args.onnx} @{args.imgsz} on {onnx_model.runtime}")
+    all_ref, all_onnx = [], []
+    for video_path in args.videos:
+        frames = load_samples(video_path, args.interval, args.max_samples)
+        if not frames:
+            continue
+
+        ref_counts, torch_fps = time_counts(torch_count, frames)
+        onnx_counts, onnx_fps = time_counts(onnx_model.count, frames)
+        all_ref.append(ref_counts)
+        all_onnx.append(onnx_counts)
+
+        match = agreement(ref_counts, onnx_counts)
+        print(f"🎥 {video_path} ({len(frames)} frames)")
+        print(f"  ⚡ PyTorch {torch_fps:6.1f} fps | ONNX {onnx_fps:6.1f} fps ({onnx_fps / torch_fps if torch_fps else 0:.1f}x)")
+        print(f"  👥 counts exact {match['exact']:.0%}, ±1 {match['within_one']:.0%}, MAE {match['mae']:.2f} "
+              f"| people {match['total']} vs {match['total_ref']}")
+
+    if len(all_ref) > 1:
+        match = agreement(np.concatenate(all_ref), np.concatenate(all_onnx))
+        print(f"📊 All clips: exact {match['exact']:.0%}, ±1 {match['within_one']:.0%}, MAE {match['mae']:.2f} "
+              f"| people {match['total']} vs {match['total_ref']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+import passenger_db
+from passenger_db import BACKENDS, PassengerFeed, PassengerWriter
+
+
+def synthetic_passengers(count, num_floors=6, start="08:00:00 AM", seed=0):
+    """YOLO-shaped passenger records spread one per second from `start`."""
+    rng = random.Random(seed)
+    start_time = datetime.strptime(start, "%I:%M:%S %p")
+    passengers = []
+    for i in range(count):
+        floor = rng.randint(1, num_floors)
+        destination = rng.choice([f for f in range(1, num_floors + 1) if f != floor])
+        passengers.append({
+            "Passenger ID": i + 1,
+            "Time": (start_time + timedelta(seconds=i)).strftime("%I:%M:%S %p"),
+            "Floor": floor,
+            "Direction (Up/Down)": "Up" if destination > floor else "Down",
+            "Destination Floor": destination
+        })
+    return passengers
+
+
+def run_benchmark(backend, count, batch_size, poll_every):
+    """Write `count` passengers in batches, polling the feed every `poll_every` batches."""
+    backend.migrate()
+    backend.clear()
+
+    passengers = synthetic_passengers(count)
+    writer = PassengerWriter(backend=backend, max_buffer=batch_size + 1)
+    feed = PassengerFeed(backend=backend)
+    end_of_day = datetime.strptime("11:59:59 PM", "%I:%M:%S %p")
+
+    read = 0
+    write_time = 0.0
+    read_time = 0.0
+    for n, start in enumerate(range(0, count, batch_size), 1):
+        t0 = time.perf_counter()
+        writer.add(passengers[start:start + batch_size])
+        writer.flush()
+        write_time += time.perf_counter() - t0
+
+        if n % poll_every == 0:
+            t0 = time.perf_counter()
+            read += len(feed.fetch_new(end_of_day))
+            read_time += time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    read += len(feed.fetch_new(end_of_day))
+    read_time += time.perf_counter() - t0
+    feed.close()
+
+    return {
+        'written': writer.rows_written,
+        'read': read,
+        'transactions': writer.flushes,
+        'write_rows_per_sec': writer.rows_written / write_time if write_time else 0.0,
+        'read_rows_per_sec': read / read_time if read_time else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Passenger table ingest-throughput benchmark.")
+    parser.add_argument("--backend", choices=list(BACKENDS), default=passenger_db.DB_BACKEND)
+    parser.add_argument("--path", default="bench_passengers.db", help="SQLite file (sqlite backend only)")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--poll-every", type=int, default=1, help="Poll the feed every N batches")
+    args = parser.parse_args()
+
+    if args.backend == "sqlite":
+        backend = BACKENDS["sqlite"](args.path)
+    else:
+        backend = BACKENDS["mysql"]()
+
+    print(f"🚀 Ingest benchmark: {args.count} passengers on {backend.name}")
+    for batch_size in args.batch_size:
+        result = run_benchmark(backend, args.count, batch_size, args.poll_every)
+        print(f"  📦 batch {batch_size:>5}: {result['write_rows_per_sec']:>10.0f} rows/s written "
+              f"({result['transactions']} transactions), {result['read_rows_per_sec']:>10.0f} rows/s read "
+              f"({result['read']}/{result['written']})")
+
+    if args.backend == "sqlite":
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(args.path + suffix):
+                os.remove(args.path + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from frame_sampler import FrameSampler
+from motion_gate import MotionGate
+from person_tracker import PersonTracker
+
+STAGES = ["decode", "prepare", "detect", "track", "sink"]
+
+
+def make_synthetic_clip(path, seconds=120, fps=10, size=(640, 360), people=4, seed=0):
+    """Write a stand-in lobby clip: static background with people-sized figures walking in and out."""
+    rng = np.random.RandomState(seed)
+    width, height = size
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+
+    background = np.tile(np.linspace(60, 140, width, dtype=np.uint8)[None, :, None], (height, 1, 3))
+    cv2.rectangle(background, (int(width * 0.4), int(height * 0.1)), (int(width * 0.6), int(height * 0.7)), (90, 90, 90), -1)
+    walkers = [{
+        'x': rng.uniform(0, width), 'y': rng.uniform(height * 0.5, height * 0.9),
+        'vx': rng.uniform(-4, 4), 'h': rng.uniform(height * 0.3, height * 0.5),
+        'color': tuple(int(c) for c in rng.randint(0, 255, 3)),
+    } for _ in range(people)]
+
+    for _ in range(int(seconds * fps)):
+        frame = background.copy()
+        for w in walkers:
+            w['x'] = (w['x'] + w['vx']) % width
+            x, y, h = int(w['x']), int(w['y']), int(w['h'])
+            cv2.ellipse(frame, (x, y - h // 2), (h // 6, h // 2 - h // 8), 0, 0, 360, w['color'], -1)
+            cv2.circle(frame, (x, y - h + h // 10), h // 8, (180, 160, 140), -1)
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def synthetic_clips(clip_dir, count, seconds=120):
+    """Create (or reuse) `count` distinct synthetic clips in `clip_dir`."""
+    os.makedirs(clip_dir, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = os.path.join(clip_dir, f"synthetic_floor_{i + 1}.mp4")
+        if not os.path.exists(path):
+            make_synthetic_clip(path, seconds=seconds, seed=i)
+        paths.append(path)
+    return paths
+
+
+def make_sink(kind, path="bench_pipeline.db"):
+    """(publish, close) pair for the passenger sink under test."""
+    if kind == "null":
+        return (lambda passengers: None), (lambda: None)
+    if kind == "queue":
+        from arrival_queue import ArrivalQueue
+        arrivals = ArrivalQueue()
+
+        def publish(passengers):
+            arrivals.publish(passengers)
+            arrivals.drain()  # Stand-in consumer so the bounded queue never backs up
+        return publish, (lambda: None)
+
+    from passenger_db import BACKENDS, PassengerWriter
+    backend = BACKENDS["sqlite"](path) if kind == "sqlite" else BACKENDS["mysql"]()
+    backend.migrate()
+    backend.clear()
+    writer = PassengerWriter(backend=backend)
+
+    def publish(passengers):
+        writer.add(passengers)
+        writer.flush()
+
+    def close():
+        writer.close()
+        if kind == "sqlite":
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+    return publish, close
+
+
+def run_pipeline(clips, cameras, sample_interval=1.0, max_rounds=None, sink="null", motion_gate=True):
+    """Free-running (no real-time sleeps) decode → detect → passengers → sink over `cameras` cameras."""
+    from YOLO import YoloPipeline
+    pipeline = YoloPipeline(video_paths={})  # Configured detector / ROIs (YOLO_DETECTOR, YOLO_ROI_CONFIG apply)
+    pipeline.model  # Load the detector up front so it is not timed as part of the first round
+
+    floors = list(range(1, cameras + 1))
+    samplers = {floor: FrameSampler(clips[(floor - 1) % len(clips)], sample_interval) for floor in floors}
+    gates = {floor: MotionGate() for floor in floors}
+    trackers = {floor: PersonTracker() for floor in floors}
+    publish, close_sink = make_sink(sink)
+
+    timings = {stage: [] for stage in STAGES}
+    end_to_end = []
+    frames = passengers = rounds = 0
+    decode_pool = ThreadPoolExecutor(max_workers=min(cameras, os.cpu_count() or 4))  # cv2 decode releases the GIL
+
+    start = time.perf_counter()
+    video_time_sec = 0.0
+    while max_rounds is None or rounds < max_rounds:
+        t0 = time.perf_counter()
+        decoded = list(decode_pool.map(lambda floor: samplers[floor].read_at(video_time_sec), floors))
+        if any(frame is None for frame in decoded):
+            break  # Shortest clip finished
+        t1 = time.perf_counter()
+
+        prepared = [pipeline.prepare_frame(floor, frame) for floor, frame in zip(floors, decoded)]
+        changed = [not motion_gate or gates[floor].should_detect(inputs) for floor, (inputs, _) in zip(floors, prepared)]
+        t2 = time.perf_counter()
+
+        inputs = [inputs for (inputs, _), run in zip(prepared, changed) if run]
+        input_floors = [floor for floor, run in zip(floors, changed) if run]
+        detected = iter(pipeline.detect_people(inputs, input_floors) if inputs else [])
+        t3 = time.perf_counter()
+
+        batch_passengers = []
+        for floor, (_, transform), run in zip(floors, prepared, changed):
+            if run:
+                boxes = pipeline.restore_boxes(floor, next(detected), transform)
+                new_people = trackers[floor].update(boxes)
+                batch_passengers.extend(pipeline.generate_passengers(floor, len(new_people), video_time_sec))
+        t4 = time.perf_counter()
+
+        publish(batch_passengers)
+        t5 = time.perf_counter()
+
+        for stage, seconds in zip(STAGES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4)):
+            timings[stage].append(seconds)
+        end_to_end.append(t5 - t2)  # Detection start → passengers enqueued in the sink
+        frames += cameras
+        passengers += len(batch_passengers)
+        rounds += 1
+        video_time_sec += sample_interval
+
+    elapsed = time.perf_counter() - start
+    decode_pool.shutdown()
+    close_sink()
+    for sampler in samplers.values():
+        sampler.release()
+
+    skipped = sum(gate.skips for gate in gates.values())
+    return {
+        'cameras': cameras,
+        'rounds': rounds,
+        'fps': frames / elapsed if elapsed else 0.0,
+        'stage_ms': {stage: 1000 * np.mean(values) if values else 0.0 for stage, values in timings.items()},
+        'e2e_ms': 1000 * np.mean(end_to_end) if end_to_end else 0.0,
+        'e2e_p95_ms': 1000 * np.percentile(end_to_end, 95) if end_to_end else 0.0,
+        'skip_rate': skipped / frames if frames else 0.0,
+        'passengers': passengers,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline YOLO pipeline benchmark (decode → detect → passengers → sink).")
+    parser.add_argument("--clips", nargs="*", default=None, help="Local clips (cycled across cameras); synthetic if omitted")
+    parser.add_argument("--clip-dir", default="bench_clips")
+    parser.add_argument("--clip-seconds", type=int, default=120)
+    parser.add_argument("--cameras", type=int, nargs="+", default=[1, 6, 12])
+    parser.add_argument("--interval", type=float, default=1.0, help="Video seconds between samples")
+    parser.add_argument("--max-rounds", type=int, default=None)
+    parser.add_argument("--sink", choices=["null", "queue", "sqlite", "mysql"], default="queue")
+    parser.add_argument("--no-motion-gate", action="store_true")
+    parser.add_argument("--production-interval", type=float, default=10,
+                        help="Sample interval used to estimate how many cameras one box can serve")
+    args = parser.parse_args()
+
+    clips = args.clips or synthetic_clips(args.clip_dir, min(max(args.cameras), 6), args.clip_seconds)
+    print(f"🚀 Pipeline benchmark on {len(clips)} clip(s), sink={args.sink}")
+
+    for cameras in args.cameras:
+        result = run_pipeline(clips, cameras, args.interval, args.max_rounds, args.sink, not args.no_motion_gate)
+        stages = " | ".join(f"{stage} {ms:6.1f}" for stage, ms in result['stage_ms'].items())
+        round_ms = sum(result['stage_ms'].values())
+        capacity = int(args.production_interval * 1000 / round_ms * cameras) if round_ms else 0
+        print(f"📷 {cameras:>3} cameras: {result['fps']:7.1f} fps | {result['rounds']} rounds | "
+              f"skip {result['skip_rate']:.0%} | {result['passengers']} passengers")
+        print(f"   ⏱️ ms/round: {stages}")
+        print(f"   🔁 detection → enqueue {result['e2e_ms']:.1f} ms (p95 {result['e2e_p95_ms']:.1f} ms) | "
+              f"≈{capacity} cameras at {args.production_interval:g}s sampling")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from frame_sampler import FrameSampler
+
+# ✅ Shared-memory layout per camera: [header float64 × HEADER_FIELDS][frame slot 0][frame slot 1]
+HEADER_FIELDS = 8
+SEQ, SLOT, FRAME_TIME, WRITTEN_AT, DECODE_FPS, FRAMES_READ, STATUS, HEARTBEAT = range(HEADER_FIELDS)
+STATUS_STARTING, STATUS_RUNNING, STATUS_FINISHED, STATUS_ERROR = 0, 1, 2, 3
+STATUS_NAMES = {0: "starting", 1: "running", 2: "finished", 3: "error"}
+
+
+def probe_frame_shape(video_path):
+    """(height, width, 3) of a video, read from container metadata."""
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        return None
+    shape = (int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)), int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), 3)
+    cap.release()
+    return shape
+
+
+class SharedFrameBuffer:
+    """Latest-frame mailbox in shared memory with two frame slots (double buffering).
+
+    The writer fills the slot the reader is not pointed at, then publishes it by bumping a
+    sequence counter, so the reader can hand out a zero-copy view that stays intact until
+    the writer has produced two more frames.
+    """
+
+    def __init__(self, shape, name=None, create=False):
+        self.shape = tuple(shape)
+        frame_bytes = int(np.prod(self.shape))
+        header_bytes = HEADER_FIELDS * 8
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=header_bytes + 2 * frame_bytes)
+        self.header = np.ndarray((HEADER_FIELDS,), dtype=np.float64, buffer=self.shm.buf)
+        self.slots = [
+            np.ndarray(self.shape, dtype=np.uint8, buffer=self.shm.buf, offset=header_bytes + i * frame_bytes)
+            for i in range(2)
+        ]
+        if create:
+            self.header[:] = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def write(self, frame, frame_time_sec, decode_fps, frames_read):
+        slot = 1 - int(self.header[SLOT]) if self.header[SEQ] else 0
+        if frame.shape != self.shape:
+            frame = cv2.resize(frame, (self.shape[1], self.shape[0]))
+        self.slots[slot][...] = frame
+        now = time.time()
+        self.header[FRAME_TIME] = frame_time_sec
+        self.header[WRITTEN_AT] = now
+        self.header[DECODE_FPS] = decode_fps
+        self.header[FRAMES_READ] = frames_read
+        self.header[HEARTBEAT] = now
+        self.header[SLOT] = slot
+        self.header[SEQ] += 1  # ✅ Publish last, after the frame and metadata are in place
+
+    def read(self):
+        """Return (seq, frame_time_sec, frame_view) of the latest published frame."""
+        seq = int(self.header[SEQ])
+        slot = int(self.header[SLOT])
+        return seq, float(self.header[FRAME_TIME]), self.slots[slot]
+
+    def set_status(self, status):
+        self.header[STATUS] = status
+        self.header[HEARTBEAT] = time.time()
+
+    def close(self):
+        # Drop numpy views before closing, otherwise the mmap cannot be released
+        self.header = None
+        self.slots = []
+        self.shm.close()
+
+
+def decode_worker(video_path, floor_number, shm_name, shape, sample_interval, start_real_time, stop_event):
+    """Camera process: decode on the shared sample clock and publish the latest frame to shared memory."""
+    buffer = SharedFrameBuffer(shape, name=shm_name)
+    sampler = FrameSampler(video_path, sample_interval)
+
+    if not sampler.isOpened():
+        print(f"❌ ERROR: Cannot open video file {video_path}")
+        buffer.set_status(STATUS_ERROR)
+        buffer.close()
+        return
+
+    buffer.set_status(STATUS_RUNNING)
+    print(f"🚀 Decode worker for Floor {floor_number} started (pid {multiprocessing.current_process().pid})")
+
+    while not stop_event.is_set():
+        real_elapsed_time = time.time() - start_real_time
+        frame_time_sec = (real_elapsed_time // sample_interval) * sample_interval
+
+        frame = sampler.read_at(frame_time_sec)
+        if frame is None:
+            break  # End of video
+
+        buffer.write(frame, frame_time_sec, sampler.decode_fps, sampler.frames_read)
+
+        next_sample = start_real_time + frame_time_sec + sample_interval
+        stop_event.wait(max(0.0, next_sample - time.time()))
+
+    sampler.release()
+    buffer.set_status(STATUS_FINISHED)
+    buffer.close()
+    print(f"✅ Decode worker for Floor {floor_number} finished | 🎞️ decode {sampler.decode_fps:.1f} fps")
+
+
+class CameraWorkerPool:
+    """One decode process per camera, each publishing into its own SharedFrameBuffer.
+
+    `collect()` follows the same contract as the threaded frame collector in YOLO.py:
+    a sorted list of (floor, (frame_time_sec, frame)) with frames not seen before,
+    [] if nothing new arrived before the timeout, or None once every camera has finished.
+    """
+
+    def __init__(self, video_paths, sample_interval, start_real_time=None, sample_intervals=None):
+        self.video_paths = dict(video_paths)
+        self.sample_interval = sample_interval
+        self.sample_intervals = sample_intervals or {}
+        self.start_real_time = start_real_time or time.time()
+        self.stop_event = multiprocessing.Event()
+        self.buffers = {}
+        self.processes = {}
+        self._last_seq = {}
+
+    def start(self):
+        for floor, path in self.video_paths.items():
+            shape = probe_frame_shape(path)
+            if shape is None:
+                print(f"❌ ERROR: Cannot open video file {path}")
+                continue
+            buffer = SharedFrameBuffer(shape, create=True)
+            process = multiprocessing.Process(
+                target=decode_worker,
+                args=(path, floor, buffer.name, shape, self.sample_intervals.get(floor, self.sample_interval),
+                      self.start_real_time, self.stop_event),
+                daemon=True,
+            )
+            process.start()
+            self.buffers[floor] = buffer
+            self.processes[floor] = process
+            self._last_seq[floor] = 0
+        return self
+
+    def _live_floors(self):
+        return [
+            floor for floor, buffer in self.buffers.items()
+            if buffer.header[STATUS] in (STATUS_STARTING, STATUS_RUNNING) and self.processes[floor].is_alive()
+        ]
+
+    def collect(self, timeout):
+        """Wait up to `timeout` seconds for every live camera to publish a new frame."""
+        deadline = time.time() + timeout
+        while True:
+            live = self._live_floors()
+            fresh = [floor for floor, buffer in self.buffers.items() if int(buffer.header[SEQ]) > self._last_seq[floor]]
+            if (fresh and set(live) <= set(fresh)) or time.time() >= deadline or not live:
+                break
+            time.sleep(0.005)
+
+        if not fresh and not live:
+            return None
+
+        batch = []
+        for floor in sorted(fresh):
+            seq, frame_time_sec, frame = self.buffers[floor].read()
+            self._last_seq[floor] = seq
+            batch.append((floor, (frame_time_sec, frame)))
+        return batch
+
+    def health(self):
+        """Per-camera status, frame age (seconds since the last published frame) and decode fps."""
+        now = time.time()
+        report = {}
+        for floor, buffer in self.buffers.items():
+            written_at = float(buffer.header[WRITTEN_AT])
+            report[floor] = {
+                'status': STATUS_NAMES.get(int(buffer.header[STATUS]), "unknown"),
+                'alive': self.processes[floor].is_alive(),
+                'frame_age': now - written_at if written_at else None,
+                'decode_fps': float(buffer.header[DECODE_FPS]),
+                'frames_read': int(buffer.header[FRAMES_READ]),
+            }
+        return report
+
+    def stop(self):
+        self.stop_event.set()
+        for process in self.processes.values():
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for buffer in self.buffers.values():
+            shm = buffer.shm
+            buffer.close()
+            shm.unlink()
+        self.buffers = {}
+        self.processes = {}
@@ -1,33 +1,59 @@
+import argparse
 import multiprocessing
 import time
 import os
 
 # ✅ Import your YOLO and Elevator Simulation functions
-from YOLO import run_yolo  # YOLO function for extracting passenger data
-# from ENV import ElevatorEnv  # Elevator Environment class
-from ENVsql import ElevatorEnv  # Elevator Environment class
+from YOLO import run_yolo  # YOLO function for extracting passenger data (import is cheap; the model loads in the YOLO process)
+from arrival_queue import ArrivalQueue
 
-def run_simulation():
+STEP_SECONDS = 1  # Real seconds per simulation step
+
+def run_simulation(arrival_queue=None):
     """Function to run the Elevator Simulation"""
-    env = ElevatorEnv()  # Initialize the environment
-    
+    # from ENV import ElevatorEnv  # Elevator Environment class
+    from ENVsql import ElevatorEnv  # Imported here so only the simulator process pays for pygame/OpenGL/Firebase
+    env = ElevatorEnv(arrival_queue=arrival_queue)  # Initialize the environment
+
     while True:
         obs, _, _, _ = env.step()  # Run the simulation step
         env.render_2d()  # Update visualization
-        time.sleep(1)  # Delay to match real-time updates
+
+        # ✅ Wait for the next step (real-time pace), but take in YOLO arrivals the moment they are published
+        next_step = time.monotonic() + STEP_SECONDS
+        while True:
+            remaining = next_step - time.monotonic()
+            if remaining <= 0:
+                break
+            if arrival_queue is None:
+                time.sleep(remaining)  # Database feed: polled by step()
+            elif arrival_queue.wait(remaining):
+                env.update_passengers()  # New passengers join the waiting queues immediately
+                env.render_2d()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run YOLO detection and the elevator simulation together.")
+    parser.add_argument("--via-db", action="store_true",
+                        help="Pass passengers only through the database (old polling path)")
+    parser.add_argument("--no-persist", action="store_true",
+                        help="Do not also write passengers to the database")
+    args = parser.parse_args()
+
     # ✅ Step 1: Ensure MySQL Server is Running Before Starting
     print("🚀 Starting YOLO & Elevator Simulation...")
 
-    # ✅ Step 2: Create multiprocessing for YOLO and Simulation
-    yolo_process = multiprocessing.Process(target=run_yolo)  # YOLO in a separate process
-    sim_process = multiprocessing.Process(target=run_simulation)  # Simulation in a separate process
+    # ✅ Step 2: Direct arrival queue between YOLO and the simulator (database is an optional tap)
+    arrival_queue = None if args.via_db else ArrivalQueue()
+    persist = args.via_db or not args.no_persist
+
+    # ✅ Step 3: Create multiprocessing for YOLO and Simulation
+    yolo_process = multiprocessing.Process(target=run_yolo, args=(arrival_queue, persist))  # YOLO in a separate process
+    sim_process = multiprocessing.Process(target=run_simulation, args=(arrival_queue,))  # Simulation in a separate process
 
-    # ✅ Step 3: Start both processes
+    # ✅ Step 4: Start both processes
     yolo_process.start()
     sim_process.start()
 
-    # ✅ Step 4: Keep the processes running
+    # ✅ Step 5: Keep the processes running
     yolo_process.join()
     sim_process.join()
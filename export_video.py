@@ -0,0 +1,224 @@
+import argparse
+import multiprocessing
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from run_log import RunLog
+from shared_state import clock_seconds
+
+DEFAULT_FPS = 30
+DEFAULT_SPEED = 60  # Sim seconds per video second: one hour of simulation → one minute of video
+
+
+# ✅ Encoders: raw RGB frames in, one video file out
+class FfmpegWriter:
+    """Pipes raw RGB frames to an ffmpeg process (H.264)."""
+
+    def __init__(self, path, size, fps):
+        width, height = size
+        self.process = subprocess.Popen(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24",
+             "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+             "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p", path],
+            stdin=subprocess.PIPE,
+        )
+
+    def write(self, rgb):
+        self.process.stdin.write(rgb)
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with status {self.process.returncode}")
+
+
+class OpencvWriter:
+    """cv2.VideoWriter fallback (mp4v) for machines without an ffmpeg binary."""
+
+    def __init__(self, path, size, fps):
+        import cv2
+        self.cv2 = cv2
+        self.size = size
+        self.writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+
+    def write(self, rgb):
+        frame = np.frombuffer(rgb, dtype=np.uint8).reshape(self.size[1], self.size[0], 3)
+        self.writer.write(self.cv2.cvtColor(frame, self.cv2.COLOR_RGB2BGR))
+
+    def close(self):
+        self.writer.release()
+
+
+def open_writer(encoder, path, size, fps):
+    return FfmpegWriter(path, size, fps) if encoder == "ffmpeg" else OpencvWriter(path, size, fps)
+
+
+def pick_encoder(encoder="auto"):
+    if encoder == "auto":
+        return "ffmpeg" if shutil.which("ffmpeg") else "opencv"
+    return encoder
+
+
+# ✅ Which log step each video frame shows
+def unwrap_clock(clock):
+    """Seconds since midnight → seconds since midnight of the first day (+86400 at every wrap)."""
+    wraps = np.concatenate([[0], np.cumsum(np.diff(clock) < 0)])
+    return clock + 86400 * wraps
+
+
+def frame_schedule(run, fps=DEFAULT_FPS, speed=DEFAULT_SPEED, start=None, end=None):
+    """Log index for every video frame, one frame each `speed / fps` sim seconds.
+
+    `start` / `end` ("07:00:00 AM") limit the export to part of the run. They are matched
+    against the unwrapped clock: a time earlier than the run's first step means the next
+    day, and an end before the start means the day after the start, so a run crossing
+    midnight exports the requested stretch in order.
+    """
+    clock = unwrap_clock(run.clock)
+    first, last = 0, len(run) - 1
+    start_at = end_at = None
+    if len(clock) and start is not None:
+        start_at = clock_seconds(start)
+        if start_at < clock[0]:
+            start_at += 86400
+        after = np.flatnonzero(clock >= start_at)
+        first = int(after[0]) if len(after) else len(run)
+    if len(clock) and end is not None:
+        end_at = clock_seconds(end)
+        while end_at < (clock[0] if start_at is None else start_at):
+            end_at += 86400
+        before = np.flatnonzero(clock <= end_at)
+        last = int(before[-1]) if len(before) else -1
+    if last < first:
+        return np.zeros(0, dtype=int)
+
+    seconds = np.arange(first * run.time_per_step, last * run.time_per_step + 1e-9, speed / fps)
+    return np.minimum((seconds // run.time_per_step).astype(int), last)
+
+
+# ✅ Worker process: render one contiguous range of video frames offscreen
+def render_segment(run_path, indices, segment_path, mode, fps, encoder):
+    if mode == "2D":
+        os.environ["SDL_VIDEODRIVER"] = "dummy"  # No window, no display needed
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+
+    run = RunLog(run_path)
+    pygame.init()
+    if mode == "3D":
+        from OpenGL.GLUT import glutInit
+        from render3d import Renderer3D
+        glutInit()
+        renderer = Renderer3D(run.num_floors, run.num_elevators, display_flags=pygame.HIDDEN)
+    else:
+        from render2d import Renderer2D
+        renderer = Renderer2D(run.num_floors, run.num_elevators)
+
+    writer = None
+    rgb = None
+    last_index = None
+    rendered = 0
+    for index in indices:
+        if index != last_index:  # Several video frames can show the same sim step: encode the same pixels again
+            if mode == "3D":
+                renderer.draw(run.frame(index), flip=False)
+                rgb = renderer.capture()
+                pygame.display.flip()
+            else:
+                renderer.draw(run.frame(index))
+                rgb = renderer.capture()
+            last_index = index
+            rendered += 1
+        if writer is None:
+            writer = open_writer(encoder, segment_path, renderer.size, fps)
+        writer.write(rgb)
+
+    if writer is not None:
+        writer.close()
+    pygame.quit()
+    return segment_path, len(indices), rendered
+
+
+def concat_segments(segments, output, encoder, fps):
+    """Join the per-worker segments in order."""
+    if encoder == "ffmpeg":
+        list_path = output + ".segments.txt"
+        with open(list_path, "w") as f:
+            for path in segments:
+                f.write(f"file '{os.path.abspath(path)}'\n")
+        subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                        "-i", list_path, "-c", "copy", output], check=True)
+        os.remove(list_path)
+        return
+
+    # No ffmpeg: decode the segments and re-encode them into one file
+    import cv2
+    writer = None
+    for path in segments:
+        cap = cv2.VideoCapture(path)
+        while True:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            if writer is None:
+                size = (frame.shape[1], frame.shape[0])
+                writer = cv2.VideoWriter(output, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+            writer.write(frame)
+        cap.release()
+    if writer is not None:
+        writer.release()
+
+
+def export_run(run_path, output, mode="2D", fps=DEFAULT_FPS, speed=DEFAULT_SPEED, start=None, end=None,
+               workers=None, encoder="auto"):
+    """Render a recorded run to video, splitting its time range across worker processes."""
+    if mode == "3D" and not os.environ.get("DISPLAY"):
+        raise RuntimeError("3D export needs an X display for its GL context (e.g. run it under xvfb-run)")
+
+    run = RunLog(run_path)
+    indices = frame_schedule(run, fps, speed, start, end)
+    if not len(indices):
+        raise ValueError("No recorded steps in the requested time range")
+
+    encoder = pick_encoder(encoder)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(indices)))
+    chunks = [chunk for chunk in np.array_split(indices, workers) if len(chunk)]
+    print(f"🎬 {len(indices)} frames ({len(run)} steps, {speed}x at {fps} fps) → {workers} workers, {encoder}")
+
+    start_clock = time.perf_counter()
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output))) as tmp:
+        segment_paths = [os.path.join(tmp, f"part_{i:03d}.mp4") for i in range(len(chunks))]
+        # Spawned workers: each gets its own SDL / GL state
+        with ProcessPoolExecutor(max_workers=len(chunks), mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(render_segment, [run_path] * len(chunks), chunks, segment_paths,
+                                    [mode] * len(chunks), [fps] * len(chunks), [encoder] * len(chunks)))
+        concat_segments([path for path, _, _ in results], output, encoder, fps)
+
+    elapsed = time.perf_counter() - start_clock
+    rendered = sum(count for _, _, count in results)
+    print(f"✅ Exported {output} in {elapsed:.1f}s | {len(indices) / elapsed:.0f} video fps | "
+          f"{rendered} frames rendered, {len(indices) - rendered} repeated")
+    return output
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a recorded run (runs/*.npz) to video offscreen, in parallel.")
+    parser.add_argument("run", help="Run log recorded with 'Record run' / ElevatorEnv.start_recording")
+    parser.add_argument("-o", "--output", default=None, help="Video file (default: <run>.mp4)")
+    parser.add_argument("--mode", choices=["2D", "3D"], default="2D")
+    parser.add_argument("--fps", type=int, default=DEFAULT_FPS)
+    parser.add_argument("--speed", type=float, default=DEFAULT_SPEED, help="Sim seconds per video second")
+    parser.add_argument("--start", default=None, help='First sim time to export, e.g. "07:00:00 AM"')
+    parser.add_argument("--end", default=None, help='Last sim time to export, e.g. "08:00:00 AM"')
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default: CPU count)")
+    parser.add_argument("--encoder", choices=["auto", "ffmpeg", "opencv"], default="auto")
+    args = parser.parse_args()
+
+    export_run(args.run, args.output or os.path.splitext(args.run)[0] + ".mp4", args.mode, args.fps,
+               args.speed, args.start, args.end, args.workers, args.encoder)
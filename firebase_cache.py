@@ -0,0 +1,62 @@
+import threading
+import time
+from datetime import datetime
+
+
+class CachedFetch:
+    """One remote query served from memory and refreshed by a background thread.
+
+    `get()` never blocks: it returns whatever was fetched last (None before the first
+    fetch completes) and, if that copy is older than `ttl` seconds, starts a refresh in
+    the background (lazy reload). Only one refresh runs at a time. `version` increases
+    after every completed refresh so a UI can poll for new data without locking.
+    """
+
+    def __init__(self, name, fetch, ttl=60):
+        self.name = name
+        self.fetch = fetch
+        self.ttl = ttl
+
+        self.data = None
+        self.error = None
+        self.refreshed_at = None  # datetime of the last completed refresh
+        self.version = 0
+        self._fetched_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    @property
+    def stale(self):
+        return self.refreshed_at is None or time.monotonic() - self._fetched_at > self.ttl
+
+    @property
+    def refreshing(self):
+        return self._refreshing
+
+    def get(self):
+        if self.stale:
+            self.refresh()
+        return self.data
+
+    def refresh(self):
+        """Start a background refresh unless one is already running."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._worker, name=f"fetch-{self.name}", daemon=True).start()
+
+    def _worker(self):
+        try:
+            data, error = self.fetch(), None
+        except Exception as e:
+            data, error = self.data, str(e)  # Keep serving the last good copy
+            print(f"⚠️ Refresh of {self.name} failed: {e}")
+
+        with self._lock:
+            self.data = data
+            self.error = error
+            self.refreshed_at = datetime.now()
+            self._fetched_at = time.monotonic()
+            self.version += 1
+            self._refreshing = False
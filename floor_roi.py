@@ -0,0 +1,104 @@
+import argparse
+import json
+import os
+
+import cv2
+import numpy as np
+
+
+class FloorROI:
+    """Lobby region of one floor camera, as a polygon in normalised (0-1) frame coordinates.
+
+    `crop()` cuts the polygon's bounding box out of the frame, greys out pixels outside the
+    polygon and shrinks the crop so its longest side is `input_size`, so the detector only
+    sees the lobby. `filter_boxes()` maps detections back to frame coordinates and keeps
+    those whose bottom-centre (the person's feet) lies inside the polygon.
+    """
+
+    def __init__(self, polygon, input_size=320, mask_outside=True):
+        self.polygon = np.asarray(polygon, dtype=np.float32)
+        self.input_size = input_size
+        self.mask_outside = mask_outside
+        self._geometry = {}  # frame shape -> (pixel polygon, bounding box, crop mask)
+
+    def _pixels(self, shape):
+        if shape not in self._geometry:
+            h, w = shape[:2]
+            points = np.round(self.polygon * [w, h]).astype(np.int32)
+            x0, y0 = (int(v) for v in np.clip(points.min(axis=0), 0, [w - 1, h - 1]))
+            x1, y1 = (int(v) for v in np.clip(points.max(axis=0) + 1, 1, [w, h]))
+            mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+            cv2.fillPoly(mask, [points - [x0, y0]], 255)
+            self._geometry[shape] = (points, (x0, y0, x1, y1), mask == 0)
+        return self._geometry[shape]
+
+    def crop(self, frame):
+        """Return (detector input, transform) where transform maps crop pixels back to the frame."""
+        _, (x0, y0, x1, y1), outside = self._pixels(frame.shape)
+        region = frame[y0:y1, x0:x1]
+        if self.mask_outside:
+            region = region.copy()
+            region[outside] = 114
+
+        scale = min(1.0, self.input_size / max(region.shape[:2]))
+        if scale < 1.0:
+            size = (max(1, int(round(region.shape[1] * scale))), max(1, int(round(region.shape[0] * scale))))
+            region = cv2.resize(region, size, interpolation=cv2.INTER_AREA)
+        return region, (x0, y0, scale, frame.shape)
+
+    def filter_boxes(self, boxes, transform):
+        """Boxes from the cropped input → frame coordinates, dropping those outside the polygon."""
+        x0, y0, scale, shape = transform
+        if len(boxes) == 0:
+            return boxes
+        boxes = boxes.copy()
+        boxes[:, [0, 2]] = boxes[:, [0, 2]] / scale + x0
+        boxes[:, [1, 3]] = boxes[:, [1, 3]] / scale + y0
+
+        points, _, _ = self._pixels(shape)
+        feet = np.stack([(boxes[:, 0] + boxes[:, 2]) / 2, boxes[:, 3]], axis=1)
+        inside = [cv2.pointPolygonTest(points, (float(x), float(y)), False) >= 0 for x, y in feet]
+        return boxes[np.array(inside, dtype=bool)]
+
+
+def load_floor_rois(path, input_size=320):
+    """Read {"floor": [[x, y], ...]} polygons from a JSON file; {} if the file does not exist."""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        config = json.load(f)
+    rois = {int(floor): FloorROI(polygon, input_size) for floor, polygon in config.items()}
+    print(f"🔲 Loaded ROI polygons for floors {sorted(rois)} from {path}")
+    return rois
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Preview a floor's ROI polygon on the first frame of its video.")
+    parser.add_argument("video")
+    parser.add_argument("--config", default="roi_config.json")
+    parser.add_argument("--floor", type=int, required=True)
+    parser.add_argument("--output", default="roi_preview.png")
+    args = parser.parse_args()
+
+    roi = load_floor_rois(args.config).get(args.floor)
+    if roi is None:
+        print(f"❌ No ROI for floor {args.floor} in {args.config}")
+        return
+
+    cap = cv2.VideoCapture(args.video)
+    ret, frame = cap.read()
+    cap.release()
+    if not ret:
+        print(f"❌ ERROR: Cannot read video file {args.video}")
+        return
+
+    points, (x0, y0, x1, y1), _ = roi._pixels(frame.shape)
+    cv2.polylines(frame, [points], True, (0, 255, 0), 2)
+    cv2.rectangle(frame, (int(x0), int(y0)), (int(x1), int(y1)), (255, 0, 0), 1)
+    cv2.imwrite(args.output, frame)
+    crop, _ = roi.crop(frame)
+    print(f"✅ Saved {args.output} | detector input {crop.shape[1]}x{crop.shape[0]} instead of {frame.shape[1]}x{frame.shape[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import argparse
+import time
+
+import cv2
+
+
+class FrameSampler:
+    """Samples frames from a video by decoding forward instead of seeking before every read.
+
+    Frames between sample points are skipped with `grab()` (demux + decode without the
+    colour conversion/copy of `retrieve()`), which is far cheaper than `CAP_PROP_POS_MSEC`
+    seeks that restart decoding from the previous keyframe each time. Moving forward always
+    grabs, unless a seek has been measured to be cheaper than grabbing the gap; a seek is
+    otherwise only used to jump backwards. `max_grab_seconds` pins a fixed gap limit instead.
+    """
+
+    def __init__(self, video_path, sample_interval=10, max_grab_seconds=None):
+        self.video_path = video_path
+        self.sample_interval = sample_interval
+        self.cap = cv2.VideoCapture(video_path)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.max_grab_frames = None if max_grab_seconds is None else int(max_grab_seconds * self.fps)
+
+        self.frame_index = 0  # Index of the next frame the decoder will return
+        self.frames_grabbed = 0
+        self.frames_read = 0
+        self.seeks = 0
+        self.decode_time = 0.0
+        self.grab_time = 0.0  # Time spent in grab(), for the per-frame grab cost
+        self.seek_time = 0.0  # Time of each seek + the read after it, for the per-seek cost
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read_at(self, video_time_sec):
+        """Return the frame shown at `video_time_sec`, or None at end of video."""
+        target = int(round(video_time_sec * self.fps))
+        start = time.perf_counter()
+
+        gap = target - self.frame_index
+        seeking = self._should_seek(gap)
+        if seeking:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+            self.seeks += 1
+            self.frame_index = target
+        else:
+            for _ in range(gap):
+                if not self.cap.grab():
+                    self.decode_time += time.perf_counter() - start
+                    return None
+                self.frames_grabbed += 1
+                self.frame_index += 1
+            self.grab_time += time.perf_counter() - start
+
+        ret, frame = self.cap.read()
+        elapsed = time.perf_counter() - start
+        self.decode_time += elapsed
+        if seeking:
+            self.seek_time += elapsed
+        if not ret:
+            return None
+        self.frames_read += 1
+        self.frame_index += 1
+        return frame
+
+    def _should_seek(self, gap):
+        if gap < 0:
+            return True  # The decoder cannot go backwards
+        if self.max_grab_frames is not None:
+            return gap > self.max_grab_frames
+        if not self.seeks or not self.frames_grabbed:
+            return False  # No measured seek cost yet: keep decoding forward
+        return gap * (self.grab_time / self.frames_grabbed) > self.seek_time / self.seeks
+
+    def samples(self, start_sec=0):
+        """Yield (video_time_sec, frame) every `sample_interval` seconds until the video ends."""
+        video_time_sec = start_sec
+        while True:
+            frame = self.read_at(video_time_sec)
+            if frame is None:
+                return
+            yield video_time_sec, frame
+            video_time_sec += self.sample_interval
+
+    @property
+    def decode_fps(self):
+        """Frames pushed through the decoder per second of decode time."""
+        decoded = self.frames_grabbed + self.frames_read
+        return decoded / self.decode_time if self.decode_time else 0.0
+
+    @property
+    def samples_per_sec(self):
+        return self.frames_read / self.decode_time if self.decode_time else 0.0
+
+    def stats(self):
+        return {
+            'decode_fps': self.decode_fps,
+            'samples_per_sec': self.samples_per_sec,
+            'frames_read': self.frames_read,
+            'frames_grabbed': self.frames_grabbed,
+            'seeks': self.seeks,
+        }
+
+    def release(self):
+        self.cap.release()
+
+
+def seek_sample(video_path, sample_interval):
+    """Old process_video access pattern (seek before every read), for comparison."""
+    cap = cv2.VideoCapture(video_path)
+    start = time.perf_counter()
+    video_time_sec = 0
+    samples = 0
+    while True:
+        cap.set(cv2.CAP_PROP_POS_MSEC, video_time_sec * 1000)
+        ret, _ = cap.read()
+        if not ret:
+            break
+        samples += 1
+        video_time_sec += sample_interval
+    cap.release()
+    elapsed = time.perf_counter() - start
+    return samples / elapsed if elapsed else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare seek-per-sample and sequential frame sampling.")
+    parser.add_argument("videos", nargs="+")
+    parser.add_argument("--intervals", nargs="+", type=float, default=[10, 2, 1, 0.5],
+                        help="Sample intervals in seconds")
+    args = parser.parse_args()
+
+    for video_path in args.videos:
+        print(f"🎥 {video_path}")
+        for sample_interval in args.intervals:
+            sampler = FrameSampler(video_path, sample_interval)
+            if not sampler.isOpened():
+                print(f"❌ ERROR: Cannot open video file {video_path}")
+                break
+            for _ in sampler.samples():
+                pass
+            sampler.release()
+            stats = sampler.stats()
+            print(f"  every {sample_interval:>5}s: sequential {stats['samples_per_sec']:8.1f} samples/s "
+                  f"(decode {stats['decode_fps']:7.1f} fps) | seek {seek_sample(video_path, sample_interval):8.1f} samples/s")
+
+
+if __name__ == "__main__":
+    main()
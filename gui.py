@@ -2,13 +2,67 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import pandas as pd
 import threading
-from simulator import ElevatorEnv
+from simulator import ElevatorEnv, fetch_reservations, fetch_peak_demand_data, fetch_maintenance_schedule
 import time
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.dates as mdates
 from PIL import Image, ImageTk
+import queue
+from collections import namedtuple
+from firebase_cache import CachedFetch
+from live_chart import LiveMetricsChart
+from timeseries import MetricHistory
+from virtual_table import VirtualTable
+from render_viewer import launch_viewer
+
+UI_FRAME_MS = 33  # ✅ Fixed UI refresh rate (~30 fps), independent of the simulation speed
+RENDER_FPS = 60  # Target pygame frame rate; sim steps run in between frames
+SIM_STEP_BUDGET = 0.8  # Share of each frame sim steps may use, leaving the rest for the render (matters at "max")
+MAX_RENDER_GAP = 0.5  # Render at least this often even when the sim is behind (keeps the window responsive)
+SPEED_CHOICES = ["1x", "2x", "5x", "10x", "50x", "100x", "500x", "1000x", "max"]
+DEFAULT_SPEED = "50x"  # ≈ the old fixed pace of one 5 s step per 0.1 s
+SNAPSHOT_QUEUE_SIZE = 1000
+INFO_CACHE_TTL = 60  # Seconds before an info panel's Firebase data is reloaded
+INFO_POLL_MS = 250  # How often an open info panel checks for a finished refresh
+RUN_LOG_PATTERN = "runs/run_%Y%m%d_%H%M%S.npz"  # time.strftime pattern for recorded runs
+
+# ✅ Immutable per-step state handed from the simulation thread to the Tk thread
+SimSnapshot = namedtuple(
+    "SimSnapshot",
+    ["time", "energy", "wait_time", "service_time", "waiting", "in_elevators", "mode", "done", "error"],
+    defaults=[None, 0, 0, 0, 0, 0, None, False, None],
+)
+
+def parse_speed(text, default=None):
+    """'50x' -> 50.0, 'max' -> None; anything unparsable keeps `default`."""
+    text = text.strip().lower()
+    if text == "max":
+        return None
+    try:
+        return max(float(text.rstrip("x")), 0.01)
+    except ValueError:
+        return default
+
+# ✅ Info panel tables: (columns, widths, rows builder) per cached query
+def reservation_rows(reservations):
+    return [(uid, res.get('entryFloor'), res.get('destinationFloor'), res.get('time'),
+             res.get('numberOfPeople'), res.get('urgencyLevel')) for uid, res in reservations.items()]
+
+def preschedule_rows(predictions):
+    return [(ts, data.get('floor'), data.get('num_elevators'), data.get('passengers_up'),
+             data.get('passengers_down')) for ts, data in predictions.items()]
+
+def maintenance_rows(data):
+    return [(ts, info.get('date'), info.get('elevator_id'), info.get('active'), info.get('raw_time'))
+            for ts, info in data.items()]
+
+INFO_TABLES = {
+    "reservations": (["User UID", "Entry", "Destination", "Time", "People", "Urgency"],
+                     [200, 60, 80, 80, 60, 70], reservation_rows),
+    "preschedule": (["Time", "Floor", "Elevators", "Up", "Down"], [110, 60, 80, 60, 60], preschedule_rows),
+    "maintenance": (["Scheduled at", "Date", "Elevator ID", "Active", "Original Time"],
+                    [110, 100, 80, 60, 110], maintenance_rows),
+}
 
 def show_splash_screen(image_path=r"C:\Users\Binuda Dewhan\Desktop\elevator app\logo.png", delay=3000):
     splash = tk.Tk()
@@ -53,6 +107,17 @@ class ElevatorSimulatorGUI:
         self.is_paused.set()  # Initially not paused
 
         self.simulation_running = False  # To track simulation state
+        self.state_block_name = None  # Shared-memory state of the running sim (separate-process rendering)
+        self.viewers = []
+
+        # ✅ Info panels are served from a local cache; Firebase is queried in the background
+        self.info_cache = {
+            "reservations": CachedFetch("reservations", fetch_reservations, ttl=INFO_CACHE_TTL),
+            "preschedule": CachedFetch("preschedule", fetch_peak_demand_data, ttl=INFO_CACHE_TTL),
+            "maintenance": CachedFetch("maintenance", fetch_maintenance_schedule, ttl=INFO_CACHE_TTL),
+        }
+        for entry in self.info_cache.values():
+            entry.refresh()  # Prefetch so the first click shows data immediately
 
 
 
@@ -119,6 +184,21 @@ class ElevatorSimulatorGUI:
         self.render_2d_btn.pack(side=tk.LEFT, padx=5)
         self.render_3d_btn.pack(side=tk.LEFT, padx=5)
 
+        # Simulation speed (sim seconds per wall second; "max" runs as fast as the CPU allows)
+        tk.Label(render_frame, text="Speed:", font=label_font).pack(side=tk.LEFT, padx=(20, 5))
+        self.speed = tk.StringVar(value=DEFAULT_SPEED)
+        ttk.Combobox(render_frame, textvariable=self.speed, values=SPEED_CHOICES, width=6).pack(side=tk.LEFT)
+
+        # Draw in viewer processes fed from shared memory instead of the simulation thread
+        self.render_process = tk.BooleanVar(value=False)
+        tk.Checkbutton(render_frame, text="Separate viewer process", variable=self.render_process).pack(side=tk.LEFT, padx=(20, 5))
+        self.add_viewer_button = tk.Button(render_frame, text="Add Viewer", command=self.add_viewer, state="disabled")
+        self.add_viewer_button.pack(side=tk.LEFT)
+
+        # Save every step to runs/*.npz for offline video export (export_video.py)
+        self.record_run = tk.BooleanVar(value=False)
+        tk.Checkbutton(render_frame, text="Record run", variable=self.record_run).pack(side=tk.LEFT, padx=(10, 0))
+
         # Graph Display Options
         tk.Label(self.master, text="Select Graphs to Display:", font=label_font).grid(row=5, column=0, sticky="w", **padding)
         checkbox_frame = tk.Frame(self.master)
@@ -166,12 +246,8 @@ class ElevatorSimulatorGUI:
         self.master.grid_rowconfigure(7, weight=1)
         self.master.grid_columnconfigure(1, weight=1)
 
-        # Data tracking
-        self.time_points = []
-        self.energy_data = []
-        self.wait_time_data = []
-        self.service_time_data = []
-        self.waiting_passenger_data = []
+        # Data tracking (bounded ring buffers with rollups; memory stays flat over long runs)
+        self.metrics = MetricHistory(["energy", "wait_time", "service_time", "waiting"])
 
         
     def set_sim_type(self, sim_type):
@@ -195,6 +271,13 @@ class ElevatorSimulatorGUI:
             self.render_2d_btn.config(relief="raised")
             self.render_3d_btn.config(relief="sunken")
 
+    def add_viewer(self):
+        """Open another 2D/3D window on the running simulation (its own process; no cost to the sim)."""
+        if self.state_block_name is None:
+            messagebox.showinfo("Viewer", "⏳ The simulation is still starting, try again in a moment.")
+            return
+        self.viewers.append(launch_viewer(self.state_block_name, self.render_mode.get()))
+
     def pause_simulation(self):
         self.is_paused.clear()
         self.pause_button.config(state="disabled")
@@ -215,79 +298,60 @@ class ElevatorSimulatorGUI:
             self.csv_entry.insert(0, file_path)
             
     def show_reservations(self):
-        print("🔍 show_reservations() called")  # Add this
-        env = ElevatorEnv()
-        reservations = env.fetch_reservations()
+        self.show_info_panel("reservations", "Reservation List", "⚠️ No reservation data found.")
 
-        win = tk.Toplevel(self.master)
-        win.title("Reservation List")
-        win.geometry("400x300")
-
-        text = tk.Text(win, wrap="word")
-        text.pack(fill=tk.BOTH, expand=True)
-
-        if reservations:
-            for uid, res in reservations.items():
-                text.insert(tk.END, f"User UID: {uid}\n")
-                text.insert(tk.END, f"  Entry Floor: {res.get('entryFloor')}\n")
-                text.insert(tk.END, f"  Destination Floor: {res.get('destinationFloor')}\n")
-                text.insert(tk.END, f"  Time: {res.get('time')}\n")
-                text.insert(tk.END, f"  Number of People: {res.get('numberOfPeople')}\n")
-                text.insert(tk.END, f"  Urgency Level: {res.get('urgencyLevel')}\n")
-                text.insert(tk.END, "-" * 40 + "\n")
-        else:
-            text.insert(tk.END, "⚠️ No reservation data found.\n")
+    def show_preschedule(self):
+        self.show_info_panel("preschedule", "Pre-Schedule List", "⚠️ No traffic prediction data found.")
 
+    def show_maintenance(self):
+        self.show_info_panel("maintenance", "Maintenance List", "⚠️ No maintenance data found.")
 
-    def show_preschedule(self):
-        env = ElevatorEnv()
-        predictions = env.fetch_peak_demand_data_from_firestore()
+    def show_info_panel(self, key, title, empty_text):
+        """Open an info window straight from the local cache; a background refresh fills it in when stale."""
+        entry = self.info_cache[key]
+        entry.get()  # Lazy reload if older than the TTL (never blocks)
+        columns, widths, build_rows = INFO_TABLES[key]
 
         win = tk.Toplevel(self.master)
-        win.title("Pre-Schedule List")
-        win.geometry("400x300")
-
-        text = tk.Text(win, wrap="word")
-        text.pack(fill=tk.BOTH, expand=True)
-
-        if predictions:
-            for ts, data in predictions.items():
-                text.insert(tk.END, f"⏱️ Timestamp: {ts}\n")
-                text.insert(tk.END, f"  Time Only: {data.get('time_only')}\n")
-                text.insert(tk.END, f"  Floor: {data.get('floor')}\n")
-                text.insert(tk.END, f"  Elevators Required: {data.get('num_elevators')}\n")
-                text.insert(tk.END, "-" * 40 + "\n")
-        else:
-            text.insert(tk.END, "⚠️ No traffic prediction data found.\n")
+        win.title(title)
+        win.geometry(f"{sum(widths) + 40}x400")
 
+        header = tk.Frame(win)
+        header.pack(fill=tk.X)
+        status = tk.Label(header, anchor="w")
+        status.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        tk.Button(header, text="Reload", command=entry.refresh).pack(side=tk.RIGHT, padx=5, pady=2)
 
-    def show_maintenance(self):
-        env = ElevatorEnv()
-        data = env.fetch_maintenance_schedule()
+        # Virtualized table: only the visible rows are drawn, with incremental search and sort
+        table = VirtualTable(win, columns, widths, placeholder="⏳ Loading...")
+        table.pack(fill=tk.BOTH, expand=True)
 
-        win = tk.Toplevel(self.master)
-        win.title("Maintenance List")
-        win.geometry("400x300")
-
-        text = tk.Text(win, wrap="word")
-        text.pack(fill=tk.BOTH, expand=True)
-
-        if data:
-            for ts, info in data.items():
-                text.insert(tk.END, f"⏱️ Scheduled at: {ts}\n")
-                text.insert(tk.END, f"  Date: {info.get('date')}\n")
-                text.insert(tk.END, f"  Elevator ID: {info.get('elevator_id')} | Active: {info.get('active')}\n")
-                text.insert(tk.END, f"  Original Time: {info.get('raw_time')}\n")
-                text.insert(tk.END, "-" * 40 + "\n")
-        else:
-            text.insert(tk.END, "⚠️ No maintenance data found.\n")
-            
-    
+        shown = {'version': None, 'status_version': None, 'refreshing': None}
+
+        def render():
+            if not win.winfo_exists():
+                return
+            if entry.version != shown['version']:
+                if entry.refreshed_at is not None:
+                    table.placeholder = empty_text
+                table.set_rows(build_rows(entry.data or {}))
+                shown['version'] = entry.version
+
+            if entry.version != shown['status_version'] or entry.refreshing != shown['refreshing']:
+                stamp = entry.refreshed_at.strftime("%I:%M:%S %p") if entry.refreshed_at else "never"
+                note = " (refreshing...)" if entry.refreshing else ""
+                error = f" ⚠️ {entry.error}" if entry.error else ""
+                status.config(text=f"Last refreshed: {stamp}{note}{error}")
+                shown['status_version'] = entry.version
+                shown['refreshing'] = entry.refreshing
+            win.after(INFO_POLL_MS, render)
+
+        render()
 
     def run_simulation_thread(self):
         if self.sim_type.get() == "CSV":
-            thread = threading.Thread(target=self.run_csv_simulation)
-            thread.start()
+            if not self.start_csv_simulation():
+                return
             self.pause_button.config(state="normal")
             self.resume_button.config(state="disabled")
             self.is_paused.set()  # Allow it to run
@@ -307,124 +371,215 @@ class ElevatorSimulatorGUI:
             messagebox.showerror("Error", f"Failed to run SQL-based simulation.\n{e}")
 
 
-    def run_csv_simulation(self):
-        
-        # Clear graph data
-        self.time_points.clear()
-        self.energy_data.clear()
-        self.wait_time_data.clear()
-        self.service_time_data.clear()
-        self.waiting_passenger_data.clear()
-        
-        for widget in self.graph_frame.winfo_children():
-            widget.destroy()
-
-        # Create plot only when simulation starts
-        self.fig, self.ax = plt.subplots(figsize=(3, 2.5))  # smaller height
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.graph_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)  # 🔥 Stretchable canvas
-        # self.canvas.get_tk_widget().pack(padx=10, pady=10, anchor='center')
-        self.fig.autofmt_xdate()  # Auto format x-axis time labels
+    def start_csv_simulation(self):
+        """Set up the chart and snapshot queue on the Tk thread, then start the simulation thread."""
+        if not self.csv_file:
+            messagebox.showerror("Error", "Please select a CSV file.")
+            return False
 
-        
         try:
-            if not self.csv_file:
-                messagebox.showerror("Error", "Please select a CSV file.")
-                return
-
             start_time = pd.to_datetime(f"{self.start_hour.get()}:{self.start_min.get()} {self.start_ampm.get()}", format="%I:%M %p")
             end_time = pd.to_datetime(f"{self.end_hour.get()}:{self.end_min.get()} {self.end_ampm.get()}", format="%I:%M %p")
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return False
+
+        # Clear graph data
+        self.metrics.clear()
 
+        for widget in self.graph_frame.winfo_children():
+            widget.destroy()
 
-            env = ElevatorEnv(csv_file=self.csv_file)
+        # Create plot only when simulation starts (persistent line artists, blitted updates)
+        self.chart = LiveMetricsChart(self.graph_frame)
+
+        # ✅ The sim thread only publishes snapshots; Tk consumes them on its own clock
+        self.snapshots = queue.Queue(maxsize=SNAPSHOT_QUEUE_SIZE)
+        self.snapshots_dropped = 0
+        self.sim_render_mode = self.render_mode.get()
+        self.sim_speed = parse_speed(self.speed.get())
+        self.sim_detached = self.render_process.get()
+        self.sim_record_path = time.strftime(RUN_LOG_PATTERN) if self.record_run.get() else None
+        self.add_viewer_button.config(state="normal" if self.sim_detached else "disabled")
+        thread = threading.Thread(target=self.run_csv_simulation, args=(start_time, end_time), daemon=True)
+        thread.start()
+        self.master.after(UI_FRAME_MS, self.consume_snapshots)
+        return True
+
+    def consume_snapshots(self):
+        """Tk-side frame: fold every queued snapshot into the history, draw only the latest."""
+        latest = None
+        while True:
+            try:
+                snapshot = self.snapshots.get_nowait()
+            except queue.Empty:
+                break
+            if snapshot.time is not None:
+                self.metrics.append(snapshot.time, {
+                    "energy": snapshot.energy,
+                    "wait_time": snapshot.wait_time,
+                    "service_time": snapshot.service_time,
+                    "waiting": snapshot.waiting,
+                })
+            latest = snapshot
+
+        # Hand UI settings to the sim thread as plain values (it must not touch Tk variables)
+        self.sim_render_mode = self.render_mode.get()
+        self.sim_speed = parse_speed(self.speed.get(), self.sim_speed)
+
+        if latest is not None and len(self.metrics):
+            # Update matplotlib plot (set_data + blit; full redraw only when limits grow)
+            self.chart.update(
+                self.metrics.view(max_points=2000),  # Downsampled: cost independent of run length
+                {
+                    "energy": self.show_energy.get(),
+                    "wait_time": self.show_wait_time.get(),
+                    "service_time": self.show_service_time.get(),
+                    "waiting": self.show_waiting_passengers.get(),
+                },
+            )
+
+        if latest is not None and (latest.done or latest.error):
+            self.add_viewer_button.config(state="disabled")
+            self.pause_button.config(state="disabled")
+            self.resume_button.config(state="disabled")
+            self.simulation_running = False
+            if latest.error:
+                messagebox.showerror("Error", latest.error)
+            else:
+                messagebox.showinfo("Simulation Complete", "✅ Simulation completed successfully!")
+            return
+
+        self.master.after(UI_FRAME_MS, self.consume_snapshots)
+
+    def publish_snapshot(self, snapshot):
+        """Queue a snapshot without ever waiting on the Tk thread: when the queue is full the oldest is dropped."""
+        while True:
+            try:
+                self.snapshots.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self.snapshots.get_nowait()
+                    self.snapshots_dropped += 1  # A gap in the chart history, never a stalled sim
+                except queue.Empty:
+                    pass  # Tk drained it meanwhile
+
+    def simulation_step(self, env, end_time):
+        """Advance the environment one step and publish its snapshot; returns True when the run is over."""
+        actions = []
+        mode = env.detect_elevator_mode()
+        for i in range(env.num_elevators):
+            if mode == "RUSH":
+                action = env.nearest_car_scan(i)
+            elif mode == "DYNAMIC-ASSIGN":
+                action = env.dynamic_assign_routing(i)
+            elif mode == "NORMAL":
+                action = env.energy_efficient_routing(i)
+            else:
+                action = env.energy_efficient_routing_best(i)
+            actions.append(action + 1)
+
+        obs, reward, done, info = env.step(np.array(actions))
+
+        total_waiting = sum(len(v['up']) + len(v['down']) for v in env.state['passengers_waiting'].values())
+        total_in_elevators = sum(obs['elevator_load'])
+
+        # ✅ Publish an immutable snapshot of this step (never blocks; a UI far behind loses the oldest ones)
+        self.publish_snapshot(SimSnapshot(
+            time=mdates.date2num(env.current_time),  # Date number, converted once
+            energy=sum(env.energy_usage),
+            wait_time=sum(env.wait_times),
+            service_time=sum(env.service_times),
+            waiting=total_waiting,
+            in_elevators=total_in_elevators,
+            mode=mode,
+        ))
+        return env.current_time >= end_time and total_waiting == 0 and total_in_elevators == 0
+
+    def run_csv_simulation(self, start_time, end_time):
+        """Simulation thread: steps the environment and publishes SimSnapshots (no Tk/matplotlib calls)."""
+        env = None
+        snapshot = SimSnapshot(done=True)
+        try:
+            env = ElevatorEnv(csv_file=self.csv_file, display=not self.sim_detached)
             env.passenger_data = env.passenger_data[
                 (env.passenger_data["Time"] >= start_time) & (env.passenger_data["Time"] <= end_time)
             ].copy()
             env.current_time = start_time
             env.current_index = 0
 
+            # ✅ After the clock is set, so step 0 of the log / first viewer frame shows the chosen start time
+            if self.sim_record_path:
+                env.start_recording(self.sim_record_path)
+            if self.sim_detached:
+                # ✅ Rendering happens in viewer processes reading the shared state block
+                self.state_block_name = env.open_state_block()
+                self.viewers.append(launch_viewer(self.state_block_name, self.sim_render_mode))
+
             print(f"✅ Running simulation from {start_time.time()} to {end_time.time()}")
 
-            while True:
+            frame_time = 1.0 / RENDER_FPS
+            step_budget = frame_time * SIM_STEP_BUDGET
+            step_credit = 0.0  # Sim steps owed at the chosen speed
+            last_tick = last_render = time.perf_counter()
+            steps = rendered = skipped = 0
+            finished = False
+
+            while not finished:
                 self.is_paused.wait()  # ⏸ Wait here if paused
-                actions = []
-                mode = env.detect_elevator_mode()
-                for i in range(env.num_elevators):
-                    if mode == "RUSH":
-                        action = env.nearest_car_scan(i)
-                    elif mode == "DYNAMIC-ASSIGN":
-                        action = env.dynamic_assign_routing(i)
-                    elif mode == "NORMAL":
-                        action = env.energy_efficient_routing(i)
+                frame_start = time.perf_counter()
+                speed = self.sim_speed  # None = as fast as possible
+
+                # ✅ Run as many sim steps as this frame owes (or as fit in the frame budget at "max")
+                if speed is not None:
+                    steps_per_sec = speed / env.time_per_step
+                    step_credit += min(frame_start - last_tick, MAX_RENDER_GAP) * steps_per_sec
+                    step_credit = min(step_credit, max(1.0, steps_per_sec))  # Falling behind: drop the backlog, don't spiral
+                last_tick = frame_start
+
+                frame_steps = 0
+                while not finished and (speed is None or step_credit >= 1):
+                    finished = self.simulation_step(env, end_time)
+                    frame_steps += 1
+                    if speed is not None:
+                        step_credit -= 1
+                    if time.perf_counter() - frame_start >= step_budget:
+                        break  # Step budget spent: the rest of the frame is for rendering
+                steps += frame_steps
+
+                # ✅ Render at most once per frame; skip it while the sim is behind (but never go dark)
+                now = time.perf_counter()
+                behind = now - frame_start >= frame_time
+                if self.sim_detached:
+                    pass  # Viewer processes draw at their own cadence
+                elif (frame_steps and not behind) or now - last_render >= MAX_RENDER_GAP:
+                    # pygame/OpenGL window belongs to this thread, so it is drawn here
+                    if self.sim_render_mode == "3D":
+                        env.render_3d()
                     else:
-                        action = env.energy_efficient_routing_best(i)
-                    actions.append(action + 1)
-
-                obs, reward, done, info = env.step(np.array(actions))
-                
-                # Update graph data
-                # self.time_points.append(env.current_time.strftime("%H:%M:%S"))
-                self.time_points.append(env.current_time)
-                self.energy_data.append(sum(env.energy_usage))
-                self.wait_time_data.append(sum(env.wait_times))
-                self.service_time_data.append(sum(env.service_times))
-                self.waiting_passenger_data.append(
-                    sum(len(v['up']) + len(v['down']) for v in env.state['passengers_waiting'].values())
-                )
-                
-                # Clear previous frame
-                self.ax.clear()
-
-                # Update matplotlib plot
-                if self.show_energy.get():
-                    self.ax.plot(self.time_points, self.energy_data, label="Energy ⚡", color="blue")
-                if self.show_wait_time.get():
-                    self.ax.plot(self.time_points, self.wait_time_data, label="Wait Time 🚶", color="orange")
-                if self.show_service_time.get():
-                    self.ax.plot(self.time_points, self.service_time_data, label="Service Time ⏳", color="green")
-                if self.show_waiting_passengers.get():
-                    self.ax.plot(self.time_points, self.waiting_passenger_data, label="Waiting 👥", color="red")
-
-
-                self.ax.set_title("Live Simulation Metrics")
-                self.ax.set_xlabel("Time")
-                self.ax.set_ylabel("Value")
-
-                # ✅ Format time on x-axis
-                self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-                self.ax.xaxis.set_major_formatter(mdates.DateFormatter("%I:%M:%S %p"))
-
-                self.fig.autofmt_xdate()  # Auto wrap + rotate
-                self.ax.grid(True)
-                self.ax.legend(loc="upper left")
-                self.fig.tight_layout()
-                self.canvas.draw()
-
-
-                
-
-                if self.render_mode.get() == "3D":
-                    env.render_3d()
-                else:
-                    env.render_2d()
-
-                total_waiting = sum(len(v['up']) + len(v['down']) for v in env.state['passengers_waiting'].values())
-                total_in_elevators = sum(obs['elevator_load'])
-
-                if env.current_time >= end_time and total_waiting == 0 and total_in_elevators == 0:
-                    break
-
-                time.sleep(0.1)
-
-            env.close()
-            messagebox.showinfo("Simulation Complete", "✅ Simulation completed successfully!")
-            self.pause_button.config(state="disabled")
-            self.resume_button.config(state="disabled")
-            self.simulation_running = False
+                        env.render_2d()
+                    last_render = time.perf_counter()
+                    rendered += 1
+                elif frame_steps:
+                    skipped += 1
 
+                time.sleep(max(0.0, frame_time - (time.perf_counter() - frame_start)))
+
+            print(f"🏁 {steps} sim steps, {rendered} frames rendered, {skipped} skipped, "
+                  f"{self.snapshots_dropped} stale snapshots dropped")
 
         except Exception as e:
-            messagebox.showerror("Error", str(e))
+            snapshot = SimSnapshot(error=str(e))
+
+        finally:
+            # ✅ Always release the env: saves the recording, marks the state block FINISHED and unlinks it
+            self.state_block_name = None
+            try:
+                if env is not None:
+                    env.close()
+            finally:
+                self.publish_snapshot(snapshot)  # After close, so the GUI never sees "done" before the recording exists
 
 
 if __name__ == "__main__":
@@ -0,0 +1,209 @@
+import numpy as np
+from collections import deque
+
+from traffic_mode import detect_traffic_mode
+
+# ✅ Traffic policies from simulator.ElevatorEnv.detect_elevator_mode → routing method
+POLICIES = ["RUSH", "DYNAMIC-ASSIGN", "NORMAL", "ENERGY-SAVING"]
+
+
+class HeadlessElevatorEnv:
+    """Pygame/Firebase-free copy of the simulator dispatch core for batch runs.
+
+    Movement, pick-up/drop-off and the four traffic routing policies follow
+    `simulator.ElevatorEnv`; VIP, pre-schedule and maintenance modes are left out
+    since they depend on live Firebase data. `policy` pins one routing policy, or
+    "AUTO" picks it every step with the same rules as `detect_elevator_mode`
+    (both call traffic_mode.detect_traffic_mode).
+    """
+
+    def __init__(self, trace, num_floors=6, num_elevators=3, max_capacity=10, policy="AUTO", time_per_step=5):
+        self.num_floors = num_floors
+        self.num_elevators = num_elevators
+        self.max_capacity = max_capacity
+        self.time_per_step = time_per_step
+        self.policy = policy
+
+        self.arrival_seconds = trace.seconds
+        self.arrival_floors = trace.floors
+        self.arrival_destinations = trace.destinations
+        self.current_index = 0
+        self.current_second = int(trace.seconds[0]) if len(trace) else 0
+
+        self.state = {
+            'elevator_positions': np.ones(num_elevators, dtype=int),
+            'passengers_waiting': {floor: {'up': deque(), 'down': deque()} for floor in range(1, num_floors + 1)},
+            'elevator_passengers': [[] for _ in range(num_elevators)],
+            'elevator_load': [0] * num_elevators
+        }
+
+        # 📊 Metrics
+        self.total_waiting = 0
+        self.energy = 0
+        self.wait_times = []
+        self.served = 0
+
+        self._routing = {
+            "RUSH": self.nearest_car_scan,
+            "DYNAMIC-ASSIGN": self.dynamic_assign_routing,
+            "NORMAL": self.energy_efficient_routing,
+            "ENERGY-SAVING": self.energy_efficient_routing_best,
+        }
+
+    @property
+    def arrivals_done(self):
+        return self.current_index >= len(self.arrival_seconds)
+
+    def _waiting_floors(self):
+        waiting = self.state['passengers_waiting']
+        return [floor for floor in range(1, self.num_floors + 1) if waiting[floor]['up'] or waiting[floor]['down']]
+
+    def detect_traffic_mode(self):
+        """Traffic part of `simulator.ElevatorEnv.detect_elevator_mode` (no VIP/maintenance/preschedule)."""
+        # The simulator counts floors with an open request, i.e. floors with someone waiting
+        return detect_traffic_mode(self.state['passengers_waiting'], self.state['elevator_positions'],
+                                   self.state['elevator_load'], self.max_capacity,
+                                   total_requests=len(self._waiting_floors()))
+
+    def step(self):
+        """Advance one `time_per_step` tick; returns the number of passengers still waiting."""
+        mode = self.detect_traffic_mode() if self.policy == "AUTO" else self.policy
+        routing = self._routing[mode]
+
+        for i in range(self.num_elevators):
+            if self.state['elevator_load'][i] > 0:
+                move = self.move_to_passenger_destination(i)
+            else:
+                move = routing(i)
+
+            old_position = self.state['elevator_positions'][i]
+            new_position = old_position + move
+            if 1 <= new_position <= self.num_floors:
+                self.state['elevator_positions'][i] = new_position
+                self.energy += abs(new_position - old_position)
+
+            self.handle_passenger_movement(i, new_position)
+
+        self.current_second += self.time_per_step
+        self.update_passengers()
+        return self.total_waiting
+
+    def move_to_passenger_destination(self, elevator_index):
+        current_floor = self.state['elevator_positions'][elevator_index]
+        destinations = [dest for _, dest, _ in self.state['elevator_passengers'][elevator_index]]
+        if not destinations:
+            return 0
+        nearest_destination = min(destinations, key=lambda x: abs(x - current_floor))
+        return int(np.sign(nearest_destination - current_floor))
+
+    def handle_passenger_movement(self, elevator_index, new_position):
+        riders = self.state['elevator_passengers'][elevator_index]
+        remaining = [p for p in riders if p[1] != new_position]
+        self.served += len(riders) - len(remaining)
+        self.state['elevator_passengers'][elevator_index] = remaining
+        self.state['elevator_load'][elevator_index] = len(remaining)
+
+        if new_position < 1 or new_position > self.num_floors:
+            return
+
+        # ✅ Same rule as the simulator: serve 'up' first if anyone is waiting to go up
+        queues = self.state['passengers_waiting'][new_position]
+        queue = queues['up'] if queues['up'] else queues['down']
+        while queue and self.state['elevator_load'][elevator_index] < self.max_capacity:
+            pid, dest, arrived = queue.popleft()
+            self.wait_times.append(self.current_second - arrived)
+            remaining.append((pid, dest, arrived))
+            self.state['elevator_load'][elevator_index] += 1
+            self.total_waiting -= 1
+
+    def nearest_car_scan(self, elevator_index):
+        current_floor = self.state['elevator_positions'][elevator_index]
+        waiting_floors = self._waiting_floors()
+        if not waiting_floors:
+            return 0
+        nearest_request = min(waiting_floors, key=lambda floor: abs(floor - current_floor))
+        return int(np.sign(nearest_request - current_floor))
+
+    def dynamic_assign_routing(self, elevator_index):
+        current_floor = self.state['elevator_positions'][elevator_index]
+        waiting_floors = self._waiting_floors()
+        if not waiting_floors:
+            return 0
+        closest_request = min(waiting_floors, key=lambda floor: abs(floor - current_floor))
+
+        best_elevator = None
+        best_distance = float('inf')
+        for i in range(self.num_elevators):
+            if self.state['elevator_load'][i] == 0:
+                distance = abs(closest_request - self.state['elevator_positions'][i])
+                if distance < best_distance:
+                    best_elevator = i
+                    best_distance = distance
+
+        if best_elevator == elevator_index:
+            return int(np.sign(closest_request - current_floor))
+        return 0
+
+    def energy_efficient_routing(self, elevator_index):
+        current_floor = self.state['elevator_positions'][elevator_index]
+        waiting_floors = self._waiting_floors()
+        if not waiting_floors:
+            return 0
+        closest_request = min(waiting_floors, key=lambda floor: abs(floor - current_floor))
+        closest_distance = abs(closest_request - current_floor)
+
+        for i in range(self.num_elevators):
+            if i != elevator_index and abs(closest_request - self.state['elevator_positions'][i]) < closest_distance:
+                return 0
+        return int(np.sign(closest_request - current_floor))
+
+    def energy_efficient_routing_best(self, elevator_index):
+        current_floor = self.state['elevator_positions'][elevator_index]
+        waiting_floors = self._waiting_floors()
+        if not waiting_floors:
+            return 0
+        closest_request = min(waiting_floors, key=lambda floor: abs(floor - current_floor))
+        closest_distance = abs(closest_request - current_floor)
+
+        if any(i != elevator_index and self.state['elevator_load'][i] > 0 for i in range(self.num_elevators)):
+            return 0
+        for i in range(self.num_elevators):
+            if i != elevator_index and abs(closest_request - self.state['elevator_positions'][i]) < closest_distance:
+                return 0
+        return int(np.sign(closest_request - current_floor))
+
+    def update_passengers(self):
+        """Move every arrival with time <= current time into the waiting queues."""
+        end = int(np.searchsorted(self.arrival_seconds, self.current_second, side="right"))
+        waiting = self.state['passengers_waiting']
+        for idx in range(self.current_index, end):
+            floor = int(self.arrival_floors[idx])
+            destination = int(self.arrival_destinations[idx])
+            direction = 'up' if destination > floor else 'down'
+            waiting[floor][direction].append((idx + 1, destination, int(self.arrival_seconds[idx])))
+        self.total_waiting += end - self.current_index
+        self.current_index = end
+
+
+def run_headless(trace, num_floors=6, num_elevators=3, max_capacity=10, policy="AUTO", drain=False, max_steps=None):
+    """Run a trace through the headless engine and return per-step queue lengths and summary metrics."""
+    env = HeadlessElevatorEnv(trace, num_floors, num_elevators, max_capacity, policy)
+    env.update_passengers()
+
+    steps = max_steps or (trace.duration // env.time_per_step + 1)
+    seconds = np.empty(steps, dtype=np.int64)
+    queue = np.empty(steps, dtype=np.int64)
+    for n in range(steps):
+        queue[n] = env.step()
+        seconds[n] = env.current_second
+        if drain and env.arrivals_done and env.total_waiting == 0:
+            seconds, queue = seconds[:n + 1], queue[:n + 1]
+            break
+
+    return {
+        'seconds': seconds,
+        'queue': queue,
+        'served': env.served,
+        'energy': env.energy,
+        'average_wait_time': float(np.mean(env.wait_times)) if env.wait_times else 0.0,
+    }
@@ -0,0 +1,123 @@
+import tkinter as tk
+
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# ✅ (key, legend label, colour) of every live metric
+METRIC_SERIES = [
+    ("energy", "Energy ⚡", "blue"),
+    ("wait_time", "Wait Time 🚶", "orange"),
+    ("service_time", "Service Time ⏳", "green"),
+    ("waiting", "Waiting 👥", "red"),
+]
+
+
+class LiveMetricsChart:
+    """Live line chart that updates persistent artists instead of re-plotting every step.
+
+    Each series is one Line2D created up front and fed with `set_data`. The static parts
+    (axes, ticks, grid, legend) are rendered once and cached as a background; a normal
+    update restores that background and blits only the lines. A full redraw happens only
+    when the axis limits have to grow (by doubling, so it gets rarer over a long run),
+    when series are shown/hidden, or when Tk resizes the canvas.
+    """
+
+    def __init__(self, master, series=METRIC_SERIES, figsize=(3, 2.5), title="Live Simulation Metrics",
+                 x_span_minutes=10):
+        self.fig, self.ax = plt.subplots(figsize=figsize)  # smaller height
+        self.canvas = FigureCanvasTkAgg(self.fig, master=master)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)  # 🔥 Stretchable canvas
+        self.x_span = x_span_minutes / (24 * 60)  # Matplotlib date units are days
+
+        self.ax.set_title(title)
+        self.ax.set_xlabel("Time")
+        self.ax.set_ylabel("Value")
+        self.ax.grid(True)
+
+        # ✅ Format time on x-axis (set once, not every step)
+        self.ax.xaxis_date()
+        self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter("%I:%M:%S %p"))
+
+        self.lines = {
+            key: self.ax.plot([], [], label=label, color=color, animated=True)[0]
+            for key, label, color in series
+        }
+        self.visible = {key: True for key in self.lines}
+        self.ax.set_ylim(0, 1)
+        self._legend()
+
+        self.fig.autofmt_xdate()  # Auto wrap + rotate
+        self.fig.tight_layout()
+        self.background = None
+        self.full_redraws = 0
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.draw()
+
+    def _legend(self):
+        handles = [line for key, line in self.lines.items() if self.visible[key]]
+        if handles:
+            self.ax.legend(handles=handles, loc="upper left")
+        elif self.ax.get_legend() is not None:
+            self.ax.get_legend().remove()
+
+    def _on_draw(self, event):
+        # Any full draw (ours or a Tk resize) refreshes the cached background
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        for key, line in self.lines.items():
+            if self.visible[key]:
+                self.ax.draw_artist(line)
+
+    def _set_visibility(self, visible):
+        changed = False
+        for key, line in self.lines.items():
+            show = visible.get(key, True)
+            if show != self.visible[key]:
+                self.visible[key] = show
+                line.set_visible(show)
+                changed = True
+        if changed:
+            self._legend()
+        return changed
+
+    def _rescale(self, series):
+        """Grow the limits only when the data leaves them; returns True if they changed."""
+        changed = False
+        shown = [series[key] for key in self.lines if self.visible[key] and len(series[key][0])]
+        if not shown:
+            return False
+
+        first = min(x[0] for x, _ in shown)
+        last = max(x[-1] for x, _ in shown)
+        xmin, xmax = self.ax.get_xlim()
+        if first < xmin or last > xmax:
+            span = max(2 * (last - first), self.x_span)
+            self.ax.set_xlim(first, first + span)
+            changed = True
+
+        top = max(float(np.max(y)) for _, y in shown)  # Series are downsampled, so this stays cheap
+        if top > self.ax.get_ylim()[1]:
+            self.ax.set_ylim(0, top * 1.5)
+            changed = True
+        return changed
+
+    def update(self, series, visible=None):
+        """Show `series` (key -> (x, y), x in matplotlib date numbers), e.g. MetricHistory.view()."""
+        for key, line in self.lines.items():
+            line.set_data(*series[key])
+
+        relayout = self._set_visibility(visible or {})
+        relayout = self._rescale(series) or relayout
+
+        if relayout or self.background is None:
+            self.full_redraws += 1
+            self.canvas.draw()  # Re-renders ticks/legend, then _on_draw caches and blits the lines
+        else:
+            self.canvas.restore_region(self.background)
+            self._draw_lines()
+            self.canvas.blit(self.fig.bbox)
@@ -0,0 +1,78 @@
+import time
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """Cheap per-camera change detector that decides whether a frame needs the detector.
+
+    Each frame is shrunk to a small blurred grayscale thumbnail and compared with the
+    thumbnail of the last frame that was actually detected. Comparing against the last
+    *detected* frame (not the previous sample) means slow changes still add up and
+    eventually trigger detection. `force_every` runs the detector anyway after that many
+    consecutive skips so a stale count can never stick forever.
+    """
+
+    def __init__(self, pixel_threshold=25, min_changed_fraction=0.005, size=(160, 90), force_every=30):
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_fraction = min_changed_fraction
+        self.size = size
+        self.force_every = force_every
+
+        self.reference = None
+        self.last_count = 0
+        self.consecutive_skips = 0
+
+        self.checks = 0
+        self.skips = 0
+        self.gate_time = 0.0
+        self.detections = 0
+        self.detect_time = 0.0
+        self.last_changed_fraction = 0.0
+
+    def _thumbnail(self, frame):
+        small = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return cv2.GaussianBlur(gray, (5, 5), 0)
+
+    def should_detect(self, frame):
+        """True if the scene changed since the last detected frame (or no count exists yet)."""
+        start = time.perf_counter()
+        thumbnail = self._thumbnail(frame)
+        self.checks += 1
+
+        if self.reference is None or self.consecutive_skips >= self.force_every:
+            changed = True
+        else:
+            diff = cv2.absdiff(thumbnail, self.reference)
+            self.last_changed_fraction = float(np.count_nonzero(diff > self.pixel_threshold)) / diff.size
+            changed = self.last_changed_fraction >= self.min_changed_fraction
+
+        if changed:
+            self.reference = thumbnail
+            self.consecutive_skips = 0
+        else:
+            self.skips += 1
+            self.consecutive_skips += 1
+        self.gate_time += time.perf_counter() - start
+        return changed
+
+    def record_detection(self, person_count, seconds):
+        """Store the detector's count for reuse and its share of the batch latency."""
+        self.last_count = person_count
+        self.detections += 1
+        self.detect_time += seconds
+
+    @property
+    def skip_rate(self):
+        return self.skips / self.checks if self.checks else 0.0
+
+    def stats(self):
+        return {
+            'checks': self.checks,
+            'skips': self.skips,
+            'skip_rate': self.skip_rate,
+            'gate_ms': 1000 * self.gate_time / self.checks if self.checks else 0.0,
+            'detect_ms': 1000 * self.detect_time / self.detections if self.detections else 0.0,
+        }
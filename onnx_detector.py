@@ -0,0 +1,125 @@
+import argparse
+import os
+
+import cv2
+import numpy as np
+
+COCO_PERSON_CLASS_ID = 0
+DEFAULT_IMGSZ = 320  # ✅ Reduced input resolution (PyTorch path runs at 640)
+
+
+def export_person_detector(weights="yolov8n.pt", imgsz=DEFAULT_IMGSZ, output=None):
+    """Export YOLOv8 weights to ONNX at `imgsz` and return the .onnx path."""
+    from ultralytics import YOLO  # Only needed for the one-off export
+
+    exported = YOLO(weights).export(format="onnx", imgsz=imgsz, simplify=True, dynamic=False)
+    if output and os.path.abspath(output) != os.path.abspath(exported):
+        os.replace(exported, output)
+        exported = output
+    print(f"📦 Exported {weights} → {exported} ({imgsz}x{imgsz})")
+    return exported
+
+
+def letterbox(frame, imgsz):
+    """Resize keeping aspect ratio and pad to imgsz x imgsz. Returns (image, scale, (pad_x, pad_y))."""
+    h, w = frame.shape[:2]
+    scale = min(imgsz / h, imgsz / w)
+    new_w, new_h = int(round(w * scale)), int(round(h * scale))
+    pad_x, pad_y = (imgsz - new_w) // 2, (imgsz - new_h) // 2
+
+    canvas = np.full((imgsz, imgsz, 3), 114, dtype=np.uint8)
+    canvas[pad_y:pad_y + new_h, pad_x:pad_x + new_w] = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    return canvas, scale, (pad_x, pad_y)
+
+
+class OnnxPersonDetector:
+    """Person-only YOLOv8 detector on an exported ONNX model, CPU only.
+
+    Runs on onnxruntime when it is installed, otherwise on OpenCV's DNN module (no extra
+    dependency). Post-processing reads only the person score row of the YOLOv8 head
+    instead of arg-maxing all 80 classes. Calling the detector on a list of BGR frames
+    returns one (N, 5) array of [x1, y1, x2, y2, score] per frame in frame coordinates.
+    """
+
+    def __init__(self, model_path, imgsz=DEFAULT_IMGSZ, conf=0.25, iou=0.45, runtime="auto", threads=None):
+        self.model_path = model_path
+        self.imgsz = imgsz
+        self.conf = conf
+        self.iou = iou
+        self.person_class_id = COCO_PERSON_CLASS_ID
+
+        if runtime == "auto":
+            try:
+                import onnxruntime  # noqa: F401
+                runtime = "onnxruntime"
+            except ImportError:
+                runtime = "opencv"
+        self.runtime = runtime
+
+        if runtime == "onnxruntime":
+            import onnxruntime as ort
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            if threads:
+                options.intra_op_num_threads = threads
+            self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+            self.input_name = self.session.get_inputs()[0].name
+        elif runtime == "opencv":
+            self.net = cv2.dnn.readNetFromONNX(model_path)
+            self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+            self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+            if threads:
+                cv2.setNumThreads(threads)
+        else:
+            raise ValueError(f"Unknown ONNX runtime: {runtime}")
+
+    def _forward(self, blob):
+        if self.runtime == "onnxruntime":
+            return self.session.run(None, {self.input_name: blob})[0]
+        self.net.setInput(blob)
+        return self.net.forward()
+
+    def _postprocess(self, output, scale, pad):
+        # YOLOv8 head: (1, 4 + num_classes, anchors) → boxes as cx, cy, w, h
+        scores = output[0, 4 + self.person_class_id]
+        keep = scores >= self.conf
+        if not keep.any():
+            return np.zeros((0, 5), dtype=np.float32)
+
+        cx, cy, w, h = output[0, :4][:, keep]
+        scores = scores[keep]
+        x1 = (cx - w / 2 - pad[0]) / scale
+        y1 = (cy - h / 2 - pad[1]) / scale
+        w, h = w / scale, h / scale
+
+        rects = np.stack([x1, y1, w, h], axis=1)
+        indices = cv2.dnn.NMSBoxes(rects.tolist(), scores.tolist(), self.conf, self.iou)
+        indices = np.array(indices, dtype=int).reshape(-1)
+
+        boxes = np.stack([x1, y1, x1 + w, y1 + h, scores], axis=1)[indices]
+        return boxes.astype(np.float32)
+
+    def detect(self, frame):
+        image, scale, pad = letterbox(frame, self.imgsz)
+        blob = cv2.dnn.blobFromImage(image, 1 / 255.0, swapRB=True)
+        return self._postprocess(self._forward(blob), scale, pad)
+
+    def __call__(self, frames):
+        return [self.detect(frame) for frame in frames]
+
+    def count(self, frames):
+        return [len(boxes) for boxes in self(frames)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the YOLOv8 person detector to ONNX for CPU inference.")
+    parser.add_argument("--weights", default="yolov8n.pt")
+    parser.add_argument("--imgsz", type=int, default=DEFAULT_IMGSZ)
+    parser.add_argument("--output", default=None, help="Where to write the .onnx file")
+    args = parser.parse_args()
+
+    export_person_detector(args.weights, args.imgsz, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+import os
+import sqlite3
+import threading
+from collections import deque
+from datetime import datetime
+
+# ✅ Storage backend for the passengers table: "mysql" (local server) or "sqlite" (embedded file)
+DB_BACKEND = os.environ.get("PASSENGER_DB_BACKEND", "mysql").lower()
+SQLITE_PATH = os.environ.get("PASSENGER_DB_PATH", "passengers.db")
+
+# ✅ Database Connection Setup (shared by the YOLO producer and the SQL simulators)
+DB_CONFIG = {
+    "host": "localhost",   # Change this if MySQL is hosted elsewhere
+    "user": "root",        # Your MySQL username (default is 'root')
+    "password": "root",    # Change this to your MySQL password
+    "database": "elevator_system"  # Database name
+}
+
+# ✅ `id` is the insert-order high-water mark; `request_time` is the indexed native TIME copy of `time`
+CREATE_PASSENGERS_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS passengers (
+        id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        passenger_id INT NOT NULL,
+        time VARCHAR(16) NOT NULL,
+        request_time TIME NOT NULL,
+        floor INT NOT NULL,
+        direction VARCHAR(8) NOT NULL,
+        destination_floor INT NOT NULL,
+        INDEX idx_passengers_request_time (request_time)
+    )
+'''
+
+INSERT_PASSENGER_SQL = '''
+    INSERT INTO passengers (passenger_id, time, request_time, floor, direction, destination_floor)
+    VALUES (%s, %s, %s, %s, %s, %s)
+'''
+
+SELECT_NEW_PASSENGERS_SQL = '''
+    SELECT id, passenger_id, request_time, floor, direction, destination_floor
+    FROM passengers WHERE id > %s ORDER BY id
+'''
+
+# ✅ SQLite flavour: request_time is stored as zero-padded "HH:MM:SS" text, which sorts like a TIME
+SQLITE_SCHEMA_SQL = '''
+    CREATE TABLE IF NOT EXISTS passengers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        passenger_id INTEGER NOT NULL,
+        time TEXT NOT NULL,
+        request_time TEXT NOT NULL,
+        floor INTEGER NOT NULL,
+        direction TEXT NOT NULL,
+        destination_floor INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_passengers_request_time ON passengers (request_time);
+'''
+
+SQLITE_INSERT_PASSENGER_SQL = INSERT_PASSENGER_SQL.replace("%s", "?")
+SQLITE_SELECT_NEW_PASSENGERS_SQL = SELECT_NEW_PASSENGERS_SQL.replace("%s", "?")
+
+
+def passenger_row(passenger_data):
+    """Map a YOLO passenger record onto the `passengers` column order."""
+    request_time = datetime.strptime(passenger_data["Time"], "%I:%M:%S %p").strftime("%H:%M:%S")
+    return (
+        passenger_data["Passenger ID"],
+        passenger_data["Time"],
+        request_time,
+        passenger_data["Floor"],
+        passenger_data["Direction (Up/Down)"],
+        passenger_data["Destination Floor"]
+    )
+
+
+class MySQLBackend:
+    """Passengers table on the local MySQL server."""
+
+    name = "mysql"
+
+    def __init__(self, config=None):
+        import mysql.connector  # Only needed when this backend is selected
+        self._mysql = mysql.connector
+        self.config = config or DB_CONFIG
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def connect(self):
+        return self._mysql.connect(**self.config)
+
+    def connect_reader(self):
+        conn = self.connect()
+        conn.autocommit = True  # ✅ Otherwise REPEATABLE READ pins us to the first snapshot
+        return conn
+
+    def ensure_alive(self, conn):
+        conn.ping(reconnect=True, attempts=3, delay=1)
+
+    def migrate(self, conn=None):
+        """Create the table, or upgrade an old one with an auto-increment `id` and an indexed TIME column.
+
+        Safe to run repeatedly; old rows get `request_time` back-filled from the text `time` column.
+        """
+        own_conn = conn is None
+        conn = conn or self.connect()
+        cursor = conn.cursor()
+
+        cursor.execute(CREATE_PASSENGERS_TABLE_SQL)
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_schema = DATABASE() AND table_name = 'passengers'"
+        )
+        columns = {row[0].lower() for row in cursor.fetchall()}
+
+        if "id" not in columns:
+            # UNIQUE rather than PRIMARY KEY so tables that already key on passenger_id still migrate
+            cursor.execute("ALTER TABLE passengers ADD COLUMN id BIGINT NOT NULL AUTO_INCREMENT UNIQUE FIRST")
+            print("🔧 Added auto-increment id to passengers table")
+
+        if "request_time" not in columns:
+            cursor.execute("ALTER TABLE passengers ADD COLUMN request_time TIME NULL AFTER time")
+            cursor.execute("UPDATE passengers SET request_time = STR_TO_DATE(time, '%I:%i:%S %p')")
+            cursor.execute("ALTER TABLE passengers MODIFY request_time TIME NOT NULL")
+            cursor.execute("CREATE INDEX idx_passengers_request_time ON passengers (request_time)")
+            print("🔧 Added indexed request_time TIME column to passengers table")
+
+        conn.commit()
+        cursor.close()
+        if own_conn:
+            conn.close()
+
+    def insert_many(self, rows):
+        """Insert rows with one executemany + commit on a pooled connection."""
+        with self._pool_lock:
+            if self._pool is None:
+                from mysql.connector import pooling
+                self._pool = pooling.MySQLConnectionPool(pool_name="passenger_writer", pool_size=2, **self.config)
+        conn = self._pool.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.executemany(INSERT_PASSENGER_SQL, rows)
+            conn.commit()
+            cursor.close()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()  # ✅ Returns the connection to the pool
+
+    def fetch_since(self, conn, last_id):
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(SELECT_NEW_PASSENGERS_SQL, (last_id,))
+        rows = cursor.fetchall()
+        cursor.close()
+        for row in rows:
+            row['request_seconds'] = int(row['request_time'].total_seconds())  # TIME → timedelta
+        return rows
+
+    def clear(self):
+        conn = self.connect()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM passengers")
+        conn.commit()
+        conn.close()
+
+
+class SQLiteBackend:
+    """Passengers table in an embedded SQLite file (WAL mode), shared by producer and simulator processes."""
+
+    name = "sqlite"
+
+    def __init__(self, path=None):
+        self.path = path or SQLITE_PATH
+        self._local = threading.local()  # sqlite3 connections stay on the thread that opened them
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")  # ✅ Readers never block the YOLO writer
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def connect_reader(self):
+        conn = self.connect()
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def ensure_alive(self, conn):
+        pass
+
+    def migrate(self, conn=None):
+        own_conn = conn is None
+        conn = conn or self.connect()
+        conn.executescript(SQLITE_SCHEMA_SQL)
+        conn.commit()
+        if own_conn:
+            conn.close()
+
+    def _writer_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self.connect()
+        return conn
+
+    def insert_many(self, rows):
+        conn = self._writer_connection()
+        with conn:  # ✅ One transaction per batch
+            conn.executemany(SQLITE_INSERT_PASSENGER_SQL, rows)
+
+    def fetch_since(self, conn, last_id):
+        rows = [dict(r) for r in conn.execute(SQLITE_SELECT_NEW_PASSENGERS_SQL, (last_id,))]
+        for row in rows:
+            h, m, s = row['request_time'].split(":")
+            row['request_seconds'] = int(h) * 3600 + int(m) * 60 + int(s)
+        return rows
+
+    def clear(self):
+        conn = self._writer_connection()
+        with conn:
+            conn.execute("DELETE FROM passengers")
+
+
+BACKENDS = {
+    "mysql": MySQLBackend,
+    "sqlite": SQLiteBackend,
+}
+
+_backend = None
+
+
+def get_backend():
+    """Return the process-wide backend chosen by PASSENGER_DB_BACKEND (created on first use)."""
+    global _backend
+    if _backend is None:
+        if DB_BACKEND not in BACKENDS:
+            raise ValueError(f"Unknown PASSENGER_DB_BACKEND '{DB_BACKEND}' (expected one of {', '.join(BACKENDS)})")
+        _backend = BACKENDS[DB_BACKEND]()
+    return _backend
+
+
+def connect_to_db():
+    return get_backend().connect()
+
+
+def migrate_passengers_table(conn=None):
+    get_backend().migrate(conn)
+
+
+class PassengerFeed:
+    """Incremental reader for the `passengers` table over one persistent connection.
+
+    Each poll fetches only rows with `id` above the last one seen, so per-tick cost follows
+    new arrivals rather than the whole history. Rows whose request time is still in the
+    simulated future are held back until `current_time` reaches them.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or get_backend()
+        self.last_id = 0
+        self._pending = deque()
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = self.backend.connect_reader()
+            self.backend.migrate(self._conn)
+        else:
+            self.backend.ensure_alive(self._conn)
+        return self._conn
+
+    def fetch_new(self, current_time):
+        """Return passengers (dicts) that arrived since the last call and are due at `current_time`."""
+        rows = self.backend.fetch_since(self._connection(), self.last_id)
+        if rows:
+            self.last_id = rows[-1]['id']
+            self._pending.extend(rows)
+
+        now = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+        due, later = [], deque()
+        for row in self._pending:
+            (due if row['request_seconds'] <= now else later).append(row)
+        self._pending = later
+        return due
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class PassengerWriter:
+    """Buffers passenger records and writes them with one `executemany` + commit per flush.
+
+    Connections are reused (a pool for MySQL, one per thread for SQLite), so a busy frame
+    costs one round-trip instead of one connect/insert/commit per detected person. Call
+    `flush()` once per frame, or `start()` to flush every `flush_interval` seconds.
+
+    A failed insert keeps its rows buffered for the next flush. While the database stays
+    down the buffer is capped at `max_pending` rows; past that the oldest rows are dropped
+    and counted in `rows_dropped`.
+    """
+
+    def __init__(self, backend=None, flush_interval=1.0, max_buffer=500, max_pending=20000):
+        self.backend = backend or get_backend()
+        self.backend.migrate()
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.max_pending = max_pending
+        self.rows_written = 0
+        self.rows_dropped = 0
+        self.flushes = 0
+        self.failed_flushes = 0  # Consecutive failures; 0 once a flush succeeds
+
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add(self, passengers):
+        """Queue passenger records; flushes early if the buffer grows past `max_buffer`."""
+        with self._buffer_lock:
+            self._buffer.extend(passenger_row(p) for p in passengers)
+            full = len(self._buffer) >= self.max_buffer and not self.failed_flushes  # Database down: wait for the next regular flush
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write everything buffered so far in a single transaction."""
+        with self._buffer_lock:
+            rows, self._buffer = self._buffer, []
+        if not rows:
+            return 0
+
+        try:
+            self.backend.insert_many(rows)
+        except Exception as e:
+            self._requeue(rows)
+            print(f"❌ Error inserting {len(rows)} passengers into {self.backend.name} "
+                  f"(attempt {self.failed_flushes}, kept for retry): {e}")
+            return 0
+
+        self.failed_flushes = 0
+        self.rows_written += len(rows)
+        self.flushes += 1
+        return len(rows)
+
+    def _requeue(self, rows):
+        """Put unwritten rows back in front of anything added meanwhile, dropping the oldest past `max_pending`."""
+        with self._buffer_lock:
+            self.failed_flushes += 1
+            self._buffer[:0] = rows
+            overflow = len(self._buffer) - self.max_pending
+            if overflow > 0:
+                del self._buffer[:overflow]
+                self.rows_dropped += overflow
+                print(f"⚠️ Passenger buffer full: dropped {overflow} oldest rows ({self.rows_dropped} total)")
+
+    @property
+    def pending(self):
+        with self._buffer_lock:
+            return len(self._buffer)
+
+    def start(self):
+        """Flush in a background thread every `flush_interval` seconds."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        print(f"💾 Passenger writer: {self.rows_written} rows in {self.flushes} transactions")
+        if self.pending or self.rows_dropped:
+            print(f"❌ Passenger writer: {self.pending} rows never written, {self.rows_dropped} dropped")
+
+
+if __name__ == "__main__":
+    migrate_passengers_table()
+    print(f"✅ passengers table is up to date ({get_backend().name})")
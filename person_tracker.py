@@ -0,0 +1,104 @@
+import itertools
+
+import numpy as np
+
+
+def iou_matrix(a, b):
+    """Pairwise IoU between (N, 4+) and (M, 4+) xyxy boxes."""
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    return inter / np.maximum(area_a[:, None] + area_b[None, :] - inter, 1e-6)
+
+
+def centroid_distance(a, b):
+    """Pairwise centroid distance, in units of the track box height (scale-free across cameras)."""
+    ca = np.stack([(a[:, 0] + a[:, 2]) / 2, (a[:, 1] + a[:, 3]) / 2], axis=1)
+    cb = np.stack([(b[:, 0] + b[:, 2]) / 2, (b[:, 1] + b[:, 3]) / 2], axis=1)
+    heights = np.maximum(a[:, 3] - a[:, 1], 1.0)
+    return np.linalg.norm(ca[:, None] - cb[None, :], axis=2) / heights[:, None]
+
+
+class PersonTracker:
+    """Lightweight IoU + centroid tracker for one floor camera.
+
+    Detections are matched greedily to existing tracks, first by IoU and then, for
+    people who moved further between samples, by centroid distance. Unmatched detections
+    start new tracks; a track counts as a new person once it has been seen `min_hits`
+    times, and is retired after `max_missed` consecutive samples without a match.
+    """
+
+    _ids = itertools.count(1)  # Track IDs are unique across floors
+
+    def __init__(self, iou_threshold=0.3, max_distance=0.75, max_missed=2, min_hits=1):
+        self.iou_threshold = iou_threshold
+        self.max_distance = max_distance
+        self.max_missed = max_missed
+        self.min_hits = min_hits
+
+        self.tracks = {}  # track_id -> {'box', 'hits', 'missed', 'confirmed'}
+        self.created = 0
+        self.retired = 0
+
+    def _match(self, track_ids, boxes):
+        if not track_ids or len(boxes) == 0:
+            return []
+        track_boxes = np.array([self.tracks[t]['box'] for t in track_ids])
+        iou = iou_matrix(track_boxes, boxes)
+        distance = centroid_distance(track_boxes, boxes)
+
+        pairs = []
+        used_tracks, used_boxes = set(), set()
+        # IoU matches first (best overlap wins), then centroid matches for what is left
+        candidates = [(-iou[i, j], i, j) for i, j in zip(*np.nonzero(iou >= self.iou_threshold))]
+        candidates += [(1 + distance[i, j], i, j) for i, j in zip(*np.nonzero(distance <= self.max_distance))]
+        for _, i, j in sorted(candidates):
+            if i in used_tracks or j in used_boxes:
+                continue
+            used_tracks.add(i)
+            used_boxes.add(j)
+            pairs.append((track_ids[i], j))
+        return pairs
+
+    def update(self, boxes):
+        """Feed one sample's (N, 4+) boxes; returns the IDs of people seen for the first time."""
+        boxes = np.asarray(boxes, dtype=np.float32)
+        if boxes.size == 0:
+            boxes = np.zeros((0, 5), dtype=np.float32)
+        pairs = self._match(list(self.tracks), boxes)
+        matched_boxes = {j for _, j in pairs}
+
+        new_people = []
+        for track_id, j in pairs:
+            track = self.tracks[track_id]
+            track['box'] = boxes[j, :4]
+            track['hits'] += 1
+            track['missed'] = 0
+
+        for track_id in set(self.tracks) - {t for t, _ in pairs}:
+            self.tracks[track_id]['missed'] += 1
+            if self.tracks[track_id]['missed'] > self.max_missed:
+                del self.tracks[track_id]  # ✅ Person left the lobby (or boarded)
+                self.retired += 1
+
+        for j in range(len(boxes)):
+            if j not in matched_boxes:
+                self.tracks[next(self._ids)] = {'box': boxes[j, :4], 'hits': 1, 'missed': 0, 'confirmed': False}
+                self.created += 1
+
+        for track_id, track in self.tracks.items():
+            if not track['confirmed'] and track['hits'] >= self.min_hits:
+                track['confirmed'] = True
+                new_people.append(track_id)
+        return new_people
+
+    @property
+    def active(self):
+        return sum(1 for track in self.tracks.values() if track['confirmed'] and track['missed'] == 0)
+
+    def stats(self):
+        return {'active': self.active, 'created': self.created, 'retired': self.retired}
@@ -0,0 +1,250 @@
+import argparse
+import random
+import time
+from collections import OrderedDict
+
+import pygame
+
+from render_state import (CAR_IDLE, CAR_LOADED, CAR_MAINTENANCE, CAR_MOVING, CAR_PRESCHEDULE, CAR_VIP,
+                          RenderFrame)
+
+HEADER_HEIGHT = 100
+ELEVATOR_WIDTH = 50
+WHITE = (255, 255, 255)
+YELLOW = (255, 255, 0)
+CYAN = (0, 255, 255)
+VIP_PINK = (255, 105, 180)
+PRESCHEDULE_BLUE = (0, 191, 255)  # Deep Sky Blue
+
+MODE_COLORS = {
+    "RUSH": (255, 0, 0),
+    "NORMAL": (255, 165, 0),
+    "ENERGY-SAVING": (0, 255, 0),
+    "VIP": VIP_PINK,
+    "PRESCHEDULE": PRESCHEDULE_BLUE,
+}
+
+CAR_COLORS = {
+    CAR_MAINTENANCE: (128, 128, 128),  # Gray
+    CAR_VIP: VIP_PINK,
+    CAR_PRESCHEDULE: PRESCHEDULE_BLUE,
+    CAR_LOADED: (255, 0, 0),  # Red for passengers
+    CAR_MOVING: (0, 0, 255),  # Blue for moving
+    CAR_IDLE: (0, 255, 0),  # Green for idle
+}
+
+
+class TextCache:
+    """Rendered text surfaces keyed by (text, colour): each distinct label is rasterised once.
+
+    Static labels ("Floor 3", "⬆ 0", "4/10") hit the cache every frame; strings that keep
+    changing (the clock, the stats line) are evicted oldest-first once `max_entries` is reached.
+    """
+
+    def __init__(self, font_size=28, max_entries=2048):
+        self.font = pygame.font.Font(None, font_size)
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = self.misses = 0
+
+    def render(self, text, color):
+        key = (text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.surfaces[key] = self.font.render(text, True, color)
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+class Renderer2D:
+    """2D elevator view drawn from RenderFrames with cached text and dirty-rectangle updates.
+
+    Floor lines and "Floor N" labels are pre-rendered once into a background surface. Every
+    other element (header texts, per-floor markers and ⬆/⬇ counts, cars and their loads) is a
+    slot holding (rect, payload), where the payload is a cached text surface or a car colour.
+    A frame only repaints the rectangles whose slot changed since the last frame: restore the
+    background there, redraw the slots overlapping it (clipped), and push just those
+    rectangles to the display. An unchanged building costs almost nothing per frame.
+    """
+
+    def __init__(self, num_floors, num_elevators, width=800, height=None, font_size=28):
+        self.num_floors = num_floors
+        self.num_elevators = num_elevators
+        self.width = width
+        self.height = height or max(600, num_floors * 100)
+        self.size = (self.width, self.height + HEADER_HEIGHT)
+        self.floor_height = (self.height - HEADER_HEIGHT) // num_floors
+        self.elevator_spacing = width // (num_elevators + 1)
+        self.font_size = font_size
+
+        self.screen = None
+        self.text = None
+        self.background = None
+        self._drawn = None  # slot -> (rect, payload) currently on screen; None forces a full redraw
+        self.frames = 0
+        self.dirty_area = 0  # Pixels pushed to the display, for stats()
+
+    def floor_y(self, floor):
+        return self.size[1] - floor * self.floor_height
+
+    # ✅ Display + static layers
+    def _ensure_screen(self):
+        surface = pygame.display.get_surface()
+        if surface is None or surface.get_size() != self.size or surface.get_flags() & pygame.OPENGL:
+            surface = pygame.display.set_mode(self.size)  # First frame, or taking the window back from the 3D view
+            self._drawn = None  # A new window is blank (pygame 2 may hand back the same Surface object)
+        elif surface is not self.screen:
+            self._drawn = None
+        self.screen = surface
+        if self.text is None:
+            self.text = TextCache(self.font_size)
+            self.background = self._build_background()
+
+    def _build_background(self):
+        background = pygame.Surface(self.size).convert()
+        background.fill((0, 0, 0))
+        for floor in range(1, self.num_floors + 1):
+            y = self.floor_y(floor)
+            pygame.draw.line(background, (200, 200, 200), (0, y), (self.width, y), 2)
+            background.blit(self.text.render(f"Floor {floor}", WHITE), (10, y + 5))
+        return background
+
+    # ✅ Dynamic slots
+    def _slots(self, frame):
+        text = self.text.render
+        slots = {}
+
+        def put(slot, surface, pos):
+            slots[slot] = (surface.get_rect(topleft=pos), surface)
+
+        put("time", text(f"Time: {frame.time}", WHITE), (20, 10))
+        put("mode", text(f"MODE: {frame.mode}", MODE_COLORS.get(frame.mode, WHITE)), (self.width // 2 - 50, 10))
+        if frame.mode == "MAINTENANCE" and frame.maintenance_elevator is not None:
+            put("maintenance", text(f"🛠️ Elevator {frame.maintenance_elevator} Under Maintenance", (192, 192, 192)),
+                (self.width // 2 - 100, 40))
+        if frame.vip_status:
+            put("vip_status", text(f"👑 VIP Status: {frame.vip_status}", VIP_PINK), (self.width // 2 - 50, 40))
+        put("waiting", text(f"Waiting Passengers: {sum(frame.waiting_up) + sum(frame.waiting_down)}", YELLOW), (20, 40))
+        put("stats", text(f"🚶 Wait: {frame.wait_time:.1f}s | ⏳ Service: {frame.service_time:.1f}s | "
+                          f"⚡ Energy: {frame.energy}", WHITE), (20, 70))
+
+        vip_floors = set(frame.vip_floors)
+        for floor in range(1, self.num_floors + 1):
+            y = self.floor_y(floor)
+            if frame.preschedule_floor == floor:
+                put(("preschedule", floor), text("🚀 PRESCHEDULE", PRESCHEDULE_BLUE), (250, y + 5))
+            if floor in vip_floors:
+                put(("vip", floor), text("🎯 VIP", VIP_PINK), (150, y + 5))
+            put(("up", floor), text(f"⬆ {frame.waiting_up[floor - 1]}", YELLOW), (self.width - 100, y + 5))
+            put(("down", floor), text(f"⬇ {frame.waiting_down[floor - 1]}", CYAN), (self.width - 50, y + 5))
+
+        for i, pos in enumerate(frame.positions):
+            x = (i + 1) * self.elevator_spacing - (ELEVATOR_WIDTH // 2)
+            y = self.size[1] - pos * self.floor_height + 5
+            slots[("car", i)] = (pygame.Rect(x, y, ELEVATOR_WIDTH, self.floor_height - 10), CAR_COLORS[frame.car_status[i]])
+            put(("load", i), text(f"{frame.loads[i]}/{frame.max_capacity}", WHITE), (x + 10, y + 20))
+        return slots
+
+    def draw(self, frame):
+        """Draw one RenderFrame; returns the display surface."""
+        self._ensure_screen()
+        slots = self._slots(frame)
+
+        if self._drawn is None:
+            dirty = [self.screen.get_rect()]
+        else:
+            dirty = []
+            for slot, drawn in self._drawn.items():
+                if slots.get(slot) != drawn:
+                    dirty.append(drawn[0])  # Old position must be cleared
+            for slot, current in slots.items():
+                if self._drawn.get(slot) != current:
+                    dirty.append(current[0])
+
+        if dirty:
+            items = list(slots.values())
+            rects = [rect for rect, _ in items]
+            for area in dirty:
+                self.screen.set_clip(area)
+                self.screen.blit(self.background, area, area)
+                for index in area.collidelistall(rects):  # In slot order, so loads stay on top of cars
+                    rect, payload = items[index]
+                    if isinstance(payload, pygame.Surface):
+                        self.screen.blit(payload, rect)
+                    else:
+                        self.screen.fill(payload, rect)
+            self.screen.set_clip(None)
+            pygame.display.update(dirty)
+            self.dirty_area += sum(area.width * area.height for area in dirty)
+
+        self._drawn = slots
+        self.frames += 1
+        return self.screen
+
+    def capture(self):
+        """RGB bytes of the current frame (e.g. for a video encoder)."""
+        return pygame.image.tostring(self.screen, "RGB")
+
+    def stats(self):
+        screen_area = self.size[0] * self.size[1]
+        lookups = self.text.hits + self.text.misses if self.text else 0
+        return {
+            "frames": self.frames,
+            "cached_texts": len(self.text.surfaces) if self.text else 0,
+            "text_hit_rate": self.text.hits / lookups if lookups else 0.0,
+            "avg_dirty_fraction": self.dirty_area / (self.frames * screen_area) if self.frames else 0.0,
+        }
+
+
+def synthetic_frames(num_floors, num_elevators, count, seed=0):
+    """Random-walk RenderFrames for benchmarking without an env or Firebase."""
+    rng = random.Random(seed)
+    positions = [1] * num_elevators
+    loads = [0] * num_elevators
+    up, down = [0] * num_floors, [0] * num_floors
+    energy = wait = service = 0.0
+    for step in range(count):
+        for i in range(num_elevators):
+            positions[i] = min(num_floors, max(1, positions[i] + rng.choice((-1, 0, 1))))
+            loads[i] = min(10, max(0, loads[i] + rng.choice((-1, 0, 0, 1))))
+        floor = rng.randrange(num_floors)
+        up[floor] = max(0, up[floor] + rng.choice((-1, 1)))
+        down[floor] = max(0, down[floor] + rng.choice((-1, 1)))
+        energy += rng.random()
+        wait += rng.random()
+        service += rng.random()
+        seconds = 7 * 3600 + step * 5
+        yield RenderFrame(
+            time=f"{(seconds // 3600 - 1) % 12 + 1:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d} AM",
+            mode="NORMAL", maintenance_elevator=None, vip_status=None, preschedule_floor=None, vip_floors=(),
+            waiting_up=tuple(up), waiting_down=tuple(down), positions=tuple(positions), loads=tuple(loads),
+            car_status=tuple(CAR_LOADED if load else CAR_MOVING for load in loads),
+            wait_time=wait, service_time=service, energy=round(energy), max_capacity=10,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the cached 2D renderer on synthetic frames.")
+    parser.add_argument("--floors", type=int, default=30)
+    parser.add_argument("--elevators", type=int, default=8)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--height", type=int, default=None, help="Window height (default: 100 px per floor)")
+    args = parser.parse_args()
+
+    pygame.init()
+    renderer = Renderer2D(args.floors, args.elevators, height=args.height)
+    start = time.perf_counter()
+    for frame in synthetic_frames(args.floors, args.elevators, args.frames):
+        pygame.event.pump()
+        renderer.draw(frame)
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+
+    print(f"✅ {args.frames} frames in {elapsed:.2f}s → {args.frames / elapsed:.0f} fps")
+    print(f"📊 {renderer.stats()}")
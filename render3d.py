@@ -0,0 +1,206 @@
+from math import sin, cos, radians
+
+import numpy as np
+import pygame
+from pygame.locals import DOUBLEBUF, OPENGL, K_a, K_d, K_e, K_q, K_r, K_s, K_w
+from OpenGL.GL import *
+from OpenGL.GLU import *
+from OpenGL.GLUT import *
+
+from render_state import CAR_IDLE, CAR_LOADED, CAR_MAINTENANCE, CAR_MOVING, CAR_PRESCHEDULE, CAR_VIP
+
+FLOOR_SPACING = 4
+CAR_SIZE = (3, 4, 3)  # Width, height, depth
+
+# ✅ Same colours render_3d always used (render_2d's palette in 0..1)
+CAR_COLORS = {
+    CAR_MAINTENANCE: (0.5, 0.5, 0.5),  # Gray
+    CAR_VIP: (1.0, 0.41, 0.71),  # VIP Pink (255,105,180)
+    CAR_PRESCHEDULE: (0.0, 0.75, 1.0),  # Preschedule Blue (0,191,255)
+    CAR_LOADED: (1.0, 0.0, 0.0),  # Red for passengers
+    CAR_MOVING: (0.0, 0.0, 1.0),  # Blue for moving
+    CAR_IDLE: (0.0, 1.0, 0.0),  # Green for idle
+}
+
+
+class Renderer3D:
+    """3D elevator view drawn from RenderFrames with geometry and glyphs compiled once on the GPU.
+
+    * The building (every floor slab plus its "Floor N" label) is one display list, so it
+      costs a single glCallList per frame however many floors there are.
+    * A car is one cube display list; each car is that list called under its own
+      translation and colour, instead of 24 glVertex3f calls per car.
+    * Every Latin-1 glyph of the bitmap font is baked into its own display list once; a
+      label is then one glCallLists over its bytes rather than a glutBitmapCharacter call
+      per character.
+
+    The lists live in the GL context, so they are rebuilt whenever the window is
+    (re)created, e.g. after the 2D view took it over.
+    """
+
+    def __init__(self, num_floors, num_elevators, size=(1280, 720), font=None,
+                 camera_distance=40, camera_angle_x=20, camera_angle_y=0, display_flags=0):
+        self.num_floors = num_floors
+        self.num_elevators = num_elevators
+        self.size = size
+        self.font = font or GLUT_BITMAP_HELVETICA_18
+        self.camera_distance = camera_distance
+        self.camera_angle_x = camera_angle_x
+        self.camera_angle_y = camera_angle_y
+        self.display_flags = display_flags  # Extra set_mode flags, e.g. pygame.HIDDEN for offscreen export
+
+        self.car_x = [(i - num_elevators // 2) * 6 for i in range(num_elevators)]
+        self.surface = None
+        self.glyph_base = self.building_list = self.car_list = None
+        self.frames = 0
+
+    # ✅ Context + one-time GPU uploads
+    def _ensure_context(self):
+        surface = pygame.display.get_surface()
+        if surface is not None and surface is self.surface and surface.get_flags() & OPENGL:
+            return
+
+        # Before set_mode
+        pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLEBUFFERS, 1)
+        pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLESAMPLES, 4)
+        self.surface = pygame.display.set_mode(self.size, DOUBLEBUF | OPENGL | self.display_flags)
+        glEnable(GL_DEPTH_TEST)
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        gluPerspective(45, (800 / 600), 0.1, 100.0)
+        glMatrixMode(GL_MODELVIEW)
+
+        # A new window is a new GL context: old list names are gone
+        self.glyph_base = self._compile_glyphs()
+        self.car_list = self._compile_car()
+        self.building_list = self._compile_building()
+
+    def _compile_glyphs(self):
+        base = glGenLists(256)
+        for code in range(32, 256):
+            glNewList(base + code, GL_COMPILE)
+            glutBitmapCharacter(self.font, code)
+            glEndList()
+        return base
+
+    def _compile_car(self):
+        w, h, d = (side / 2 for side in CAR_SIZE)
+        faces = [
+            ((-w, -h, d), (w, -h, d), (w, h, d), (-w, h, d)),  # Front
+            ((-w, -h, -d), (-w, h, -d), (w, h, -d), (w, -h, -d)),  # Back
+            ((-w, -h, -d), (-w, -h, d), (-w, h, d), (-w, h, -d)),  # Left
+            ((w, -h, -d), (w, h, -d), (w, h, d), (w, -h, d)),  # Right
+            ((-w, h, -d), (-w, h, d), (w, h, d), (w, h, -d)),  # Top
+            ((-w, -h, -d), (w, -h, -d), (w, -h, d), (-w, -h, d)),  # Bottom
+        ]
+        car = glGenLists(1)
+        glNewList(car, GL_COMPILE)
+        glBegin(GL_QUADS)
+        for face in faces:
+            for v in face:
+                glVertex3f(*v)
+        glEnd()
+        glEndList()
+        return car
+
+    def _compile_building(self):
+        building = glGenLists(1)
+        glNewList(building, GL_COMPILE)
+        glColor3f(0.5, 0.5, 0.5)
+        glBegin(GL_QUADS)
+        for i in range(self.num_floors):
+            y = i * FLOOR_SPACING
+            glVertex3f(-10, y, -10)
+            glVertex3f(10, y, -10)
+            glVertex3f(10, y, 10)
+            glVertex3f(-10, y, 10)
+        glEnd()
+        for i in range(self.num_floors):
+            self.text(f"Floor {i + 1}", -20, i * FLOOR_SPACING + 0.2, 0)  # Farther to the left
+        glEndList()
+        return building
+
+    def text(self, text, x, y, z, color=(1.0, 1.0, 1.0)):
+        """Bitmap label at a 3D position from the pre-baked glyph lists (one call per label)."""
+        data = text.encode("latin-1", "ignore")  # The GLUT bitmap font has no glyphs beyond Latin-1
+        glColor3f(*color)
+        glRasterPos3f(x, y, z)
+        if data:
+            glListBase(self.glyph_base)
+            glCallLists(data)
+
+    # ✅ Camera
+    def handle_keys(self):
+        keys = pygame.key.get_pressed()
+        if keys[K_w]: self.camera_distance -= 1
+        if keys[K_s]: self.camera_distance += 1
+        if keys[K_a]: self.camera_angle_y -= 2
+        if keys[K_d]: self.camera_angle_y += 2
+        if keys[K_q]: self.camera_angle_x += 1
+        if keys[K_e]: self.camera_angle_x -= 1
+        if keys[K_r]:
+            self.camera_distance = 70
+            self.camera_angle_x = 10
+            self.camera_angle_y = 0
+
+        # Clamp camera values
+        self.camera_angle_x = max(-89, min(89, self.camera_angle_x))
+        self.camera_distance = max(5, min(100, self.camera_distance))
+
+    # ✅ Frame
+    def draw(self, frame, flip=True):
+        """Draw one RenderFrame and flip the buffers (flip=False leaves it in the back buffer for capture())."""
+        self._ensure_context()
+
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        glLoadIdentity()
+        gluLookAt(
+            self.camera_distance * sin(radians(self.camera_angle_y)),
+            self.camera_angle_x,
+            self.camera_distance * cos(radians(self.camera_angle_y)),
+            0, 10, 0,  # Look-at target (center of scene)
+            0, 1, 0    # Up direction
+        )
+
+        glCallList(self.building_list)
+
+        # ✅ Floor-level markers (🚀 Preschedule + 👑 VIP) and waiting counts
+        vip_floors = set(frame.vip_floors)
+        for floor_number in range(1, self.num_floors + 1):
+            y = (floor_number - 1) * FLOOR_SPACING
+            if frame.preschedule_floor == floor_number:
+                self.text("🚀", 0, y + 2, 6)
+            if floor_number in vip_floors:
+                self.text("👑", 0, y + 2, -6)
+            self.text(f"Up: {frame.waiting_up[floor_number - 1]}", 11, y + 0.2, -5, color=(1.0, 1.0, 0.0))  # Yellow
+            self.text(f"Down: {frame.waiting_down[floor_number - 1]}", 17, y + 0.2, -5, color=(0.0, 1.0, 1.0))  # Cyan
+
+        # 🏗️ Status text above the top floor
+        top_y = self.num_floors * FLOOR_SPACING + 4
+        self.text(f"Time: {frame.time}", -6, top_y, 0)
+        self.text(f"Mode: {frame.mode}", -6, top_y - 1.6, 0)
+        self.text(f"Wait: {frame.wait_time:.0f}s | Service: {frame.service_time:.0f}s | Energy: {frame.energy}",
+                  -6, top_y - 3.2, 0)
+
+        # ✅ Cars: one shared cube list, per-car transform + colour
+        half_height = CAR_SIZE[1] / 2
+        for i, x in enumerate(self.car_x):
+            y = (frame.positions[i] - 1) * FLOOR_SPACING + half_height
+            glPushMatrix()
+            glTranslatef(x, y, 0)
+            glColor3f(*CAR_COLORS[frame.car_status[i]])
+            glCallList(self.car_list)
+            glPopMatrix()
+            self.text(f"{frame.loads[i]}/{frame.max_capacity}", x - 1.5, y + 2.5, 0)
+
+        if flip:
+            pygame.display.flip()
+        self.frames += 1
+
+    def capture(self):
+        """RGB bytes of the back buffer, top row first; call between draw(frame, flip=False) and the flip."""
+        width, height = self.size
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        glReadBuffer(GL_BACK)
+        data = glReadPixels(0, 0, width, height, GL_RGB, GL_UNSIGNED_BYTE)
+        return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)[::-1].tobytes()
@@ -0,0 +1,64 @@
+from collections import namedtuple
+
+# ✅ Car status codes (what colour a car is drawn in), highest priority first
+CAR_MAINTENANCE = 5
+CAR_VIP = 4
+CAR_PRESCHEDULE = 3
+CAR_LOADED = 2
+CAR_MOVING = 1
+CAR_IDLE = 0
+
+# ✅ Everything a renderer needs for one frame, detached from the env
+RenderFrame = namedtuple(
+    "RenderFrame",
+    ["time", "mode", "maintenance_elevator", "vip_status", "preschedule_floor", "vip_floors",
+     "waiting_up", "waiting_down", "positions", "loads", "car_status",
+     "wait_time", "service_time", "energy", "max_capacity"],
+)
+
+
+def car_status(env, i):
+    """Same priority order as the colour logic the 2D/3D views always used."""
+    if env.maintenance_active and i == env.maintenance_elevator_id:
+        return CAR_MAINTENANCE
+    if env.vip_elevator_id == i:
+        return CAR_VIP
+    if env.preschedule_active and i in env.elevator_targets:
+        return CAR_PRESCHEDULE
+    if env.state['elevator_load'][i] > 0:
+        return CAR_LOADED
+    if env.state['elevator_positions'][i] != 1:
+        return CAR_MOVING
+    return CAR_IDLE
+
+
+def capture_frame(env):
+    """Copy the drawable state of an ElevatorEnv into a RenderFrame (no mode detection, no side effects)."""
+    floors = range(1, env.num_floors + 1)
+    waiting = env.state['passengers_waiting']
+
+    vip_status = None
+    if env.vip_targets:
+        vip_status = "Waiting" if not env.vip_targets[0]['picked_up'] else "In Elevator"
+
+    preschedule_floor = None
+    if env.preschedule_active and env.preschedule_event:
+        preschedule_floor = env.preschedule_event["floor"]
+
+    return RenderFrame(
+        time=env.current_time.strftime('%I:%M:%S %p'),
+        mode=getattr(env, "current_mode", None) or "ENERGY-SAVING",
+        maintenance_elevator=env.maintenance_elevator_id if env.maintenance_active else None,
+        vip_status=vip_status,
+        preschedule_floor=preschedule_floor,
+        vip_floors=tuple(vip['entry_floor'] for vip in env.vip_targets if not vip['picked_up']),
+        waiting_up=tuple(len(waiting[floor]['up']) for floor in floors),
+        waiting_down=tuple(len(waiting[floor]['down']) for floor in floors),
+        positions=tuple(int(pos) for pos in env.state['elevator_positions']),
+        loads=tuple(env.state['elevator_load']),
+        car_status=tuple(car_status(env, i) for i in range(env.num_elevators)),
+        wait_time=sum(env.wait_times),
+        service_time=sum(env.service_times),
+        energy=sum(env.energy_usage),
+        max_capacity=env.max_capacity,
+    )
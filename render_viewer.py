@@ -0,0 +1,81 @@
+import argparse
+import multiprocessing
+import time
+
+from shared_state import STATUS_FINISHED, SharedStateBlock
+
+VIEWER_FPS = 60
+
+
+def run_viewer(block_name, mode="2D", fps=VIEWER_FPS):
+    """Viewer process: attach to a SharedStateBlock and draw its latest state at its own frame rate.
+
+    Only this process touches pygame/OpenGL, so a slow frame here never delays a sim step.
+    Frames are redrawn only when a new state was published (the 3D view also redraws while
+    the camera keys are held). Exits when the window is closed or the simulation finishes.
+    """
+    import pygame  # Imported here so the launching process never pays for it
+    from render2d import Renderer2D
+
+    try:
+        block = SharedStateBlock(name=block_name)
+    except FileNotFoundError:
+        print(f"❌ No simulation state block named {block_name}")
+        return
+
+    pygame.init()
+    pygame.display.set_caption(f"Elevator Simulation ({mode})")
+    if mode == "3D":
+        from OpenGL.GLUT import glutInit
+        from render3d import Renderer3D
+        glutInit()
+        renderer = Renderer3D(block.num_floors, block.num_elevators)
+    else:
+        renderer = Renderer2D(block.num_floors, block.num_elevators)
+    clock = pygame.time.Clock()
+    print(f"🖥️ {mode} viewer attached to {block_name} (pid {multiprocessing.current_process().pid})")
+
+    last_seq = frame = None
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+        seq, latest = block.read()
+        if latest is not None:
+            frame = latest
+        if mode == "3D":
+            renderer.handle_keys()
+        camera_moving = mode == "3D" and any(pygame.key.get_pressed())
+        if frame is not None and (seq != last_seq or camera_moving):
+            renderer.draw(frame)
+            last_seq = seq
+
+        if block.status == STATUS_FINISHED:
+            running = False
+        clock.tick(fps)
+
+    print(f"✅ {mode} viewer closed after {renderer.frames} frames")
+    block.close()
+    pygame.quit()
+
+
+def launch_viewer(block_name, mode="2D", fps=VIEWER_FPS):
+    """Start a viewer in a fresh (spawned) process; safe to call from the Tk app or a sim thread."""
+    process = multiprocessing.get_context("spawn").Process(
+        target=run_viewer, args=(block_name, mode, fps), daemon=True)
+    process.start()
+    return process
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch a running simulation from its shared-memory state block.")
+    parser.add_argument("name", help="Shared-memory block name printed by the simulator")
+    parser.add_argument("--mode", choices=["2D", "3D"], default="2D")
+    parser.add_argument("--fps", type=int, default=VIEWER_FPS)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    run_viewer(args.name, args.mode, args.fps)
+    print(f"⏱️ Viewer ran for {time.perf_counter() - start:.1f}s")
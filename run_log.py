@@ -0,0 +1,61 @@
+import os
+
+import numpy as np
+
+from shared_state import CLOCK, decode_frame, encode_frame, frame_length
+
+
+class RunRecorder:
+    """Records every step's RenderFrame, encoded like a SharedStateBlock slot, into one .npz file.
+
+    A recorded run can be replayed or exported to video (see export_video.py) without
+    Firebase, the CSV or an env. Each row is a few hundred bytes, so a full day of 5 s
+    steps stays in the low megabytes.
+    """
+
+    def __init__(self, path, num_floors, num_elevators, time_per_step=5):
+        self.path = path
+        self.num_floors = num_floors
+        self.num_elevators = num_elevators
+        self.time_per_step = time_per_step
+        self.rows = []
+
+    def append(self, frame):
+        row = np.empty(frame_length(self.num_floors, self.num_elevators), dtype=np.float64)
+        self.rows.append(encode_frame(frame, row, self.num_floors, self.num_elevators))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def save(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        frames = np.stack(self.rows) if self.rows else np.zeros((0, frame_length(self.num_floors, self.num_elevators)))
+        np.savez_compressed(self.path, frames=frames, num_floors=self.num_floors,
+                            num_elevators=self.num_elevators, time_per_step=self.time_per_step)
+        print(f"💾 Recorded {len(self.rows)} steps to {self.path}")
+        return self.path
+
+
+class RunLog:
+    """A recorded run loaded back: `frame(i)` decodes step i into a RenderFrame."""
+
+    def __init__(self, path):
+        with np.load(path) as data:
+            self.frames = data["frames"]
+            self.num_floors = int(data["num_floors"])
+            self.num_elevators = int(data["num_elevators"])
+            self.time_per_step = int(data["time_per_step"])
+        self.path = path
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def clock(self):
+        """Sim clock of every step in seconds since midnight."""
+        return self.frames[:, CLOCK]
+
+    def frame(self, index):
+        return decode_frame(self.frames[index], self.num_floors, self.num_elevators)
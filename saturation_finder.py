@@ -0,0 +1,145 @@
+import argparse
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+from headless_sim import POLICIES, run_headless
+from traffic_tools import Trace, amplify, remap_floors
+
+
+def queue_growth_slope(seconds, queue):
+    """Least-squares slope of the waiting queue over the second half of the run, in passengers/minute."""
+    half = len(queue) // 2
+    if len(queue) - half < 2:
+        return 0.0
+    minutes = (seconds[half:] - seconds[half]) / 60.0
+    return float(np.polyfit(minutes, queue[half:], 1)[0])
+
+
+def evaluate(job):
+    """Run one (policy, scale) point headless. Module-level so it can be sent to worker processes."""
+    trace, policy, scale, config, seed = job
+    scaled = amplify(trace, scale, seed=seed, jitter=config['jitter'])
+    result = run_headless(scaled, config['num_floors'], config['num_elevators'], config['max_capacity'], policy)
+    slope = queue_growth_slope(result['seconds'], result['queue'])
+    return {
+        'policy': policy,
+        'scale': scale,
+        'passengers_per_minute': scaled.rate_per_minute(),
+        'queue_slope': slope,
+        'final_queue': int(result['queue'][-1]) if len(result['queue']) else 0,
+        'average_wait_time': result['average_wait_time'],
+        'energy': result['energy'],
+        'saturated': slope > config['slope_threshold'],
+    }
+
+
+def bisect_policy(trace, policy, low, high, config, seed):
+    """Bisect the scale factor between a stable `low` and saturated `high` point."""
+    points = []
+    for _ in range(config['bisect_steps']):
+        mid = (low + high) / 2
+        point = evaluate((trace, policy, mid, config, seed))
+        points.append(point)
+        if point['saturated']:
+            high = mid
+        else:
+            low = mid
+    return policy, low, points
+
+
+def find_saturation(trace, policies=POLICIES, scales=None, num_floors=6, num_elevators=3, max_capacity=10,
+                    slope_threshold=0.5, bisect_steps=6, jitter=5, seed=0, workers=None):
+    """Sweep arrival intensity per policy, then bisect to the highest sustainable scale.
+
+    Returns (curve DataFrame, {policy: max sustainable passengers/minute}).
+    """
+    if trace.num_floors > num_floors:  # A trace that already fits the building keeps its demand where it is
+        trace = remap_floors(trace, num_floors, seed=seed)
+
+    scales = scales or [1, 2, 4, 6, 8, 12, 16, 20]
+    config = {
+        'num_floors': num_floors,
+        'num_elevators': num_elevators,
+        'max_capacity': max_capacity,
+        'slope_threshold': slope_threshold,
+        'bisect_steps': bisect_steps,
+        'jitter': jitter,
+    }
+    base_rate = trace.rate_per_minute()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # 🔁 Phase 1: Coarse sweep of every (policy, scale) point in parallel
+        jobs = [(trace, policy, scale, config, seed) for policy in policies for scale in scales]
+        points = list(pool.map(evaluate, jobs))
+
+        # 🔁 Phase 2: Bisect between the last stable and first saturated scale, one task per policy
+        bisect_jobs = []
+        limits = {}
+        for policy in policies:
+            curve = sorted((p for p in points if p['policy'] == policy), key=lambda p: p['scale'])
+            saturated = [p['scale'] for p in curve if p['saturated']]
+            if not saturated:
+                limits[policy] = None  # Never saturated within the sweep
+                continue
+            first_bad = saturated[0]
+            stable = [p['scale'] for p in curve if p['scale'] < first_bad]
+            low = stable[-1] if stable else 0.0
+            bisect_jobs.append(pool.submit(bisect_policy, trace, policy, low, first_bad, config, seed))
+
+        for future in bisect_jobs:
+            policy, low, extra = future.result()
+            points.extend(extra)
+            limits[policy] = low
+
+    curve = pd.DataFrame(points).sort_values(['policy', 'scale']).reset_index(drop=True)
+    max_rates = {
+        policy: (scale * base_rate if scale is not None else None)
+        for policy, scale in limits.items()
+    }
+    return curve, max_rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the max sustainable arrival rate per dispatch policy.")
+    parser.add_argument("csv_file")
+    parser.add_argument("--floors", type=int, default=6)
+    parser.add_argument("--elevators", type=int, default=3)
+    parser.add_argument("--capacity", type=int, default=10)
+    parser.add_argument("--policies", nargs="+", default=POLICIES, choices=POLICIES + ["AUTO"])
+    parser.add_argument("--scales", nargs="+", type=float, default=None)
+    parser.add_argument("--slope-threshold", type=float, default=0.5,
+                        help="Queue growth (passengers/minute) above which a run counts as saturated")
+    parser.add_argument("--bisect-steps", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", help="Write the saturation curve to this CSV")
+    args = parser.parse_args()
+
+    trace = Trace.from_csv(args.csv_file)
+    print(f"🚀 {len(trace)} passengers, base rate {trace.rate_per_minute():.1f} passengers/min, "
+          f"{args.elevators} elevators × {args.capacity} on {args.floors} floors")
+
+    curve, max_rates = find_saturation(
+        trace, policies=args.policies, scales=args.scales, num_floors=args.floors,
+        num_elevators=args.elevators, max_capacity=args.capacity, slope_threshold=args.slope_threshold,
+        bisect_steps=args.bisect_steps, seed=args.seed, workers=args.workers
+    )
+
+    with pd.option_context('display.max_rows', None, 'display.width', 120):
+        print(curve.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+
+    print("\n📊 Max sustainable arrival rate:")
+    for policy, rate in max_rates.items():
+        if rate is None:
+            print(f"  {policy:<15} not saturated within the sweep")
+        else:
+            print(f"  {policy:<15} {rate:.1f} passengers/min")
+
+    if args.output:
+        curve.to_csv(args.output, index=False)
+        print(f"📁 Saturation curve saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
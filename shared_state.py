@@ -0,0 +1,190 @@
+import sys
+import time
+from datetime import datetime
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from render_state import RenderFrame
+
+# ✅ Shared-memory layout: [header float64 × HEADER_FIELDS][state slot 0][state slot 1]
+HEADER_FIELDS = 8
+SEQ, SLOT, NUM_FLOORS, NUM_ELEVATORS, WRITTEN_AT, STEPS, STATUS, HEARTBEAT = range(HEADER_FIELDS)
+STATUS_STARTING, STATUS_RUNNING, STATUS_FINISHED = 0, 1, 2
+
+# ✅ Scalars at the start of each state slot, followed by per-floor then per-car arrays
+SCALAR_FIELDS = 9
+CLOCK, MODE, MAINTENANCE, PRESCHEDULE, VIP_STATUS, WAIT_TIME, SERVICE_TIME, ENERGY, CAPACITY = range(SCALAR_FIELDS)
+
+MODES = ["ENERGY-SAVING", "NORMAL", "RUSH", "DYNAMIC-ASSIGN", "VIP", "VIP_PENDING", "PRESCHEDULE", "MAINTENANCE"]
+VIP_STATUSES = [None, "Waiting", "In Elevator"]
+READ_RETRIES = 5
+
+
+def clock_seconds(text):
+    """'07:08:35 AM' -> seconds since midnight (sliced, strptime is most of a write's cost)."""
+    hour = int(text[0:2]) % 12 + (12 if text[9:11] == "PM" else 0)
+    return hour * 3600 + int(text[3:5]) * 60 + int(text[6:8])
+
+
+def clock_text(seconds):
+    seconds = int(seconds)
+    return datetime(2000, 1, 1, seconds // 3600 % 24, seconds // 60 % 60, seconds % 60).strftime("%I:%M:%S %p")
+
+
+def frame_length(num_floors, num_elevators):
+    """float64 values per encoded frame (one state slot, one run-log row)."""
+    return SCALAR_FIELDS + 3 * num_floors + 3 * num_elevators
+
+
+def _sections(values, num_floors, num_elevators):
+    """Views of (up, down, vip flags, positions, loads, car status) inside an encoded frame."""
+    f, e = num_floors, num_elevators
+    edges = np.cumsum([SCALAR_FIELDS, f, f, f, e, e, e])
+    return [values[start:end] for start, end in zip(edges[:-1], edges[1:])]
+
+
+def encode_frame(frame, out, num_floors, num_elevators):
+    """Write a RenderFrame into the float64 vector `out` (length frame_length)."""
+    out[CLOCK] = clock_seconds(frame.time)
+    out[MODE] = MODES.index(frame.mode) if frame.mode in MODES else 0
+    out[MAINTENANCE] = -1 if frame.maintenance_elevator is None else frame.maintenance_elevator
+    out[PRESCHEDULE] = -1 if frame.preschedule_floor is None else frame.preschedule_floor
+    out[VIP_STATUS] = VIP_STATUSES.index(frame.vip_status) if frame.vip_status in VIP_STATUSES else 0
+    out[WAIT_TIME] = frame.wait_time
+    out[SERVICE_TIME] = frame.service_time
+    out[ENERGY] = frame.energy
+    out[CAPACITY] = frame.max_capacity
+
+    up, down, vip, positions, loads, status = _sections(out, num_floors, num_elevators)
+    up[:] = frame.waiting_up
+    down[:] = frame.waiting_down
+    vip[:] = 0
+    for floor in frame.vip_floors:
+        vip[floor - 1] = 1
+    positions[:] = frame.positions
+    loads[:] = frame.loads
+    status[:] = frame.car_status
+    return out
+
+
+def decode_frame(values, num_floors, num_elevators):
+    """Inverse of encode_frame."""
+    up, down, vip, positions, loads, status = (
+        section.astype(int) for section in _sections(values, num_floors, num_elevators))
+    maintenance, preschedule = int(values[MAINTENANCE]), int(values[PRESCHEDULE])
+    energy = values[ENERGY]
+    return RenderFrame(
+        time=clock_text(values[CLOCK]),
+        mode=MODES[int(values[MODE])],
+        maintenance_elevator=None if maintenance < 0 else maintenance,
+        vip_status=VIP_STATUSES[int(values[VIP_STATUS])],
+        preschedule_floor=None if preschedule < 0 else preschedule,
+        vip_floors=tuple(int(i) + 1 for i in np.flatnonzero(vip)),
+        waiting_up=tuple(up.tolist()),
+        waiting_down=tuple(down.tolist()),
+        positions=tuple(positions.tolist()),
+        loads=tuple(loads.tolist()),
+        car_status=tuple(status.tolist()),
+        wait_time=float(values[WAIT_TIME]),
+        service_time=float(values[SERVICE_TIME]),
+        energy=int(energy) if float(energy).is_integer() else float(energy),
+        max_capacity=int(values[CAPACITY]),
+    )
+
+
+def _attach(name):
+    """Open an existing block without letting this process's resource tracker own it.
+
+    Before 3.13 every SharedMemory(name=...) registers the segment with the attaching
+    process's tracker, which unlinks it when that process exits (bpo-39959): a viewer
+    started from its own shell would delete the simulator's block on close.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class SharedStateBlock:
+    """Latest simulation state in shared memory, double-buffered like camera_workers.SharedFrameBuffer.
+
+    The simulator writes one RenderFrame per step into the slot readers are not pointed at,
+    then publishes it by bumping a sequence counter. Any number of viewer processes attach
+    by name and copy the latest slot when they want a frame; a reader whose copy raced a
+    write (the counter moved meanwhile) simply copies again. Writing never waits on a reader.
+    """
+
+    def __init__(self, num_floors=None, num_elevators=None, name=None, create=False):
+        if create:
+            size = (HEADER_FIELDS + 2 * frame_length(num_floors, num_elevators)) * 8
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self.shm = _attach(name)
+            header = np.ndarray((HEADER_FIELDS,), dtype=np.float64, buffer=self.shm.buf)
+            num_floors, num_elevators = int(header[NUM_FLOORS]), int(header[NUM_ELEVATORS])
+            del header
+
+        self.num_floors = num_floors
+        self.num_elevators = num_elevators
+        slot_length = frame_length(num_floors, num_elevators)
+        self.header = np.ndarray((HEADER_FIELDS,), dtype=np.float64, buffer=self.shm.buf)
+        self.slots = [
+            np.ndarray((slot_length,), dtype=np.float64, buffer=self.shm.buf, offset=(HEADER_FIELDS + i * slot_length) * 8)
+            for i in range(2)
+        ]
+        if create:
+            self.header[:] = 0
+            self.header[NUM_FLOORS] = num_floors
+            self.header[NUM_ELEVATORS] = num_elevators
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def seq(self):
+        return int(self.header[SEQ])
+
+    @property
+    def status(self):
+        return int(self.header[STATUS])
+
+    def write(self, frame):
+        slot_index = 1 - int(self.header[SLOT]) if self.header[SEQ] else 0
+        encode_frame(frame, self.slots[slot_index], self.num_floors, self.num_elevators)
+
+        now = time.time()
+        self.header[WRITTEN_AT] = now
+        self.header[HEARTBEAT] = now
+        self.header[STEPS] += 1
+        self.header[SLOT] = slot_index
+        self.header[SEQ] += 1  # ✅ Publish last, after the state is in place
+
+    def read(self):
+        """Return (seq, RenderFrame) of the latest published state, or (0, None) before the first write."""
+        for _ in range(READ_RETRIES):
+            seq = int(self.header[SEQ])
+            if not seq:
+                return 0, None
+            values = self.slots[int(self.header[SLOT])].copy()
+            if int(self.header[SEQ]) == seq:
+                break  # No write overlapped the copy
+        return seq, decode_frame(values, self.num_floors, self.num_elevators)
+
+    def set_status(self, status):
+        self.header[STATUS] = status
+        self.header[HEARTBEAT] = time.time()
+
+    def close(self):
+        # Drop numpy views before closing, otherwise the mmap cannot be released
+        self.header = None
+        self.slots = []
+        self.shm.close()
+
+    def unlink(self):
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass  # Already gone (e.g. removed by an older viewer's resource tracker)
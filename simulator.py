@@ -20,6 +20,13 @@ from OpenGL.GLUT import glutInit
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 
+from render2d import Renderer2D
+from render3d import Renderer3D
+from render_state import capture_frame
+from run_log import RunRecorder
+from shared_state import STATUS_FINISHED, STATUS_RUNNING, SharedStateBlock
+from traffic_mode import detect_traffic_mode
+
 glutInit()
 
 # Only initialize once
@@ -50,6 +57,106 @@ except ValueError:
 db_maintenance = firestore.client(app=maintenance_app)
 
 
+# ✅ Firebase / Firestore queries (module-level so the GUI can run them without building an environment)
+def fetch_reservations():
+    ref = db.reference("reservations")
+    raw_data = ref.get()
+    reservations = {}
+
+    if raw_data:
+        for user_uid, res_entry in raw_data.items():
+            for reservation_id, details in res_entry.items():
+                details['reservation_id'] = reservation_id
+                details['user_uid'] = user_uid
+                reservations[user_uid] = details
+                break  # Only take latest reservation per user
+    return reservations
+
+
+def fetch_peak_demand_data():
+    predictions_ref = db2.collection("unique_prediction")
+    docs = predictions_ref.stream()
+
+    schedule = {}
+
+    for doc in docs:
+        entry = doc.to_dict()
+        try:
+            floor = int(entry.get("floor", 0))
+            num_elevators = int(entry.get("num_elevators", 0))
+
+            # 🕒 Extract and round timestamp1 to the nearest lower 5-second interval
+            raw_timestamp = entry.get("timestamp1", "")
+            if raw_timestamp:
+                dt_obj = datetime.fromisoformat(raw_timestamp)
+
+                # Round down to nearest 5 seconds
+                seconds = dt_obj.second
+                rounded_seconds = seconds - (seconds % 5)
+                rounded_dt = dt_obj.replace(second=rounded_seconds, microsecond=0)
+
+                # Convert to AM/PM format as "12:56:00 AM"
+                time_key = rounded_dt.strftime("%I:%M:%S %p")  # 👈 Here’s your change
+
+                schedule[time_key] = {
+                    "floor": floor,
+                    "num_elevators": num_elevators,
+                    "timestamp_str": raw_timestamp,
+                    "time_only": time_key,
+                    "passengers_up": entry.get("passengers_up", 0),
+                    "passengers_down": entry.get("passengers_down", 0),
+                    "is_peak_demand_time": entry.get("is_peak_demand_time", 0),
+                    "is_peak_floor": entry.get("is_peak_floor", 0)
+                }
+
+        except Exception as e:
+            print(f"⚠️ Error reading prediction entry: {e}")
+
+    return schedule
+
+
+def fetch_maintenance_schedule():
+    schedule_ref = db_maintenance.collection("sensor-data-prediction")
+    docs = schedule_ref.stream()
+
+    schedule = {}
+
+    for doc in docs:
+        data = doc.to_dict()
+        if data.get("maintenance_required", False):
+            # Handle possible time formatting issues
+            raw_time = data.get("time") or data.get("time ") or ""
+            raw_date = data.get("date", "")
+
+            try:
+                # Parse raw time to datetime object
+                raw_time_clean = raw_time.strip()
+                dt_obj = pd.to_datetime(raw_time_clean, format="%I:%M %p")
+
+                # Round down to nearest 5 seconds
+                seconds = dt_obj.second
+                rounded_seconds = seconds - (seconds % 5)
+                rounded_dt = dt_obj.replace(second=rounded_seconds, microsecond=0)
+
+                # Format into AM/PM style string (same as preschedule)
+                time_key = rounded_dt.strftime("%I:%M:%S %p")
+
+                schedule[time_key] = {
+                    "maintenance_required": True,
+                    "elevator_id": 0,  # default elevator ID
+                    "active": True,
+                    "raw_time": raw_time_clean,
+                    "date": raw_date
+                }
+
+            except Exception as e:
+                print(f"⚠️ Error parsing maintenance time: {raw_time} → {e}")
+
+    print("🛠️ Maintenance schedule loaded:", schedule)
+    return schedule
+
+
+
 MODE_COLOR_MAP = {
     "VIP":         (1.0, 0.4, 0.7),
     "PRESCHEDULE": (0.4, 0.6, 1.0),
@@ -63,7 +170,7 @@ MODE_COLOR_MAP = {
 
 
 class ElevatorEnv(gym.Env):
-    def __init__(self, num_floors=6, num_elevators=3, csv_file="passengers_01.csv"):
+    def __init__(self, num_floors=6, num_elevators=3, csv_file="passengers_01.csv", display=True):
         super(ElevatorEnv, self).__init__()
         self.num_floors = num_floors
         self.num_elevators = num_elevators
@@ -141,6 +248,7 @@ class ElevatorEnv(gym.Env):
         self.energy_usage = []
         self.service_efficiency = []
         
+        self.current_mode = "ENERGY-SAVING"  # Mode found by the last step()
         self.camera_distance = 40
         self.camera_angle_y = 0
         self.camera_angle_x = 20
@@ -150,23 +258,18 @@ class ElevatorEnv(gym.Env):
         pygame.init()
         self.screen_width = 800
         self.screen_height = max(600, num_floors * 100)
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        # No window when a separate viewer process draws the state (see open_state_block)
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height)) if display else None
         pygame.display.set_caption("Elevator Simulation")
         self.clock = pygame.time.Clock()
+        self.render_fps = 60  # Frame cap for render_2d
+        self.renderer_2d = None  # Created on the first render_2d call
+        self.renderer_3d = None  # Created on the first render_3d call
+        self.state_block = None  # SharedStateBlock written every step once open_state_block() is called
+        self.run_recorder = None  # RunRecorder fed every step once start_recording() is called
         
     def fetch_reservations(self):
-        ref = db.reference("reservations")
-        raw_data = ref.get()
-        reservations = {}
-
-        if raw_data:
-            for user_uid, res_entry in raw_data.items():
-                for reservation_id, details in res_entry.items():
-                    details['reservation_id'] = reservation_id
-                    details['user_uid'] = user_uid
-                    reservations[user_uid] = details
-                    break  # Only take latest reservation per user
-        return reservations
+        return fetch_reservations()
     
     
     def fetch_recognized_users(self):
@@ -192,85 +295,10 @@ class ElevatorEnv(gym.Env):
     #     return ref.get() or {}
     
     def fetch_peak_demand_data_from_firestore(self):
-        predictions_ref = db2.collection("unique_prediction")
-        docs = predictions_ref.stream()
-
-        schedule = {}
-
-        for doc in docs:
-            entry = doc.to_dict()
-            try:
-                floor = int(entry.get("floor", 0))
-                num_elevators = int(entry.get("num_elevators", 0))
-
-                # 🕒 Extract and round timestamp1 to the nearest lower 5-second interval
-                raw_timestamp = entry.get("timestamp1", "")
-                if raw_timestamp:
-                    dt_obj = datetime.fromisoformat(raw_timestamp)
-
-                    # Round down to nearest 5 seconds
-                    seconds = dt_obj.second
-                    rounded_seconds = seconds - (seconds % 5)
-                    rounded_dt = dt_obj.replace(second=rounded_seconds, microsecond=0)
-
-                    # Convert to AM/PM format as "12:56:00 AM"
-                    time_key = rounded_dt.strftime("%I:%M:%S %p")  # 👈 Here’s your change
-
-                    schedule[time_key] = {
-                        "floor": floor,
-                        "num_elevators": num_elevators,
-                        "timestamp_str": raw_timestamp,
-                        "time_only": time_key,
-                        "passengers_up": entry.get("passengers_up", 0),
-                        "passengers_down": entry.get("passengers_down", 0),
-                        "is_peak_demand_time": entry.get("is_peak_demand_time", 0),
-                        "is_peak_floor": entry.get("is_peak_floor", 0)
-                    }
-
-            except Exception as e:
-                print(f"⚠️ Error reading prediction entry: {e}")
-
-        return schedule
+        return fetch_peak_demand_data()
     
     def fetch_maintenance_schedule(self):
-        schedule_ref = db_maintenance.collection("sensor-data-prediction")
-        docs = schedule_ref.stream()
-
-        schedule = {}
-
-        for doc in docs:
-            data = doc.to_dict()
-            if data.get("maintenance_required", False):
-                # Handle possible time formatting issues
-                raw_time = data.get("time") or data.get("time ") or ""
-                raw_date = data.get("date", "")
-
-                try:
-                    # Parse raw time to datetime object
-                    raw_time_clean = raw_time.strip()
-                    dt_obj = pd.to_datetime(raw_time_clean, format="%I:%M %p")
-
-                    # Round down to nearest 5 seconds
-                    seconds = dt_obj.second
-                    rounded_seconds = seconds - (seconds % 5)
-                    rounded_dt = dt_obj.replace(second=rounded_seconds, microsecond=0)
-
-                    # Format into AM/PM style string (same as preschedule)
-                    time_key = rounded_dt.strftime("%I:%M:%S %p")
-
-                    schedule[time_key] = {
-                        "maintenance_required": True,
-                        "elevator_id": 0,  # default elevator ID
-                        "active": True,
-                        "raw_time": raw_time_clean,
-                        "date": raw_date
-                    }
-
-                except Exception as e:
-                    print(f"⚠️ Error parsing maintenance time: {raw_time} → {e}")
-
-        print("🛠️ Maintenance schedule loaded:", schedule)
-        return schedule
+        return fetch_maintenance_schedule()
 
 
 
@@ -400,6 +428,7 @@ class ElevatorEnv(gym.Env):
 
         # ✅ Detect current elevator mode (VIP, VIP_PENDING, RUSH, etc.)
         mode = self.detect_elevator_mode()
+        self.current_mode = mode  # ✅ Renderers read this instead of re-running detection
         
         # ✅ Generate time key as "HH:MM:SS" string
         time_key = self.current_time.strftime("%I:%M:%S %p")
@@ -496,6 +525,14 @@ class ElevatorEnv(gym.Env):
         }
 
         self.energy_usage.append(energy_consumed)
+
+        # ✅ Publish this step for viewer processes (a few µs; never waits on a viewer) and the run log
+        if self.state_block is not None or self.run_recorder is not None:
+            frame = capture_frame(self)
+            if self.state_block is not None:
+                self.state_block.write(frame)
+            if self.run_recorder is not None:
+                self.run_recorder.append(frame)
         return obs, 0, done, info
 
     def default_elevator_logic(self, i, mode):
@@ -689,78 +726,14 @@ class ElevatorEnv(gym.Env):
         if self.vip_targets:
             return "VIP"
 
-        # ✅ Define thresholds for each mode
-        rush_passenger_threshold =   10 # 7+ passengers per floor = RUSH
-        normal_passenger_threshold = 3  # 4-6 passengers per floor = NORMAL
-        # energy_saving_threshold = 3  # ≤3 passengers per floor = ENERGY-SAVING
-        
-        rush_request_threshold = 30  # More than 10 requests/min = RUSH
-        normal_request_threshold = 6  # 6-10 requests/min = NORMAL
-        
-        rush_occupancy_threshold = 70  # Elevators >70% full = RUSH
-        normal_occupancy_threshold = 40  # Elevators 40-70% full = NORMAL
-        
-        # rush_total_waiting_threshold = 15  # ✅ New Condition: More than 15 passengers waiting → RUSH
-        
-        # peak_hours = [(8, 10), (17, 19)]  # Rush Time (Morning & Evening)
-        
-        # ✅ New Condition: If **any single floor** has 10+ waiting passengers → RUSH
-        for floor in range(1, self.num_floors + 1):
-            total_floor_requests = len(self.state['passengers_waiting'][floor]['up']) + len(self.state['passengers_waiting'][floor]['down'])
-            if total_floor_requests > 10:
-                return "RUSH"
-        
-        total_waiting = sum(len(v['up']) + len(v['down']) for v in self.state['passengers_waiting'].values())
-        total_requests = len(self.passenger_wait_times)  
-        average_occupancy = (sum(self.state['elevator_load']) / (self.num_elevators * self.max_capacity)) * 100
-        # elevator_stops = sum(1 for e in self.state['elevator_positions'] if e in self.state['passengers_waiting'])
-        
-        current_hour = self.current_time.hour
-        # is_peak_hour = any(start <= current_hour <= end for start, end in peak_hours)
-        
-         # ✅ NEW CONDITION: Check if **any elevator is handling passengers**, but a new request appears
-        for floor in range(1, self.num_floors + 1):
-            if self.state['passengers_waiting'][floor]['up'] or self.state['passengers_waiting'][floor]['down']:
-                
-                # ✅ Find the closest elevator
-                closest_elevator = None
-                min_distance = float('inf')
-                
-                for i in range(self.num_elevators):
-                    elevator_floor = self.state['elevator_positions'][i]
-                    distance = abs(floor - elevator_floor)
-
-                    # ✅ If the elevator is already **handling passengers**, check if another is available
-                    if self.state['elevator_load'][i] > 0 and distance < min_distance:
-                        closest_elevator = i
-                        min_distance = distance
-
-                # ✅ If the closest elevator is **serving passengers**, but another is available → "DYNAMIC-ASSIGN"
-                if closest_elevator is not None:
-                    for i in range(self.num_elevators):
-                        if i != closest_elevator and self.state['elevator_load'][i] == 0:
-                            return "DYNAMIC-ASSIGN"
-
-        # ✅ Rush Mode (High Demand)
-        if (
-            total_waiting > rush_passenger_threshold or
-            total_requests > rush_request_threshold or
-            average_occupancy > rush_occupancy_threshold 
-            # is_peak_hour 
-            # total_waiting > rush_total_waiting_threshold  # ✅ NEW CONDITION ADDED
-        ):
-            return "RUSH"  # 🔴 Rush Mode
-
-        # ✅ Normal Mode (Moderate Traffic)
-        if (
-            total_waiting > normal_passenger_threshold or
-            total_requests > normal_request_threshold or
-            average_occupancy > normal_occupancy_threshold
-        ):
-            return "NORMAL"  # 🟡 Normal Operation
-
-        # ✅ Energy-Saving Mode (Low Demand)
-        return "ENERGY-SAVING"  # 🟢 Energy-Saving Mode
+        # ✅ Traffic thresholds live in traffic_mode.py, shared with headless_sim
+        return detect_traffic_mode(
+            self.state['passengers_waiting'],
+            self.state['elevator_positions'],
+            self.state['elevator_load'],
+            self.max_capacity,
+            total_requests=len(self.passenger_wait_times),
+        )
 
 
 
@@ -1146,7 +1119,7 @@ class ElevatorEnv(gym.Env):
     #     self.clock.tick(10)
     
     def render_2d(self):
-        """Render the Elevator Environment in Pygame with VIP Visualization."""
+        """Render the Elevator Environment in Pygame with VIP Visualization (cached text, dirty rectangles)."""
 
         # ✅ Handle Pygame Events to Prevent Freezing
         for event in pygame.event.get():
@@ -1154,331 +1127,52 @@ class ElevatorEnv(gym.Env):
                 pygame.quit()
                 exit()
 
-        # ✅ Define UI Layout
-        header_height = 100
-        total_height = self.screen_height + header_height
-        self.screen = pygame.display.set_mode((self.screen_width, total_height))
-        self.screen.fill((0, 0, 0))
-
-        font = pygame.font.Font(None, 28)
-
-        # ✅ Display Simulation Time
-        time_text = font.render(f"Time: {self.current_time.strftime('%I:%M:%S %p')}", True, (255, 255, 255))
-        self.screen.blit(time_text, (20, 10))
-
-        # ✅ Determine Current Mode with Colors
-        current_mode = self.detect_elevator_mode()
-        mode_colors = {
-            "RUSH": (255, 0, 0),
-            "NORMAL": (255, 165, 0),
-            "ENERGY-SAVING": (0, 255, 0),
-            "VIP": (255, 105, 180),
-            "PRESCHEDULE": (0, 191, 255)  # Deep Sky Blue
-        }
-        mode_color = mode_colors.get(current_mode, (255, 255, 255))
-        mode_text = font.render(f"MODE: {current_mode}", True, mode_color)
-        self.screen.blit(mode_text, (self.screen_width // 2 - 50, 10))
-        
-        # 🛠️ Maintenance elevator info (only if in MAINTENANCE mode)
-        if current_mode == "MAINTENANCE" and self.maintenance_active:
-            maint_label = font.render(f"🛠️ Elevator {self.maintenance_elevator_id} Under Maintenance", True, (192, 192, 192))
-            self.screen.blit(maint_label, (self.screen_width // 2 - 100, 40))
-
-        # ✅ VIP Status Display
-        if self.vip_targets:
-            vip_status = "Waiting" if not self.vip_targets[0]['picked_up'] else "In Elevator"
-            vip_label = font.render(f"👑 VIP Status: {vip_status}", True, (255, 105, 180))
-            self.screen.blit(vip_label, (self.screen_width // 2 - 50, 40))
-
-        # ✅ Total Waiting Passengers
-        total_waiting = sum(len(v['up']) + len(v['down']) for v in self.state['passengers_waiting'].values())
-        waiting_text = font.render(f"Waiting Passengers: {total_waiting}", True, (255, 255, 0))
-        self.screen.blit(waiting_text, (20, 40))
-
-        # ✅ Stats
-        total_energy = sum(self.energy_usage) if self.energy_usage else 0
-        total_wait_time = sum(self.wait_times) if self.wait_times else 0
-        total_service_time = sum(self.service_times) if self.service_times else 0
-
-        stats_text = font.render(
-            f"🚶 Wait: {total_wait_time:.1f}s | ⏳ Service: {total_service_time:.1f}s | ⚡ Energy: {total_energy}",
-            True, (255, 255, 255)
-        )
-        self.screen.blit(stats_text, (20, 70))
-
-        # ✅ Draw Floors
-        floor_height = (self.screen_height - header_height) // self.num_floors
-        for floor in range(1, self.num_floors + 1):
-            y = total_height - floor * floor_height
-
-            # Floor line
-            pygame.draw.line(self.screen, (200, 200, 200), (0, y), (self.screen_width, y), 2)
-
-            # Floor label
-            floor_label = font.render(f"Floor {floor}", True, (255, 255, 255))
-            self.screen.blit(floor_label, (10, y + 5))
-            
-            # PRESCHEDULE marker
-            if self.preschedule_active and self.preschedule_event:
-                if self.preschedule_event["floor"] == floor:
-                    preschedule_marker = font.render("🚀 PRESCHEDULE", True, (0, 191, 255))
-                    self.screen.blit(preschedule_marker, (250, y + 5))
-
-            # VIP marker on floor
-            for vip in self.vip_targets:
-                if vip['entry_floor'] == floor and not vip['picked_up']:
-                    vip_marker = font.render("🎯 VIP", True, (255, 105, 180))
-                    self.screen.blit(vip_marker, (150, y + 5))
-
-            # Waiting passengers
-            up_count = len(self.state['passengers_waiting'][floor]['up'])
-            down_count = len(self.state['passengers_waiting'][floor]['down'])
-
-            up_text = font.render(f"⬆ {up_count}", True, (255, 255, 0))
-            down_text = font.render(f"⬇ {down_count}", True, (0, 255, 255))
-            self.screen.blit(up_text, (self.screen_width - 100, y + 5))
-            self.screen.blit(down_text, (self.screen_width - 50, y + 5))
-
-        # ✅ Draw Elevators
-        elevator_width = 50
-        elevator_spacing = self.screen_width // (self.num_elevators + 1)
-        for i, pos in enumerate(self.state['elevator_positions']):
-            x = (i + 1) * elevator_spacing - (elevator_width // 2)
-            y = total_height - pos * floor_height + 5
-
-            # 🛠️ Maintenance elevator (takes highest priority)
-            if self.maintenance_active and i == self.maintenance_elevator_id:
-                color = (128, 128, 128)  # Gray
-            elif self.vip_elevator_id == i:
-                color = (255, 105, 180)  # VIP Pink
-            elif self.preschedule_active and i in self.elevator_targets:
-                color = (0, 191, 255)  # Preschedule Blue
-            elif self.state['elevator_load'][i] > 0:
-                color = (255, 0, 0)  # Red for passengers
-            elif self.state['elevator_positions'][i] != 1:
-                color = (0, 0, 255)  # Blue for moving
-            else:
-                color = (0, 255, 0)  # Green for idle
-                
-            pygame.draw.rect(self.screen, color, (x, y, elevator_width, floor_height - 10))
-
-            # Passenger count in elevator
-            label = font.render(f"{self.state['elevator_load'][i]}/10", True, (255, 255, 255))
-            self.screen.blit(label, (x + 10, y + 20))
-
-        pygame.display.update()
-        self.clock.tick(30)
+        # ✅ Static layers and text surfaces are built once and reused (see render2d.Renderer2D)
+        if self.renderer_2d is None:
+            self.renderer_2d = Renderer2D(self.num_floors, self.num_elevators, self.screen_width, self.screen_height)
+        self.screen = self.renderer_2d.draw(capture_frame(self))
+        self.clock.tick(self.render_fps)
         
         
     def render_3d(self):
-        if not hasattr(self, "initialized_3d"):
-            
-            # Before pygame.init()
-            pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLEBUFFERS, 1)
-            pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLESAMPLES, 4)
-
-            pygame.init()
-            # pygame.display.set_mode((800, 600), DOUBLEBUF | OPENGL)
-            pygame.display.set_mode((1280, 720), DOUBLEBUF | OPENGL)  # or 1920x1080
-            glEnable(GL_DEPTH_TEST)
-            glMatrixMode(GL_PROJECTION)
-            gluPerspective(45, (800 / 600), 0.1, 100.0)
-            glMatrixMode(GL_MODELVIEW)
-            glTranslatef(0.0, -5.0, -40.0)
-
-            self.elevator_positions_3d = [(i - self.num_elevators // 2) * 6 for i in range(self.num_elevators)]
-            self.floor_spacing = 4
-            self.initialized_3d = True
+        """Render the building in OpenGL from display lists compiled once (see render3d.Renderer3D)."""
+        if self.renderer_3d is None:
+            self.renderer_3d = Renderer3D(self.num_floors, self.num_elevators,
+                                          camera_distance=self.camera_distance,
+                                          camera_angle_x=self.camera_angle_x,
+                                          camera_angle_y=self.camera_angle_y)
 
         # Handle window events to prevent freezing
         for event in pygame.event.get():
             if event.type == QUIT:
                 pygame.quit()
                 return  # Exit rendering gracefully if window is closed
-            
-        # ✅ Step 3: Add camera key controls here
-        keys = pygame.key.get_pressed()
-        if keys[K_w]: self.camera_distance -= 1
-        if keys[K_s]: self.camera_distance += 1
-        if keys[K_a]: self.camera_angle_y -= 2
-        if keys[K_d]: self.camera_angle_y += 2
-        if keys[K_q]: self.camera_angle_x += 1
-        if keys[K_e]: self.camera_angle_x -= 1
-        if keys[K_r]:
-            self.camera_distance = 70
-            self.camera_angle_x = 10
-            self.camera_angle_y = 0
-        
-        # Clamp camera values
-        self.camera_angle_x = max(-89, min(89, self.camera_angle_x))
-        self.camera_distance = max(5, min(100, self.camera_distance))
-
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        
-        glLoadIdentity()
-        gluLookAt(
-            self.camera_distance * sin(radians(self.camera_angle_y)),
-            self.camera_angle_x,
-            self.camera_distance * cos(radians(self.camera_angle_y)),
-            0, 10, 0,  # Look-at target (center of scene)
-            0, 1, 0    # Up direction
-        )
-                
-
-        self._draw_floors_3d()
-        
-        # ✅ Show Floor-Level Markers: 🚀 Preschedule + 👑 VIP
-        for floor_number in range(1, self.num_floors + 1):
-            y = (floor_number - 1) * self.floor_spacing
-
-            # 🚀 PRESCHEDULE marker
-            if self.preschedule_active and self.preschedule_event:
-                if self.preschedule_event["floor"] == floor_number:
-                    self._draw_text_3d("🚀", 0, y + 2, 6)
-
-            # 👑 VIP marker
-            for vip in self.vip_targets:
-                if vip['entry_floor'] == floor_number and not vip['picked_up']:
-                    self._draw_text_3d("👑", 0, y + 2, -6)
-                    
-            # ✅ Passenger Waiting Counts
-            up_count = len(self.state['passengers_waiting'][floor_number]['up'])
-            down_count = len(self.state['passengers_waiting'][floor_number]['down'])
-
-            # Always show Up and Down counts — even if 0
-            up_count = len(self.state['passengers_waiting'][floor_number]['up'])
-            down_count = len(self.state['passengers_waiting'][floor_number]['down'])
-
-            # Position on right side of building
-            up_text = f"Up: {up_count}"
-            down_text = f"Down: {down_count}"
-
-            # Display both on the same line with color
-            self._draw_text_3d(up_text, 11, y + 0.2, -5, color=(1.0, 1.0, 0.0))   # Yellow
-            self._draw_text_3d(down_text, 17, y + 0.2, -5, color=(0.0, 1.0, 1.0)) # Cyan
-
-
-        mode = self.detect_elevator_mode()
-        
-        # ✅ Draw simulation status text in 3D (top-left corner of scene)
-        total_energy = sum(self.energy_usage) if self.energy_usage else 0
-        total_wait_time = sum(self.wait_times) if self.wait_times else 0
-        total_service_time = sum(self.service_times) if self.service_times else 0
 
-        # 🏗️ Position above top floor and centered in front
-        top_y = self.num_floors * self.floor_spacing + 4 # +3 units above top floor
-        x_center = -6                                     # Adjust left/right centering
-        z_offset = 0                                      # Slightly in front (optional)
+        # ✅ Camera key controls (W/S zoom, A/D orbit, Q/E tilt, R reset)
+        self.renderer_3d.handle_keys()
+        self.renderer_3d.draw(capture_frame(self))
 
-        # # 🕒 Time
-        # self._draw_text_3d(f"Time: {self.current_time.strftime('%I:%M:%S %p')}", x_center, top_y, z_offset)
-
-        # # 🔁 Mode
-        # self._draw_text_3d(f"Mode: {mode}", x_center, top_y - 1.2, z_offset)
-        
-        self._draw_text_3d(f"Time: {self.current_time.strftime('%I:%M:%S %p')}", -6, top_y, 0)
-        self._draw_text_3d(f"Mode: {mode}", -6, top_y - 1.6, 0)
-
-        # ⏱️ Wait, Service, Energy
-        total_wait_time = sum(self.wait_times) if self.wait_times else 0
-        total_service_time = sum(self.service_times) if self.service_times else 0
-        total_energy = sum(self.energy_usage)
-
-        # self._draw_text_3d(
-        #     f"Wait: {total_wait_time:.0f}s | Service: {total_service_time:.0f}s | Energy: {total_energy}",
-        #     x_center, top_y - 2.4, z_offset
-        # )
-        self._draw_text_3d(
-            f"Wait: {total_wait_time:.0f}s | Service: {total_service_time:.0f}s | Energy: {total_energy}",
-            -6, top_y - 3.2, 0
-)
-
-
-        for i in range(self.num_elevators):
-            x = self.elevator_positions_3d[i]
-            elevator_height = 4
-            y = (self.state['elevator_positions'][i] - 1) * self.floor_spacing + (elevator_height / 2)
-
-            # ✅ Match color logic from render_2d()
-            if self.maintenance_active and i == self.maintenance_elevator_id:
-                color = (0.5, 0.5, 0.5)  # Gray
-            elif self.vip_elevator_id == i:
-                color = (1.0, 0.41, 0.71)  # VIP Pink (255,105,180)
-            elif self.preschedule_active and i in self.elevator_targets:
-                color = (0.0, 0.75, 1.0)  # Preschedule Blue (0,191,255)
-            elif self.state['elevator_load'][i] > 0:
-                color = (1.0, 0.0, 0.0)  # Red for passengers
-            elif self.state['elevator_positions'][i] != 1:
-                color = (0.0, 0.0, 1.0)  # Blue for moving
-            else:
-                color = (0.0, 1.0, 0.0)  # Green for idle
-
-            self._draw_elevator_3d(x, y, 0, color)
-            self._draw_text_3d(f"{self.state['elevator_load'][i]}/10", x - 1.5, y + 2.5, 0)
-
-
-        pygame.display.flip()
-        
-    def _draw_text_3d(self, text, x, y, z, font=None, color=(1.0, 1.0, 1.0)):
-
-
-        if font is None:
-            font = GLUT_BITMAP_HELVETICA_18
-
-        glColor3f(*color)
-        glRasterPos3f(x, y, z)
-        for ch in text:
-            glutBitmapCharacter(font, ord(ch))
-
-
-        
-    def _draw_floors_3d(self):
-        for i in range(self.num_floors):
-            y = i * self.floor_spacing
-
-            glColor3f(0.5, 0.5, 0.5)  # ✅ Explicitly set gray before drawing each slab
-
-            glBegin(GL_QUADS)
-            glVertex3f(-10, y, -10)
-            glVertex3f(10, y, -10)
-            glVertex3f(10, y, 10)
-            glVertex3f(-10, y, 10)
-            glEnd()
-
-            # ✅ Floor label — now stays white
-            # self._draw_text_3d(f"Floor {i+1}", -9, y + 0.2, 9)
-            self._draw_text_3d(f"Floor {i+1}", -20, y + 0.2, 0)  # Farther to the left
-
-
-
-            
-    def _draw_elevator_3d(self, x, y, z, color=(0, 1, 0)):
-
-        w, h, d = 3, 4, 3
-        w /= 2
-        h /= 2
-        d /= 2
-
-        glPushMatrix()
-        glTranslatef(x, y, z)
-        glColor3f(*color)
-        glBegin(GL_QUADS)
-
-        # Faces
-        faces = [
-            ((-w, -h, d), (w, -h, d), (w, h, d), (-w, h, d)),  # Front
-            ((-w, -h, -d), (-w, h, -d), (w, h, -d), (w, -h, -d)),  # Back
-            ((-w, -h, -d), (-w, -h, d), (-w, h, d), (-w, h, -d)),  # Left
-            ((w, -h, -d), (w, h, -d), (w, h, d), (w, -h, d)),  # Right
-            ((-w, h, -d), (-w, h, d), (w, h, d), (w, h, -d)),  # Top
-            ((-w, -h, -d), (w, -h, -d), (w, -h, d), (-w, -h, d))  # Bottom
-        ]
-        for face in faces:
-            for v in face:
-                glVertex3f(*v)
+    def open_state_block(self):
+        """Start publishing every step to shared memory; returns the block name viewers attach to."""
+        self.state_block = SharedStateBlock(self.num_floors, self.num_elevators, create=True)
+        self.state_block.write(capture_frame(self))
+        self.state_block.set_status(STATUS_RUNNING)
+        print(f"📡 Simulation state published to shared memory block {self.state_block.name}")
+        return self.state_block.name
 
-        glEnd()
-        glPopMatrix()
+    def start_recording(self, path):
+        """Record every following step to a run log (.npz) saved on close(); see export_video.py."""
+        self.run_recorder = RunRecorder(path, self.num_floors, self.num_elevators, self.time_per_step)
+        self.run_recorder.append(capture_frame(self))
+        print(f"⏺️ Recording run to {path}")
 
     def close(self):    
+        if self.run_recorder is not None:
+            self.run_recorder.save()
+            self.run_recorder = None
+        if self.state_block is not None:
+            self.state_block.set_status(STATUS_FINISHED)  # Viewers see this and exit
+            self.state_block.close()
+            self.state_block.unlink()
+            self.state_block = None
         pygame.quit()
@@ -0,0 +1,48 @@
+import numpy as np
+
+from export_video import frame_schedule, unwrap_clock
+
+
+class FakeRun:
+    """Just the parts of RunLog that frame_schedule reads."""
+
+    def __init__(self, clock, time_per_step=5):
+        self.clock = np.asarray(clock, dtype=np.float64)
+        self.time_per_step = time_per_step
+
+    def __len__(self):
+        return len(self.clock)
+
+
+def overnight_run():
+    """11:00 PM to 01:00 AM in 5 s steps."""
+    return FakeRun((23 * 3600 + np.arange(0, 2 * 3600, 5)) % 86400)
+
+
+def test_unwrap_clock_is_monotonic():
+    clock = unwrap_clock(overnight_run().clock)
+    assert np.all(np.diff(clock) == 5)
+    assert clock[-1] == 23 * 3600 + 2 * 3600 - 5
+
+
+def test_schedule_after_midnight():
+    run = overnight_run()
+    indices = frame_schedule(run, fps=1, speed=300, start="12:30:00 AM", end="12:40:00 AM")
+    assert run.clock[indices[0]] == 30 * 60
+    assert run.clock[indices[-1]] == 40 * 60
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_schedule_across_midnight():
+    run = overnight_run()
+    indices = frame_schedule(run, fps=1, speed=300, start="11:50:00 PM", end="12:10:00 AM")
+    assert run.clock[indices[0]] == 23 * 3600 + 50 * 60
+    assert run.clock[indices[-1]] == 10 * 60
+    assert len(indices) == 5  # 20 minutes at 5 sim minutes per frame, both ends included
+
+
+def test_schedule_same_day():
+    run = FakeRun(7 * 3600 + np.arange(0, 3600, 5))
+    indices = frame_schedule(run, fps=1, speed=60, start="07:10:00 AM", end="07:20:00 AM")
+    assert run.clock[indices[0]] == 7 * 3600 + 600
+    assert run.clock[indices[-1]] == 7 * 3600 + 1200
@@ -0,0 +1,51 @@
+from passenger_db import PassengerWriter, SQLiteBackend
+
+
+class FlakyBackend(SQLiteBackend):
+    """SQLite backend whose next `failures` inserts raise, like a MySQL server that went away."""
+
+    def __init__(self, path, failures):
+        super().__init__(path)
+        self.failures = failures
+
+    def insert_many(self, rows):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("server has gone away")
+        super().insert_many(rows)
+
+    def count(self):
+        return self.connect().execute("SELECT COUNT(*) FROM passengers").fetchone()[0]
+
+
+def passengers(first, count):
+    return [{"Passenger ID": i, "Time": "08:00:10 AM", "Floor": 1, "Direction (Up/Down)": "Up",
+             "Destination Floor": 3} for i in range(first, first + count)]
+
+
+def test_failed_flush_keeps_rows_for_retry(tmp_path):
+    backend = FlakyBackend(str(tmp_path / "passengers.db"), failures=2)
+    writer = PassengerWriter(backend)
+
+    writer.add(passengers(1, 3))
+    assert writer.flush() == 0
+    writer.add(passengers(4, 2))
+    assert writer.flush() == 0
+    assert writer.pending == 5 and writer.failed_flushes == 2
+
+    assert writer.flush() == 5
+    assert writer.pending == 0 and writer.failed_flushes == 0
+    assert backend.count() == 5
+
+
+def test_pending_rows_are_bounded(tmp_path):
+    backend = FlakyBackend(str(tmp_path / "passengers.db"), failures=1)
+    writer = PassengerWriter(backend, max_buffer=100, max_pending=4)
+
+    writer.add(passengers(1, 6))
+    writer.flush()
+    assert writer.pending == 4 and writer.rows_dropped == 2
+
+    writer.flush()
+    ids = [row[0] for row in backend.connect().execute("SELECT passenger_id FROM passengers ORDER BY id")]
+    assert ids == [3, 4, 5, 6]  # Oldest rows were the ones dropped
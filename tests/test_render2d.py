@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+from render2d import Renderer2D, synthetic_frames
+
+
+@pytest.fixture
+def display():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_full_redraw_after_window_recreated(display):
+    renderer = Renderer2D(6, 3)
+    frames = synthetic_frames(6, 3, 3)
+    renderer.draw(next(frames))
+    renderer.draw(next(frames))
+    assert renderer._drawn is not None
+
+    # The 3D view takes the window over, then the 2D view takes it back
+    pygame.display.set_mode((320, 240))
+    screen_area = renderer.size[0] * renderer.size[1]
+    before = renderer.dirty_area
+    renderer.draw(next(frames))
+    assert renderer.dirty_area - before == screen_area  # Whole screen repainted, not just changed slots
@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from render_state import RenderFrame
+from shared_state import SharedStateBlock
+
+ROOT = Path(__file__).resolve().parents[1]
+
+FRAME = RenderFrame(
+    time="07:08:35 PM", mode="RUSH", maintenance_elevator=None, vip_status="Waiting", preschedule_floor=3,
+    vip_floors=(2,), waiting_up=(1, 2, 3, 0, 0, 1), waiting_down=(0, 0, 4, 0, 0, 0), positions=(1, 4, 6),
+    loads=(0, 3, 10), car_status=(0, 2, 4), wait_time=12.5, service_time=3.0, energy=42, max_capacity=10,
+)
+
+ATTACH_AND_EXIT = """
+import sys
+sys.path.insert(0, {root!r})
+from shared_state import SharedStateBlock
+block = SharedStateBlock(name={name!r})
+seq, frame = block.read()
+assert seq == 1 and frame.mode == "RUSH", (seq, frame)
+block.close()
+"""
+
+
+def test_round_trip():
+    writer = SharedStateBlock(6, 3, create=True)
+    try:
+        writer.write(FRAME)
+        reader = SharedStateBlock(name=writer.name)
+        assert reader.read() == (1, FRAME)
+        reader.close()
+    finally:
+        writer.close()
+        writer.unlink()
+
+
+def test_viewer_in_separate_process_does_not_unlink_block():
+    writer = SharedStateBlock(6, 3, create=True)
+    writer.write(FRAME)
+    try:
+        # A separate interpreter has its own resource tracker (unlike spawned children)
+        code = ATTACH_AND_EXIT.format(root=str(ROOT), name=writer.name)
+        subprocess.run([sys.executable, "-c", code], check=True)
+        time.sleep(1.0)  # An attaching process's resource tracker unlinks shortly after it exits
+
+        assert os.path.exists(f"/dev/shm/{writer.name.lstrip('/')}") or sys.platform != "linux"
+
+        # The block must survive the viewer's exit, so a new viewer can still attach
+        again = SharedStateBlock(name=writer.name)
+        assert again.read()[1] == FRAME
+        again.close()
+    finally:
+        writer.close()
+        writer.unlink()
+
+
+def test_unlink_tolerates_missing_block():
+    writer = SharedStateBlock(6, 3, create=True)
+    writer.close()
+    writer.unlink()
+    writer.unlink()  # ElevatorEnv.close() must not fail if the block is already gone
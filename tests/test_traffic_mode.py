@@ -0,0 +1,51 @@
+from collections import deque
+
+import numpy as np
+
+from headless_sim import HeadlessElevatorEnv
+from traffic_mode import detect_traffic_mode
+
+
+class EmptyTrace:
+    seconds = floors = destinations = np.zeros(0, dtype=int)
+
+    def __len__(self):
+        return 0
+
+
+def waiting(counts):
+    """passengers_waiting with counts[floor - 1] people going up on each floor."""
+    return {floor: {'up': deque((f"P{floor}_{i}", 1) for i in range(count)), 'down': deque()}
+            for floor, count in enumerate(counts, start=1)}
+
+
+def test_thresholds():
+    idle = ([1, 1, 1], [0, 0, 0])
+    assert detect_traffic_mode(waiting([0] * 6), *idle, 10, total_requests=0) == "ENERGY-SAVING"
+    assert detect_traffic_mode(waiting([2, 2, 0, 0, 0, 0]), *idle, 10, total_requests=2) == "NORMAL"
+    assert detect_traffic_mode(waiting([11, 0, 0, 0, 0, 0]), *idle, 10, total_requests=1) == "RUSH"
+    assert detect_traffic_mode(waiting([0] * 6), [1, 1, 1], [8, 8, 8], 10, total_requests=0) == "RUSH"
+
+
+def test_request_thresholds():
+    idle = ([1, 1, 1], [0, 0, 0])
+    assert detect_traffic_mode(waiting([0] * 6), *idle, 10, total_requests=7) == "NORMAL"
+    assert detect_traffic_mode(waiting([0] * 6), *idle, 10, total_requests=31) == "RUSH"
+
+
+def test_headless_agrees_with_simulator_rule():
+    """Headless mode == the shared rule fed the simulator's request count (floors with an open request)."""
+    rng = np.random.default_rng(0)
+    env = HeadlessElevatorEnv(EmptyTrace(), num_floors=12, num_elevators=3)
+    seen = set()
+    for _ in range(500):
+        counts = rng.integers(0, 4, size=12) * (rng.random(12) < rng.random())
+        env.state['passengers_waiting'] = waiting(counts)
+        env.state['elevator_positions'][:] = rng.integers(1, 13, size=3)
+        env.state['elevator_load'] = list(rng.integers(0, 11, size=3) * (rng.random(3) < 0.5))
+        expected = detect_traffic_mode(env.state['passengers_waiting'], env.state['elevator_positions'],
+                                       env.state['elevator_load'], env.max_capacity,
+                                       total_requests=int(np.count_nonzero(counts)))
+        assert env.detect_traffic_mode() == expected
+        seen.add(expected)
+    assert seen == {"RUSH", "DYNAMIC-ASSIGN", "NORMAL", "ENERGY-SAVING"}
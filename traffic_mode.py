@@ -0,0 +1,65 @@
+# ✅ Traffic-mode thresholds shared by simulator.ElevatorEnv and headless_sim.HeadlessElevatorEnv
+FLOOR_RUSH_THRESHOLD = 10  # Any single floor with 10+ waiting passengers = RUSH
+
+RUSH_PASSENGER_THRESHOLD = 10  # 7+ passengers per floor = RUSH
+NORMAL_PASSENGER_THRESHOLD = 3  # 4-6 passengers per floor = NORMAL
+
+RUSH_REQUEST_THRESHOLD = 30  # More than 10 requests/min = RUSH
+NORMAL_REQUEST_THRESHOLD = 6  # 6-10 requests/min = NORMAL
+
+RUSH_OCCUPANCY_THRESHOLD = 70  # Elevators >70% full = RUSH
+NORMAL_OCCUPANCY_THRESHOLD = 40  # Elevators 40-70% full = NORMAL
+
+
+def detect_traffic_mode(passengers_waiting, elevator_positions, elevator_load, max_capacity, total_requests):
+    """RUSH, DYNAMIC-ASSIGN, NORMAL or ENERGY-SAVING from the waiting queues and car loads.
+
+    The traffic part of `simulator.ElevatorEnv.detect_elevator_mode`, after maintenance,
+    pre-schedule and VIP have been ruled out. `total_requests` is the number of floors with
+    an open request (the simulator's `passenger_wait_times`).
+    """
+    num_floors = len(passengers_waiting)
+    num_elevators = len(elevator_load)
+
+    # ✅ If **any single floor** has 10+ waiting passengers → RUSH
+    for floor in range(1, num_floors + 1):
+        if len(passengers_waiting[floor]['up']) + len(passengers_waiting[floor]['down']) > FLOOR_RUSH_THRESHOLD:
+            return "RUSH"
+
+    total_waiting = sum(len(v['up']) + len(v['down']) for v in passengers_waiting.values())
+    average_occupancy = (sum(elevator_load) / (num_elevators * max_capacity)) * 100
+
+    # ✅ Closest car to a waiting floor is **serving passengers**, but another is free → DYNAMIC-ASSIGN
+    for floor in range(1, num_floors + 1):
+        if passengers_waiting[floor]['up'] or passengers_waiting[floor]['down']:
+            closest_elevator = None
+            min_distance = float('inf')
+            for i in range(num_elevators):
+                distance = abs(floor - elevator_positions[i])
+                if elevator_load[i] > 0 and distance < min_distance:
+                    closest_elevator = i
+                    min_distance = distance
+
+            if closest_elevator is not None:
+                for i in range(num_elevators):
+                    if i != closest_elevator and elevator_load[i] == 0:
+                        return "DYNAMIC-ASSIGN"
+
+    # ✅ Rush Mode (High Demand)
+    if (
+        total_waiting > RUSH_PASSENGER_THRESHOLD or
+        total_requests > RUSH_REQUEST_THRESHOLD or
+        average_occupancy > RUSH_OCCUPANCY_THRESHOLD
+    ):
+        return "RUSH"  # 🔴 Rush Mode
+
+    # ✅ Normal Mode (Moderate Traffic)
+    if (
+        total_waiting > NORMAL_PASSENGER_THRESHOLD or
+        total_requests > NORMAL_REQUEST_THRESHOLD or
+        average_occupancy > NORMAL_OCCUPANCY_THRESHOLD
+    ):
+        return "NORMAL"  # 🟡 Normal Operation
+
+    # ✅ Energy-Saving Mode (Low Demand)
+    return "ENERGY-SAVING"  # 🟢 Energy-Saving Mode
@@ -0,0 +1,198 @@
+import argparse
+import numpy as np
+import pandas as pd
+
+# ✅ Passenger trace layout shared by the simulator, YOLO output and the comparing datasets
+TRACE_COLUMNS = ["Passenger ID", "Time", "Floor", "Direction (Up/Down)", "Destination Floor"]
+TIME_FORMAT = "%I:%M:%S %p"
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class Trace:
+    """Column-oriented passenger trace (arrival second of day, origin floor, destination floor)."""
+
+    def __init__(self, seconds, floors, destinations):
+        order = np.argsort(seconds, kind="stable")
+        self.seconds = np.asarray(seconds, dtype=np.int64)[order]
+        self.floors = np.asarray(floors, dtype=np.int64)[order]
+        self.destinations = np.asarray(destinations, dtype=np.int64)[order]
+
+    def __len__(self):
+        return len(self.seconds)
+
+    @classmethod
+    def from_frame(cls, df):
+        times = pd.to_datetime(df["Time"].astype(str).str.strip(), format=TIME_FORMAT)
+        seconds = times.dt.hour * 3600 + times.dt.minute * 60 + times.dt.second
+        return cls(seconds.to_numpy(), df["Floor"].to_numpy(), df["Destination Floor"].to_numpy())
+
+    @classmethod
+    def from_csv(cls, csv_file):
+        return cls.from_frame(pd.read_csv(csv_file))
+
+    @property
+    def num_floors(self):
+        if not len(self):
+            return 0
+        return int(max(self.floors.max(), self.destinations.max()))
+
+    @property
+    def duration(self):
+        """Length of the arrival window in seconds."""
+        if not len(self):
+            return 0
+        return int(self.seconds[-1] - self.seconds[0])
+
+    def rate_per_minute(self):
+        """Average arrival intensity in passengers/minute."""
+        return len(self) / max(self.duration / 60.0, 1.0)
+
+    def to_frame(self):
+        """Convert back to the CSV layout (IDs renumbered 1..n in time order)."""
+        times = pd.to_datetime(self.seconds % SECONDS_PER_DAY, unit="s").strftime(TIME_FORMAT)
+        directions = np.where(self.destinations > self.floors, "Up", "Down")
+        return pd.DataFrame({
+            "Passenger ID": np.arange(1, len(self) + 1),
+            "Time": times,
+            "Floor": self.floors,
+            "Direction (Up/Down)": directions,
+            "Destination Floor": self.destinations,
+        }, columns=TRACE_COLUMNS)
+
+    def to_csv(self, csv_file):
+        self.to_frame().to_csv(csv_file, index=False)
+
+
+def amplify(trace, factor, seed=None, jitter=0):
+    """Bootstrap-resample a trace to `factor` times as many passengers over the same window.
+
+    Rows are drawn with replacement, so the time-of-day and floor distributions are kept.
+    `jitter` spreads duplicated arrivals by up to ±jitter seconds (clipped to the window).
+    """
+    rng = np.random.default_rng(seed)
+    n_out = int(round(len(trace) * factor))
+    if not len(trace) or n_out <= 0:
+        return Trace([], [], [])
+
+    idx = rng.integers(0, len(trace), size=n_out)
+    seconds = trace.seconds[idx]
+    if jitter:
+        seconds = seconds + rng.integers(-jitter, jitter + 1, size=n_out)
+        seconds = np.clip(seconds, trace.seconds[0], trace.seconds[-1])
+
+    return Trace(seconds, trace.floors[idx], trace.destinations[idx])
+
+
+def time_shift(trace, offset_seconds=None, start=None):
+    """Shift a trace by `offset_seconds`, or so that its first arrival lands on `start` ("HH:MM:SS AM")."""
+    if start is not None:
+        start_dt = pd.to_datetime(start, format=TIME_FORMAT)
+        start_sec = start_dt.hour * 3600 + start_dt.minute * 60 + start_dt.second
+        offset_seconds = start_sec - (trace.seconds[0] if len(trace) else 0)
+    seconds = (trace.seconds + int(offset_seconds or 0)) % SECONDS_PER_DAY
+    return Trace(seconds, trace.floors, trace.destinations)
+
+
+def splice(traces, starts=None):
+    """Merge several traces into one (e.g. rush + normal + low windows into a whole day).
+
+    If `starts` is given, each trace is first time-shifted to begin at the matching start time.
+    """
+    if starts is not None:
+        traces = [time_shift(t, start=s) for t, s in zip(traces, starts)]
+    if not traces:
+        return Trace([], [], [])
+    return Trace(
+        np.concatenate([t.seconds for t in traces]),
+        np.concatenate([t.floors for t in traces]),
+        np.concatenate([t.destinations for t in traces]),
+    )
+
+
+def remap_floors(trace, num_floors, seed=None, mapping=None):
+    """Re-map floors onto a building with `num_floors` floors.
+
+    With no explicit `mapping` (old floor → new floor), each non-ground floor is stretched
+    over its proportional band of the taller building and the exact floor is drawn at random
+    inside that band. Floor 1 (the lobby) stays floor 1.
+    """
+    rng = np.random.default_rng(seed)
+
+    if mapping is not None:
+        lookup = np.arange(max(trace.num_floors, max(mapping)) + 1)
+        for old, new in mapping.items():
+            lookup[old] = new
+        floors = lookup[trace.floors]
+        destinations = lookup[trace.destinations]
+    else:
+        old_floors = max(trace.num_floors, 2)
+        scale = (num_floors - 1) / (old_floors - 1)
+
+        def stretch(values):
+            low = 2 + (values - 2) * scale
+            high = 2 + (values - 1) * scale
+            drawn = np.floor(low + rng.random(len(values)) * (high - low)).astype(np.int64)
+            return np.where(values == 1, 1, np.clip(drawn, 2, num_floors))
+
+        floors = stretch(trace.floors)
+        destinations = stretch(trace.destinations)
+
+    # ✅ Band collisions can leave origin == destination; push those one floor away
+    same = floors == destinations
+    destinations = np.where(same & (floors < num_floors), destinations + 1, destinations)
+    destinations = np.where(same & (floors >= num_floors), destinations - 1, destinations)
+
+    return Trace(trace.seconds, floors, destinations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scale, shift, splice and re-map passenger traces.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("amplify", help="Bootstrap-resample a trace to N times its volume")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("--factor", type=float, required=True)
+    p.add_argument("--seed", type=int, default=None)
+    p.add_argument("--jitter", type=int, default=0, help="± seconds spread for resampled arrivals")
+
+    p = sub.add_parser("shift", help="Time-shift a trace")
+    p.add_argument("input")
+    p.add_argument("output")
+    group = p.add_mutually_exclusive_group(required=True)
+    group.add_argument("--seconds", type=int)
+    group.add_argument("--start", help='New first arrival, e.g. "08:00:00 AM"')
+
+    p = sub.add_parser("splice", help="Merge several traces into one")
+    p.add_argument("output")
+    p.add_argument("inputs", nargs="+")
+    p.add_argument("--starts", nargs="+", help="Start time for each input, same order")
+
+    p = sub.add_parser("remap", help="Re-map floors for a taller building")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("--floors", type=int, required=True)
+    p.add_argument("--seed", type=int, default=None)
+
+    args = parser.parse_args()
+
+    if args.command == "amplify":
+        out = amplify(Trace.from_csv(args.input), args.factor, seed=args.seed, jitter=args.jitter)
+        out.to_csv(args.output)
+    elif args.command == "shift":
+        out = time_shift(Trace.from_csv(args.input), offset_seconds=args.seconds, start=args.start)
+        out.to_csv(args.output)
+    elif args.command == "splice":
+        if args.starts and len(args.starts) != len(args.inputs):
+            parser.error("--starts needs one time per input")
+        out = splice([Trace.from_csv(f) for f in args.inputs], starts=args.starts)
+        out.to_csv(args.output)
+    else:
+        out = remap_floors(Trace.from_csv(args.input), args.floors, seed=args.seed)
+        out.to_csv(args.output)
+
+    print(f"📁 {len(out)} passengers written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualTable(tk.Frame):
+    """Table that only draws the rows currently on screen.
+
+    Rows live in memory as tuples of strings; `view` is an index list into them after the
+    current search filter and sort. A fixed pool of canvas text items (one per visible
+    row and column) is reused on every scroll, so opening or scrolling a panel with
+    thousands of records costs the same as one with a screenful. Typing in the search box
+    narrows the previous result when the query only grew (incremental search); clicking a
+    header sorts by that column, clicking again reverses it.
+    """
+
+    def __init__(self, master, columns, widths=None, row_height=22, placeholder="No data."):
+        super().__init__(master)
+        self.columns = list(columns)
+        self.widths = list(widths or [120] * len(self.columns))
+        self.row_height = row_height
+        self.placeholder = placeholder
+        self._max_chars = [max(3, width // 7) for width in self.widths]  # Clip text to its column
+
+        self.rows = []
+        self.view = []
+        self._search_text = []  # Lower-cased row text for searching
+        self._sort_keys = {}  # column -> cached sort keys
+        self.sort_column = None
+        self.sort_reverse = False
+        self.query = ""
+        self.top = 0  # Index into `view` of the first visible row
+
+        search_frame = tk.Frame(self)
+        search_frame.pack(fill=tk.X)
+        tk.Label(search_frame, text="🔍").pack(side=tk.LEFT, padx=(5, 0))
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *_: self.search(self.search_var.get()))
+        tk.Entry(search_frame, textvariable=self.search_var).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=2)
+        self.count_label = tk.Label(search_frame, text="0 rows")
+        self.count_label.pack(side=tk.RIGHT, padx=5)
+
+        self.header = tk.Canvas(self, height=row_height, highlightthickness=0, bg="#e6e6e6")
+        self.header.pack(fill=tk.X)
+        body = tk.Frame(self)
+        body.pack(fill=tk.BOTH, expand=True)
+        self.canvas = tk.Canvas(body, highlightthickness=0, bg="white")
+        self.scrollbar = ttk.Scrollbar(body, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._pool = []  # [(stripe rectangle, [text item per column])] for each visible row slot
+        self._draw_header()
+        self.canvas.bind("<Configure>", lambda event: self._layout())
+        for widget in (self.canvas, self.header):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Button-4>", lambda event: self.scroll(-3))
+            widget.bind("<Button-5>", lambda event: self.scroll(3))
+
+    # ✅ Data
+    def set_rows(self, rows):
+        """Replace the data; keeps the current search and sort."""
+        self.rows = [tuple("" if value is None else str(value) for value in row) for row in rows]
+        self._search_text = [" ".join(row).lower() for row in self.rows]
+        self._sort_keys = {}
+        self.view = list(range(len(self.rows)))
+        query, self.query = self.query, ""
+        self.search(query)
+
+    def search(self, query):
+        query = query.strip().lower()
+        narrowing = bool(self.query) and query.startswith(self.query)
+        candidates = self.view if narrowing else range(len(self.rows))  # Query only grew: filter the current result
+        self.view = [i for i in candidates if query in self._search_text[i]] if query else list(candidates)
+        if not narrowing and self.sort_column is not None:
+            self._apply_sort()  # A narrowed view is already in sort order
+        self.query = query
+        self.top = 0
+        self.refresh()
+
+    def sort_by(self, column):
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column, self.sort_reverse = column, False
+        self._apply_sort()
+        self._draw_header()
+        self.refresh()
+
+    def _apply_sort(self):
+        keys = self._sort_keys.get(self.sort_column)
+        if keys is None:
+            keys = self._sort_keys[self.sort_column] = [_sort_key(row[self.sort_column]) for row in self.rows]
+        self.view.sort(key=keys.__getitem__, reverse=self.sort_reverse)
+
+    # ✅ Scrolling
+    @property
+    def visible_rows(self):
+        return max(1, self.canvas.winfo_height() // self.row_height)
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.view))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.top += int(args[1]) * step
+        self.refresh()
+
+    def scroll(self, rows):
+        self.top += rows
+        self.refresh()
+
+    def _on_wheel(self, event):
+        self.scroll(-3 if event.delta > 0 else 3)
+
+    # ✅ Drawing (only the visible slice)
+    def _draw_header(self):
+        self.header.delete("all")
+        x = 0
+        for column, (name, width) in enumerate(zip(self.columns, self.widths)):
+            arrow = (" ▼" if self.sort_reverse else " ▲") if column == self.sort_column else ""
+            tag = f"col{column}"
+            self.header.create_text(x + 5, self.row_height // 2, text=name + arrow, anchor="w",
+                                    font=("Arial", 9, "bold"), tags=tag)
+            self.header.tag_bind(tag, "<Button-1>", lambda event, c=column: self.sort_by(c))
+            x += width
+
+    def _layout(self):
+        """Grow the pool of row items to fill the canvas height (called on resize)."""
+        total_width = sum(self.widths)
+        while len(self._pool) < self.visible_rows + 1:
+            y = len(self._pool) * self.row_height
+            stripe = self.canvas.create_rectangle(0, y, total_width, y + self.row_height, width=0, fill="")
+            texts, x = [], 0
+            for width in self.widths:
+                texts.append(self.canvas.create_text(x + 5, y + self.row_height // 2, anchor="w", text=""))
+                x += width
+            self._pool.append((stripe, texts))
+        self.refresh()
+
+    def refresh(self):
+        self.top = max(0, min(self.top, len(self.view) - self.visible_rows))
+        self.canvas.delete("placeholder")
+        for slot, (stripe, texts) in enumerate(self._pool):
+            index = self.top + slot
+            if index < len(self.view):
+                row = self.rows[self.view[index]]
+                self.canvas.itemconfig(stripe, fill="#f5f5f5" if index % 2 else "")
+                for item, value, limit in zip(texts, row, self._max_chars):
+                    self.canvas.itemconfig(item, text=value if len(value) <= limit else value[:limit - 1] + "…")
+            else:
+                self.canvas.itemconfig(stripe, fill="")
+                for item in texts:
+                    self.canvas.itemconfig(item, text="")
+        if not self.view:
+            self.canvas.create_text(10, 10, anchor="nw", text=self.placeholder, tags="placeholder")
+
+        self.count_label.config(text=f"{len(self.view)} of {len(self.rows)} rows")
+        if self.view:
+            first = self.top / len(self.view)
+            self.scrollbar.set(first, min(1.0, first + self.visible_rows / len(self.view)))
+        else:
+            self.scrollbar.set(0, 1)
+
+
+def _sort_key(value):
+    """Numbers sort numerically and before text; everything else case-insensitively."""
+    try:
+        return (0, float(value), "")
+    except ValueError:
+        return (1, 0.0, value.lower())